@@ -0,0 +1,63 @@
+"""
+Measure the throughput of the pooled dumps/loads helpers as the number of threads grows. On a free-threaded build of
+CPython the throughput is expected to scale with the number of threads, while on a regular build it is bounded by the
+GIL.
+
+Usage: python benchmarks/concurrent_pickling.py [--operations N] [--max-threads N]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+import kelpickle
+
+
+@dataclass
+class Record:
+    identifier: int
+    name: str
+    created: datetime
+    tags: tuple[str, ...]
+
+
+_PAYLOAD = [Record(i, f"record {i}", datetime(2020, 1, 1, 10, i % 60), ("a", "b")) for i in range(50)]
+
+
+def _round_trips(count: int) -> None:
+    for _ in range(count):
+        kelpickle.loads(kelpickle.dumps(_PAYLOAD))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=2000, help="Total round trips for every thread count")
+    parser.add_argument("--max-threads", type=int, default=8)
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled else 'disabled'}")
+
+    # Warm up, so lazily registered strategies are already imported.
+    _round_trips(1)
+
+    single_thread_throughput = None
+    threads = 1
+    while threads <= args.max_threads:
+        operations_per_thread = args.operations // threads
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(_round_trips, [operations_per_thread] * threads))
+        throughput = operations_per_thread * threads / (time.perf_counter() - start)
+
+        single_thread_throughput = single_thread_throughput or throughput
+        print(f"{threads:>3} threads: {throughput:10.1f} round trips/s  (x{throughput / single_thread_throughput:.2f})")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Measure the cold-start cost of kelpickle: Importing it in a fresh interpreter, and pickling the first instance.
+
+Usage: python benchmarks/import_time.py [--runs N]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+_BASELINE_STATEMENT = "pass"
+_STATEMENTS = {
+    "import kelpickle": "import kelpickle",
+    "import kelpickle.kelpickling": "import kelpickle.kelpickling",
+    "first pickle": "from kelpickle.kelpickling import Pickler; Pickler().pickle({'a': [1, 2.5, 'b']})",
+}
+
+_TIMED_SCRIPT = """
+import time
+_start = time.perf_counter()
+{statement}
+print(time.perf_counter() - _start)
+"""
+
+
+def _measure(statement: str, runs: int) -> list[float]:
+    durations = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMED_SCRIPT.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        durations.append(float(output))
+
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="Number of fresh interpreters to measure for each case")
+    args = parser.parse_args()
+
+    baseline = statistics.median(_measure(_BASELINE_STATEMENT, args.runs))
+    for description, statement in _STATEMENTS.items():
+        durations = _measure(statement, args.runs)
+        print(f"{description:<32} median {(statistics.median(durations) - baseline) * 1000:7.2f}ms   "
+              f"min {(min(durations) - baseline) * 1000:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Compare the dedicated strategies of stdlib types against the generic reduce path of the default strategy, which they
+replaced. Every payload is a list of instances of a single type, which is pickled and unpickled by both.
+
+Usage: python benchmarks/stdlib_strategies.py [--count N] [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from collections import Counter, OrderedDict, defaultdict, deque
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from pathlib import PurePosixPath
+from typing import Any, Callable, NamedTuple
+from uuid import UUID
+
+from kelpickle.kelpickling import Pickler, Unpickler
+from kelpickle.strategies.base_strategy import BaseStrategy, get_strategy_named
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+_PAYLOAD_FACTORIES: dict[str, Callable[[int], Any]] = {
+    "enum": lambda i: Color.RED if i % 2 else Color.GREEN,
+    "namedtuple": lambda i: Point(i, -i),
+    "deque": lambda i: deque([i, i + 1, i + 2]),
+    "OrderedDict": lambda i: OrderedDict(a=i, b=i + 1),
+    "defaultdict": lambda i: defaultdict(list, a=[i]),
+    "Counter": lambda i: Counter(a=i, b=1),
+    "frozenset": lambda i: frozenset({i, i + 1}),
+    "Decimal": lambda i: Decimal(i) / 7,
+    "UUID": lambda i: UUID(int=i),
+    "complex": lambda i: complex(i, -i),
+    "Fraction": lambda i: Fraction(i, 7),
+    "PurePath": lambda i: PurePosixPath(f"/data/{i}.json"),
+}
+
+
+class GenericPickler(Pickler):
+    """
+    Reduces every instance of the benchmarked types by the default strategy, the way it was done before they got
+    strategies of their own.
+    """
+    def _use_strategy(self, instance: Any, *, strategy: BaseStrategy) -> Any:
+        if strategy.name != "default" and type(instance) in _BENCHMARKED_TYPES:
+            strategy = get_strategy_named("default")
+
+        return super()._use_strategy(instance, strategy=strategy)
+
+    def _batching_allowed(self) -> bool:
+        # Batches are handed to the strategy of their type directly, without going through _use_strategy.
+        return False
+
+
+_BENCHMARKED_TYPES = frozenset(type(factory(1)) for factory in _PAYLOAD_FACTORIES.values())
+
+
+def _best_time(function: Callable[[], Any], repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="Instances within every payload")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'type':<12} {'generic (ms)':>13} {'dedicated (ms)':>15} {'speedup':>8} {'size ratio':>11}")
+    for name, factory in _PAYLOAD_FACTORIES.items():
+        payload = [factory(i) for i in range(1, args.count + 1)]
+        results = {}
+        for pickler in (GenericPickler(), Pickler()):
+            unpickler = Unpickler()
+            try:
+                serialized = pickler.pickle(payload)
+            except Exception as e:
+                # Ex. Enum members, whose classes have a metaclass the generic path can't reduce
+                print(f"{name:<12} {'unsupported':>13} ({type(e).__name__}: {e})")
+                break
+            is_correct = unpickler.unpickle(serialized) == payload
+            duration = _best_time(lambda: unpickler.unpickle(pickler.pickle(payload)), args.repeat)
+            results[type(pickler)] = (duration, len(serialized), is_correct)
+        else:
+            generic_duration, generic_size, is_generic_correct = results[GenericPickler]
+            dedicated_duration, dedicated_size, is_dedicated_correct = results[Pickler]
+            assert is_dedicated_correct, f"The dedicated strategy of {name} restored a different payload"
+            # Ex. deques, whose members the generic path reduces as an iterator (which is restored empty)
+            remark = "" if is_generic_correct else "  (the generic path restores a different payload)"
+            print(f"{name:<12} {generic_duration * 1000:>13.2f} {dedicated_duration * 1000:>15.2f} "
+                  f"{generic_duration / dedicated_duration:>7.2f}x {dedicated_size / generic_size:>11.2f}{remark}")
+
+
+if __name__ == "__main__":
+    main()
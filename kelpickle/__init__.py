@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# The public API is imported upon first access, so "import kelpickle" stays cheap for those who don't need it yet.
+_LAZY_ATTRIBUTES = {
+    "Pickler": "kelpickle.kelpickling",
+    "Unpickler": "kelpickle.kelpickling",
+    "PicklingPool": "kelpickle.kelpickling",
+    "dumps": "kelpickle.kelpickling",
+    "loads": "kelpickle.kelpickling",
+    "dump": "kelpickle.kelpickling",
+    "load": "kelpickle.kelpickling",
+    "dump_iter": "kelpickle.kelpickling",
+    "iter_load": "kelpickle.kelpickling",
+    "deepcopy": "kelpickle.kelpickling",
+    "fingerprint": "kelpickle.kelpickling",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    return getattr(importlib.import_module(module_name), name)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import gc
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Iterator
+
+# The collector is paused for as long as any bulk load is in progress (in any thread), and resumed by the last one.
+_pause_lock = threading.Lock()
+_pause_depth = 0
+_was_enabled = False
+
+
+@dataclass(slots=True)
+class BulkLoadReport:
+    # The number of collections of each generation that would have been triggered by the allocations made while the
+    # collector was paused. Estimated from the allocation count, by the current thresholds of the collector.
+    avoided_collections: tuple[int, int, int] = (0, 0, 0)
+    # The number of objects that were moved to the permanent generation by gc.freeze
+    frozen_objects: int = 0
+    seconds: float = 0.0
+    # Whether the collector was actually paused (it's not, if it was already disabled beforehand)
+    paused: bool = False
+
+
+@contextmanager
+def paused_gc() -> Iterator[bool]:
+    """
+    Pause the garbage collector for the duration of the context. Safe to be nested, and to be used by multiple threads
+    at once.
+
+    :return: Whether the collector was enabled when the first of the nested contexts was entered
+    """
+    global _pause_depth, _was_enabled
+
+    with _pause_lock:
+        if _pause_depth == 0:
+            _was_enabled = gc.isenabled()
+            gc.disable()
+        _pause_depth += 1
+        was_enabled = _was_enabled
+
+    try:
+        yield was_enabled
+    finally:
+        with _pause_lock:
+            _pause_depth -= 1
+            if _pause_depth == 0 and _was_enabled:
+                gc.enable()
+
+
+def _estimate_avoided_collections(allocations: int) -> tuple[int, int, int]:
+    threshold0, threshold1, threshold2 = gc.get_threshold()
+    if threshold0 <= 0:
+        return 0, 0, 0
+
+    young_collections = allocations // threshold0
+    middle_collections = young_collections // threshold1 if threshold1 > 0 else 0
+    old_collections = middle_collections // threshold2 if threshold2 > 0 else 0
+    return young_collections - middle_collections, middle_collections - old_collections, old_collections
+
+
+@contextmanager
+def bulk_load(*, freeze: bool = False) -> Iterator[BulkLoadReport]:
+    """
+    Pause the garbage collector while restoring a large graph. Restoring millions of containers would otherwise
+    trigger many collections, each of them traversing the (mostly new and alive) graph all over again.
+
+    :param freeze: Whether to move every tracked object (including the restored graph) to the permanent generation
+                   once done, so the collector will never touch them. Useful before forking, since collections would
+                   write to the memory of the frozen objects, which breaks its copy-on-write sharing between workers.
+    :return: A report, which is filled once the context is exited
+    """
+    report = BulkLoadReport()
+    start_time = perf_counter()
+    start_count = gc.get_count()[0]
+    with paused_gc() as was_enabled:
+        try:
+            yield report
+        finally:
+            # The allocation count is only reset by collections, so it keeps growing while the collector is paused.
+            if was_enabled:
+                report.avoided_collections = _estimate_avoided_collections(max(gc.get_count()[0] - start_count, 0))
+            report.paused = was_enabled
+            if freeze:
+                frozen_objects = gc.get_freeze_count()
+                gc.freeze()
+                report.frozen_objects = gc.get_freeze_count() - frozen_objects
+            report.seconds = perf_counter() - start_time
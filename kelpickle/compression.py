@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterable, Optional, Protocol
+
+from kelpickle.errors import UnpicklingError
+
+# Compressed outputs start with a small frame header: The magic bytes, the version of the frame format and the
+# identifier of the codec that was used. Uncompressed outputs have no header at all, so they are identical to the
+# result of Pickler.pickle.
+FRAME_MAGIC = b"KELP"
+FRAME_VERSION = 1
+FRAME_HEADER_SIZE = len(FRAME_MAGIC) + 2
+
+# Chunks of the serialized output are gathered up to this size before being compressed and written.
+WRITE_BUFFER_SIZE = 64 * 1024
+READ_BUFFER_SIZE = 64 * 1024
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _Decompressor(Protocol):
+    def decompress(self, data: bytes, max_length: int = ..., /) -> bytes: ...
+
+
+@dataclass(frozen=True, slots=True)
+class Codec:
+    name: str
+    identifier: int
+    # The codec modules are only imported once they are used, since some of them are relatively slow to import.
+    module_name: str
+    compressor_name: str
+    decompressor_name: str
+
+    def create_compressor(self) -> _Compressor:
+        compressor_factory: Callable[[], _Compressor] = getattr(importlib.import_module(self.module_name),
+                                                                self.compressor_name)
+        return compressor_factory()
+
+    def create_decompressor(self) -> _Decompressor:
+        decompressor_factory: Callable[[], _Decompressor] = getattr(importlib.import_module(self.module_name),
+                                                                    self.decompressor_name)
+        return decompressor_factory()
+
+
+_CODECS = (
+    Codec("zlib", 1, "zlib", "compressobj", "decompressobj"),
+    Codec("lzma", 2, "lzma", "LZMACompressor", "LZMADecompressor"),
+    Codec("bz2", 3, "bz2", "BZ2Compressor", "BZ2Decompressor"),
+)
+_NAME_TO_CODEC = {codec.name: codec for codec in _CODECS}
+_IDENTIFIER_TO_CODEC = {codec.identifier: codec for codec in _CODECS}
+
+
+def get_codec(name: str) -> Codec:
+    try:
+        return _NAME_TO_CODEC[name]
+    except KeyError:
+        raise ValueError(f"Unsupported compression {name}. Supported compressions are "
+                         f"{', '.join(_NAME_TO_CODEC)}") from None
+
+
+def _buffered(chunks: Iterable[str]) -> Iterable[bytes]:
+    buffer: list[str] = []
+    buffer_size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffer_size += len(chunk)
+        if buffer_size >= WRITE_BUFFER_SIZE:
+            yield "".join(buffer).encode()
+            buffer.clear()
+            buffer_size = 0
+
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def write_document(chunks: Iterable[str], fp: BinaryIO, *, compression: Optional[str] = None) -> None:
+    """
+    Write the chunks of a serialized document to the given file as they are produced.
+
+    :param chunks: The chunks of the serialized document
+    :param fp: A binary file to write to
+    :param compression: The name of the codec to compress the document with (zlib, lzma or bz2). If not given, the
+                        document is written as is.
+    """
+    if compression is None:
+        for data in _buffered(chunks):
+            fp.write(data)
+        return
+
+    codec = get_codec(compression)
+    compressor = codec.create_compressor()
+    fp.write(FRAME_MAGIC + bytes((FRAME_VERSION, codec.identifier)))
+    for data in _buffered(chunks):
+        compressed_data = compressor.compress(data)
+        if compressed_data:
+            fp.write(compressed_data)
+
+    fp.write(compressor.flush())
+
+
+def read_document(fp: BinaryIO, *, max_size: Optional[int] = None) -> bytes:
+    """
+    Read a serialized document that was written by "write_document". The codec is detected automatically.
+
+    :param fp: A binary file to read from
+    :param max_size: The maximal size of the (decompressed) document to read. Reading stops once it's exceeded, so a
+                     larger document is returned truncated to max_size + 1 bytes (for the caller to reject), and is
+                     never decompressed in full.
+    :return: The (decompressed) serialized document
+    """
+    header = fp.read(FRAME_HEADER_SIZE)
+    if not header.startswith(FRAME_MAGIC):
+        if max_size is None:
+            return header + fp.read()
+
+        return header + fp.read(max(max_size + 1 - len(header), 0))
+
+    version, codec_identifier = header[len(FRAME_MAGIC):]
+    if version != FRAME_VERSION:
+        raise UnpicklingError(f"Unsupported frame version {version}")
+
+    try:
+        codec = _IDENTIFIER_TO_CODEC[codec_identifier]
+    except KeyError:
+        raise UnpicklingError(f"Unsupported codec identifier {codec_identifier}") from None
+
+    decompressor = codec.create_decompressor()
+    decompressed_chunks = []
+    decompressed_size = 0
+    while compressed_data := fp.read(READ_BUFFER_SIZE):
+        if max_size is None:
+            decompressed_chunks.append(decompressor.decompress(compressed_data))
+            continue
+
+        # Decompressors only stop short of the maximal length once they have consumed all of their input, so every
+        # chunk is fully decompressed unless the maximal size is exceeded.
+        decompressed_data = decompressor.decompress(compressed_data, max_size + 1 - decompressed_size)
+        decompressed_chunks.append(decompressed_data)
+        decompressed_size += len(decompressed_data)
+        if decompressed_size > max_size:
+            break
+
+    return b"".join(decompressed_chunks)
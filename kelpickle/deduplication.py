@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import fields
+from datetime import date, datetime, time, timedelta
+from types import NoneType
+from typing import Any, Hashable, Optional
+
+# Types whose equal instances are interchangeable (Their equality takes no more than their type and value into account)
+_VALUE_TYPES = frozenset({str, bytes, int, bool, NoneType, date, timedelta})
+_TIMES_WITH_TZINFO = frozenset({datetime, time})
+_IMMUTABLE_CONTAINERS = frozenset({tuple, frozenset})
+
+
+def _is_plain_frozen_dataclass(instance_type: type) -> bool:
+    dataclass_params = getattr(instance_type, "__dataclass_params__", None)
+    if dataclass_params is None or not dataclass_params.frozen:
+        return False
+
+    if (
+            getattr(instance_type, "__reduce_ex__") is not object.__reduce_ex__ or
+            getattr(instance_type, "__reduce__") is not object.__reduce__
+    ):
+        return False
+
+    # Dataclasses with slots generate their own __getstate__ which returns the values of their fields.
+    return getattr(instance_type, "__getstate__") is object.__getstate__ or "__slots__" in vars(instance_type)
+
+
+def is_deduplication_candidate(instance: Any, *, min_length: int) -> bool:
+    """
+    Check whether an instance is worth being replaced by a reference if an equal instance was already encountered.
+
+    :param instance: The instance to check
+    :param min_length: The minimal length of strings and bytes to be considered.
+    :return: Whether the instance should be deduplicated.
+    """
+    instance_type = type(instance)
+    if instance_type is str or instance_type is bytes:
+        return len(instance) >= min_length
+
+    return (
+        instance_type in _IMMUTABLE_CONTAINERS or
+        instance_type in _TIMES_WITH_TZINFO or
+        instance_type is date or
+        instance_type is timedelta or
+        _is_plain_frozen_dataclass(instance_type)
+    )
+
+
+def structural_key(instance: Any) -> Optional[Hashable]:
+    """
+    Generate a key that is equal for two instances only if their serialized form is interchangeable. Such instances
+    must be deeply immutable, so changes to one of them can never be observed through the other.
+
+    :param instance: The instance to generate a key for
+    :return: The structural key of the instance, or None if it's not deeply immutable
+    """
+    return _structural_key(instance, set())
+
+
+def _structural_key(instance: Any, in_progress: set[int]) -> Optional[Hashable]:
+    instance_type = type(instance)
+    if instance_type in _VALUE_TYPES:
+        return instance_type, instance
+
+    if instance_type is float:
+        # Floats are compared by their representation, so 0.0 and -0.0 (as well as different NaNs) are told apart.
+        return float, repr(instance)
+
+    if instance_type in _TIMES_WITH_TZINFO:
+        # Aware instances are equal to instances from other timezones at the same moment. We only consider them
+        # interchangeable if they share the same tzinfo instance.
+        return instance_type, instance.replace(tzinfo=None), instance.fold, id(instance.tzinfo)
+
+    instance_id = id(instance)
+    if instance_id in in_progress:
+        # Deeply immutable instances cannot contain themselves unless someone went out of their way to do so.
+        return None
+
+    in_progress.add(instance_id)
+    try:
+        if instance_type in _IMMUTABLE_CONTAINERS:
+            members = []
+            for member in instance:
+                member_key = _structural_key(member, in_progress)
+                if member_key is None:
+                    return None
+                members.append(member_key)
+
+            return instance_type, tuple(members) if instance_type is tuple else frozenset(members)
+
+        if _is_plain_frozen_dataclass(instance_type):
+            field_names = [field.name for field in fields(instance_type)]
+            if hasattr(instance, "__dict__") and list(instance.__dict__) != field_names:
+                return None
+
+            members = []
+            for field_name in field_names:
+                member_key = _structural_key(getattr(instance, field_name), in_progress)
+                if member_key is None:
+                    return None
+                members.append(member_key)
+
+            return instance_type, tuple(members)
+
+        return None
+    finally:
+        in_progress.discard(instance_id)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+from hashlib import blake2b
+from typing import Any, Iterable, Optional, TypeAlias
+
+from kelpickle.common import Jsonable, SAVED_WORDS_PREFIX
+from kelpickle.errors import UnpicklingError
+
+DELTA_KEY = f"{SAVED_WORDS_PREFIX}delta"
+
+# Every node of a serialized document is located by its JSON pointer (RFC 6901). Each pointer is mapped to the digest
+# of the node's entire subtree, and for containers also to the digest of their "shape" (their keys or their length).
+# Two containers with the same shape have their children located by the same pointers, so they can be compared one
+# child at a time.
+# Only the size of a delta (and the cost of applying it) is proportional to the amount of change. Python objects do not
+# track their own modifications, so finding what has changed still requires reducing and fingerprinting the entire
+# state, which costs about as much as a regular pickling (without the encoding of the unchanged parts).
+Fingerprint: TypeAlias = tuple[bytes, Optional[bytes]]
+Fingerprints: TypeAlias = dict[str, Fingerprint]
+Patch: TypeAlias = tuple[str, Jsonable]
+
+_DIGEST_SIZE = 16
+_encode_native = json.JSONEncoder().encode
+
+
+def _escape_pointer_token(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_pointer_token(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _length_prefixed(value: str) -> bytes:
+    encoded = value.encode("utf-8", "surrogatepass")
+    return len(encoded).to_bytes(8, "little") + encoded
+
+
+def fingerprint_document(document: Jsonable) -> Fingerprints:
+    """
+    Calculate the fingerprints of every node within the given document.
+
+    :param document: A reduced instance (or a parsed serialized instance)
+    :return: The fingerprints of the document's nodes
+    """
+    fingerprints: Fingerprints = {}
+
+    def fingerprint(node: Jsonable, pointer: str) -> bytes:
+        if isinstance(node, dict):
+            digest = blake2b(b"{", digest_size=_DIGEST_SIZE)
+            shape = blake2b(b"{", digest_size=_DIGEST_SIZE)
+            for key, value in node.items():
+                encoded_key = _length_prefixed(key)
+                shape.update(encoded_key)
+                digest.update(encoded_key)
+                digest.update(fingerprint(value, f"{pointer}/{_escape_pointer_token(key)}"))
+
+            fingerprints[pointer] = (digest.digest(), shape.digest())
+
+        elif isinstance(node, list):
+            digest = blake2b(b"[", digest_size=_DIGEST_SIZE)
+            for i, member in enumerate(node):
+                digest.update(fingerprint(member, f"{pointer}/{i}"))
+
+            fingerprints[pointer] = (digest.digest(), len(node).to_bytes(8, "little"))
+
+        else:
+            fingerprints[pointer] = (blake2b(_encode_native(node).encode(), digest_size=_DIGEST_SIZE).digest(), None)
+
+        return fingerprints[pointer][0]
+
+    fingerprint(document, "")
+    return fingerprints
+
+
+def diff_document(document: Jsonable, fingerprints: Fingerprints, previous_fingerprints: Fingerprints) -> list[Patch]:
+    """
+    Find the minimal subtrees of the given document that have changed since the previous document.
+
+    :param document: The current document
+    :param fingerprints: The fingerprints of the current document
+    :param previous_fingerprints: The fingerprints of the previous document
+    :return: Patches that transform the previous document into the current one, once applied in order
+    """
+    patches: list[Patch] = []
+
+    def diff(node: Jsonable, pointer: str) -> None:
+        digest, shape = fingerprints[pointer]
+        previous_fingerprint = previous_fingerprints.get(pointer)
+        if previous_fingerprint is None:
+            patches.append((pointer, node))
+            return
+
+        previous_digest, previous_shape = previous_fingerprint
+        if previous_digest == digest:
+            return
+
+        if shape is None or previous_shape != shape:
+            patches.append((pointer, node))
+            return
+
+        if isinstance(node, dict):
+            for key, value in node.items():
+                diff(value, f"{pointer}/{_escape_pointer_token(key)}")
+        else:
+            assert isinstance(node, list), f"Only containers have a shape. Received {type(node)}"
+            for i, member in enumerate(node):
+                diff(member, f"{pointer}/{i}")
+
+    diff(document, "")
+    return patches
+
+
+def apply_patches(document: Jsonable, patches: Iterable[Patch]) -> Jsonable:
+    """
+    Apply the given patches on the given document. The document is modified in place.
+
+    :param document: A parsed serialized instance
+    :param patches: The patches to apply
+    :return: The patched document (It is a different object only if the root itself was replaced)
+    """
+    for pointer, fragment in patches:
+        if not pointer:
+            document = fragment
+            continue
+
+        *parent_tokens, last_token = pointer[1:].split("/")
+        # Any node along the way may be of the wrong type, in which case indexing it fails (and is reported below).
+        parent: Any = document
+        try:
+            for token in parent_tokens:
+                parent = parent[int(token)] if isinstance(parent, list) else parent[_unescape_pointer_token(token)]
+
+            if isinstance(parent, list):
+                parent[int(last_token)] = fragment
+            else:
+                parent[_unescape_pointer_token(last_token)] = fragment
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise UnpicklingError(f"Cannot apply patch on {pointer}. The patched document does not match the "
+                                  f"document the delta was created against.") from e
+
+    return document
+
+
+def apply_delta(document: Jsonable, delta: Jsonable) -> Jsonable:
+    """
+    Apply a parsed delta (the output of Pickler.pickle_delta) on the given document.
+
+    :param document: A parsed serialized instance
+    :param delta: A parsed delta
+    :return: The patched document
+    """
+    if not isinstance(delta, dict) or DELTA_KEY not in delta:
+        raise UnpicklingError("The given delta is not a valid kelpickle delta")
+
+    return apply_patches(document, delta[DELTA_KEY])
+
+
+def squash_deltas(serialized_base: str, serialized_deltas: Iterable[str]) -> str:
+    """
+    Apply a chain of deltas on a base document, resulting in a new base document. Useful for compacting long chains.
+
+    :param serialized_base: The output of Pickler.pickle/Pickler.pickle_snapshot
+    :param serialized_deltas: Outputs of Pickler.pickle_delta, in the order they were created
+    :return: The serialized document the deltas describe
+    """
+    document = json.loads(serialized_base)
+    for serialized_delta in serialized_deltas:
+        document = apply_delta(document, json.loads(serialized_delta))
+
+    return json.dumps(document)
@@ -6,7 +6,7 @@ class PicklingError(Exception):
     Error that occurs during the pickling process
     """
     def __init__(self, message: str, *, instance: Any):
-        super(f"During the pickling process of {instance}. The following error has occurred: {message}")
+        super().__init__(f"During the pickling process of {instance}. The following error has occurred: {message}")
         self.instance = instance
 
 
@@ -47,6 +47,29 @@ class RestorationReferenceCollision(RestoreError):
     """
 
 
+class SessionOutOfSync(UnpicklingError):
+    """
+    Error that occurs when a session message cannot be restored since the receiving side missed some of the messages
+    that preceded it. The sending side has to be reset in order to resynchronize the session.
+    """
+
+
+class ResourceLimitExceeded(Exception):
+    """
+    Error that occurs when the pickling (or unpickling) process exceeds one of its resource limits
+    """
+    def __init__(self, message: str, *, limit: str, path: str):
+        super().__init__(f"{message} (At {path})")
+        self.limit = limit
+        self.path = path
+
+
+class TranscodingError(ValueError):
+    """
+    Error that occurs when an instance cannot be converted between kelpickle's format and pickle's format
+    """
+
+
 class StrategyConflictError(ValueError):
     pass
 
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+from kelpickle.common import Jsonable
+
+# The default separators of json.dumps
+_ITEM_SEPARATOR_SIZE = len(", ")
+_KEY_SEPARATOR_SIZE = len(": ")
+_CONSTANT_SIZES = {True: len("true"), False: len("false"), None: len("null")}
+
+
+@dataclass(slots=True)
+class PickleEstimate:
+    # The estimated size of the serialized instance, in bytes
+    size: int = 0
+    # The number of instances that were reduced in full (references are not included)
+    nodes: int = 0
+    nodes_per_type: Counter[type] = field(default_factory=Counter)
+    nodes_per_strategy: Counter[str] = field(default_factory=Counter)
+    # The number of instances that were reduced by reference
+    references: int = 0
+    # The time it took to reduce the instance (which is most of the time it takes to pickle it)
+    seconds: float = 0.0
+
+    def count(self, instance_type: type, strategy_name: str) -> None:
+        self.nodes += 1
+        self.nodes_per_type[instance_type] += 1
+        self.nodes_per_strategy[strategy_name] += 1
+
+
+def _string_size(value: str) -> int:
+    if value.isascii():
+        # Only quotes, backslashes and control characters are escaped. Control characters are rare enough to be ignored.
+        return len(value) + 2 + value.count('"') + value.count("\\")
+
+    return len(encode_basestring_ascii(value))
+
+
+def estimate_encoded_size(document: Jsonable) -> int:
+    """
+    Estimate the size of the given document once it's encoded by json.dumps, without encoding it. Strings are measured
+    exactly, except for their control characters.
+
+    :param document: A reduced instance
+    :return: The estimated size, in bytes
+    """
+    size = 0
+    pending_nodes: list[Any] = [document]
+    while pending_nodes:
+        node = pending_nodes.pop()
+        node_type = type(node)
+        if node_type is str:
+            size += _string_size(node)
+        elif node_type is dict:
+            size += 2 + max(len(node) - 1, 0) * _ITEM_SEPARATOR_SIZE + len(node) * _KEY_SEPARATOR_SIZE
+            for key in node:
+                size += _string_size(key)
+            pending_nodes.extend(node.values())
+        elif node_type is list:
+            size += 2 + max(len(node) - 1, 0) * _ITEM_SEPARATOR_SIZE
+            pending_nodes.extend(node)
+        elif node_type is int:
+            size += len(str(node))
+        elif node_type is float:
+            size += len(repr(node))
+        else:
+            size += _CONSTANT_SIZES[node]
+
+    return size
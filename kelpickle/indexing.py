@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from typing import Any, BinaryIO, Mapping, TypeAlias
+
+from kelpickle.common import Jsonable
+
+# Mapping between the reference of a reduced instance and the location of its serialized form within the output.
+# Each location is an (offset, length) pair measured in bytes. Since the output is always ASCII, these are also valid
+# offsets within the serialized string. Instances that were written as references to other instances are mapped to the
+# reference of the instance they point to instead. The index is JSON serializable, so it can be stored right next to
+# the output.
+PickleIndex: TypeAlias = dict[str, tuple[int, int] | str]
+IndexSource: TypeAlias = str | bytes | BinaryIO
+
+# The separators used by json.dumps when no indentation is requested. We use the same ones so the indexed output is
+# identical to the output of a regular pickling.
+_ITEM_SEPARATOR = ", "
+_KEY_SEPARATOR = ": "
+
+_encode_native = json.JSONEncoder().encode
+
+
+def encode_with_index(
+        reduced_instance: Jsonable,
+        references_by_id: dict[int, str],
+        referencing_paths: Mapping[str, str]
+) -> tuple[str, PickleIndex]:
+    """
+    Serialize the given reduced instance to JSON while recording the location of every reduced container that has a
+    known reference.
+
+    :param reduced_instance: The result of the pickler's "reduce" function
+    :param references_by_id: Mapping between the id of reduced containers (dicts and lists) and their reference
+    :param referencing_paths: Mapping between the paths that were reduced by reference and the references they hold
+    :return: The serialized instance and the index of its fragments
+    """
+    chunks: list[str] = []
+    index: PickleIndex = dict(referencing_paths)
+    offset = 0
+
+    def write(chunk: str) -> None:
+        nonlocal offset
+        chunks.append(chunk)
+        offset += len(chunk)
+
+    def encode(node: Jsonable) -> None:
+        start = offset
+        if isinstance(node, dict):
+            write("{")
+            for i, (key, value) in enumerate(node.items()):
+                if i:
+                    write(_ITEM_SEPARATOR)
+                write(_encode_native(key))
+                write(_KEY_SEPARATOR)
+                encode(value)
+            write("}")
+
+        elif isinstance(node, list):
+            write("[")
+            for i, member in enumerate(node):
+                if i:
+                    write(_ITEM_SEPARATOR)
+                encode(member)
+            write("]")
+
+        else:
+            write(_encode_native(node))
+            return
+
+        reference = references_by_id.get(id(node))
+        if reference is not None:
+            index[reference] = (start, offset - start)
+
+    encode(reduced_instance)
+    return "".join(chunks), index
+
+
+def read_fragment(source: IndexSource, index: PickleIndex, reference: str) -> Any:
+    """
+    Read and parse only the serialized fragment of the given reference.
+
+    :param source: The serialized output. May be a string, bytes or a seekable binary file.
+    :param index: The index that was generated alongside the serialized output
+    :param reference: The reference of the wanted fragment
+    :return: The parsed (but not yet restored) fragment
+    """
+    try:
+        location = index[reference]
+    except KeyError as e:
+        raise KeyError(f"Reference {reference} does not appear in the given index") from e
+
+    if isinstance(location, str):
+        raise KeyError(f"Reference {reference} was written as a reference to {location}")
+
+    offset, length = location
+
+    if isinstance(source, (str, bytes)):
+        fragment = source[offset:offset + length]
+    else:
+        source.seek(offset)
+        fragment = source.read(length)
+
+    return json.loads(fragment)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass(frozen=True, slots=True)
+class InterningStatistics:
+    hits: int
+    misses: int
+    size: int
+    # The total size of the restored strings that were replaced by an equal interned string (and could therefore be
+    # freed)
+    saved_bytes: int
+
+
+class StringInterner:
+    """
+    A bounded table of strings, used by unpicklers to share a single instance between equal restored strings (Ex.
+    enum-like values that are repeated across many instances). Unlike sys.intern, strings are only kept alive by the
+    table itself, so the table can be discarded once it's no longer needed.
+
+    Once the table is full, new strings are no longer added (but the ones within it are still shared). Interners are
+    not thread safe, so they should only be shared between unpicklers of the same thread.
+    """
+    def __init__(self, max_size: int = 65536, max_length: int = 64) -> None:
+        """
+        :param max_size: The maximal number of strings within the table
+        :param max_length: The maximal length of the interned strings. Longer strings are rarely repeated.
+        """
+        self.max_size = max_size
+        self.max_length = max_length
+        self.__table: dict[str, str] = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__saved_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.__table)
+
+    def intern(self, value: str) -> str:
+        """
+        :param value: A restored string
+        :return: An equal string from the table (or the given string, if there is none)
+        """
+        if len(value) > self.max_length:
+            return value
+
+        interned_value = self.__table.get(value)
+        if interned_value is None:
+            self.__misses += 1
+            if len(self.__table) < self.max_size:
+                self.__table[value] = value
+            return value
+
+        if interned_value is not value:
+            self.__hits += 1
+            self.__saved_bytes += sys.getsizeof(value)
+
+        return interned_value
+
+    def intern_many(self, values: Iterable[str]) -> list[str]:
+        intern = self.intern
+        return [intern(value) for value in values]
+
+    def clear(self) -> None:
+        self.__table.clear()
+
+    def statistics(self) -> InterningStatistics:
+        return InterningStatistics(
+            hits=self.__hits,
+            misses=self.__misses,
+            size=len(self.__table),
+            saved_bytes=self.__saved_bytes,
+        )
@@ -1,35 +1,167 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Optional, TypedDict
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, BinaryIO, Callable, Hashable, Iterable, Iterator, Mapping, Optional, Sequence, TypeAlias, \
+    TypedDict, TypeVar, TYPE_CHECKING, cast
 from pickle import DEFAULT_PROTOCOL
 
-from bidict import bidict
+from kelpickle.common import Json, Jsonable, STRATEGY_KEY, SAVED_WORDS_PREFIX
+from kelpickle.errors import RestorationReferenceCollision, ReductionReferenceCollision, RestoreError, UnpicklingError
+from kelpickle.strategies.base_strategy import BaseStrategy, get_pickling_strategy_for, get_unpickling_strategy_for, \
+    get_strategy_named, register_lazy_strategy
 
-
-from kelpickle.common import Jsonable, STRATEGY_KEY
-from kelpickle.errors import RestorationReferenceCollision, ReductionReferenceCollision
-from kelpickle.strategies.base_strategy import BaseStrategy, get_pickling_strategy_for, get_unpickling_strategy_for, get_strategy_named
+if TYPE_CHECKING:
+    # The modules of optional features are only imported once their feature is used (Ex. the delta module, since
+    # hashlib is relatively slow to import).
+    from kelpickle.bulk_load import BulkLoadReport
+    from kelpickle.delta import Fingerprints
+    from kelpickle.estimation import PickleEstimate
+    from kelpickle.indexing import PickleIndex, IndexSource
+    from kelpickle.interning import StringInterner
+    from kelpickle.limits import ResourceLimits
+    from kelpickle.reduction_cache import ReductionCache
 
 ROOT_RELATIVE_KEY = "$ROOT"
+REFERENCE_SEPARATOR = "->"
 REFERENCE_STRATEGY_NAME = "reference"
+PERSISTENT_STRATEGY_NAME = "persistent"
+
+# Documents of picklers that mark their referenced instances are wrapped by an envelope that lists the references.
+REFERENCED_KEY = f"{SAVED_WORDS_PREFIX}referenced"
+ENVELOPE_VALUE_KEY = "value"
+
+_streaming_encoder = json.JSONEncoder()
+# JSON documents never contain raw newlines (they are escaped within strings), so they can separate records.
+RECORD_SEPARATOR = b"\n"
+_canonical_encoder = json.JSONEncoder(separators=(",", ":"))
+_JSON_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+MemberT = TypeVar("MemberT")
+
+# Serialized instances may be given as text, or as its UTF-8 encoding.
+SerializedInstance: TypeAlias = str | bytes | bytearray | memoryview
+
+# Runs of sibling instances that are shorter than this are not worth being handed to their strategy at once.
+MIN_BATCH_SIZE = 4
 
 
 class ReferenceReductionResult(TypedDict):
     reference: str
 
 
+class PersistentReductionResult(TypedDict):
+    key: Jsonable
+
+
+# Marks that no target was given (None is a valid target)
+_NO_TARGET = object()
+
+
 class Pickler:
     PICKLE_PROTOCOL = DEFAULT_PROTOCOL
 
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            *,
+            deduplicate_immutables: bool = False,
+            min_deduplicated_length: int = 64,
+            reduction_cache: Optional[ReductionCache] = None,
+            persistent_id: Optional[Callable[[Any], Optional[Jsonable]]] = None,
+            canonical: bool = False,
+            mark_referenced: bool = False,
+            limits: Optional[ResourceLimits] = None,
+            pack_numeric_lists: bool = False,
+    ) -> None:
+        """
+        :param deduplicate_immutables: Whether to reduce deeply immutable instances (strings, bytes, tuples, frozensets,
+                                       dates, times and frozen dataclasses) by reference if an equal instance was
+                                       already encountered. Restored instances will be shared as well.
+        :param min_deduplicated_length: The minimal length of strings and bytes to be deduplicated. Shorter ones are
+                                        cheaper to be written as they are than as references.
+        :param reduction_cache: A cache of the reduced form of deeply immutable instances (tuples, frozensets, bytes,
+                                dates, times and frozen dataclasses that hold only immutable values) to be reused
+                                across calls. It may be shared between picklers. Only reductions that contain no
+                                references are cached, so members of cached instances that were already encountered
+                                elsewhere are written in full.
+        :param persistent_id: A function that is called with every instance before it is reduced. If it returns
+                              anything but None, the instance is stored out of band, and only the returned key is
+                              written in its place. The Unpickler would need a matching persistent_load function.
+        :param canonical: Whether equal instances should always be serialized identically. The members of sets and the
+                          items of dicts are written in a deterministic order (so restored dicts are ordered by their
+                          keys), and -0.0 is written as 0.0. A reduction cache should not be shared between canonical
+                          and non-canonical picklers.
+        :param mark_referenced: Whether to list the references that are used within the output alongside it, so the
+                                Unpickler will only record the instances that are actually referenced. Saves time and
+                                memory when restoring graphs that are mostly unshared.
+        :param limits: Limits on the resources each call may consume. A call that exceeds them is aborted with
+                       ResourceLimitExceeded. The size of the output is estimated by the size of the strings and bytes
+                       within it while reducing, and verified once it's encoded.
+        :param pack_numeric_lists: Whether to write lists whose items are all ints (of 64 bits) or all floats as a
+                                   single base64 buffer of packed items, instead of a JSON list. Much faster to reduce
+                                   and restore (and usually smaller), at the expense of readability. Not used along
+                                   with features that have to inspect every item (Ex. canonical mode).
+        """
         self.current_path: list[str] = []
         # Mapping between the id of encountered instances and their references in case we wish to reuse.
-        self.__instances_references: bidict[int, str] = bidict({})
+        self.__instances_references: dict[int, str] = {}
+        self.__references_instances: dict[str, int] = {}
+        # The recorded instances are kept alive, so their ids will not be reused while they are referenced. Otherwise,
+        # temporary instances (Ex. the arguments of a reduce result) would be mistaken for the instances that follow.
+        self.__recorded_instances: dict[int, Any] = {}
+        # Mapping between the structural keys of encountered immutable instances and their references.
+        self.__structural_references: Optional[dict[Hashable, str]] = {} if deduplicate_immutables else None
+        self.__min_deduplicated_length = min_deduplicated_length
         self.__default_strategy: BaseStrategy = get_pickling_strategy_for(object)
+        # Mapping between the id of reduced containers and their references, and between the paths that were reduced
+        # by reference and the references they hold. Only used while generating an index.
+        self.__indexed_references: Optional[dict[int, str]] = None
+        self.__indexed_referencing_paths: dict[str, str] = {}
+        self.__reduction_cache = reduction_cache
+        # The references that were recorded alongside their instances, in order to tell which members were recorded
+        # while reducing a cacheable instance. Only collected while such reductions are in progress, so the collected
+        # instances are released as soon as the outermost of them is done.
+        self.__recorded_references: list[tuple[str, Any]] = []
+        self.__cacheable_reductions_depth = 0
+        # The number of references that were emitted so far. Used to tell whether a reduction is self-contained.
+        self.__emitted_references = 0
+        self.__persistent_id = persistent_id
+        self.__canonical = canonical
+        # The ids of the members whose canonical sort key is being generated. Shared with the picklers that generate
+        # the sort keys of nested members, so members that (indirectly) contain themselves do not recurse forever.
+        self.__members_in_ordering: set[int] = set()
+        # The references that were used within the output. Only collected when marking referenced instances.
+        self.__referenced_paths: Optional[set[str]] = set() if mark_referenced else None
+        self.__budget = None
+        if limits:
+            from kelpickle.limits import ResourceBudget
+
+            self.__budget = ResourceBudget(limits, current_reference=self.generate_current_reference)
+        # The estimate that is being collected. Only used while estimating.
+        self.__estimate: Optional[PickleEstimate] = None
+        self.__pack_numeric_lists = pack_numeric_lists
+
+    @property
+    def canonical(self) -> bool:
+        return self.__canonical
+
+    @property
+    def packs_numeric_lists(self) -> bool:
+        return self.__pack_numeric_lists
 
     def _clean_cache(self) -> None:
+        if self.__budget is not None:
+            self.__budget.reset()
         self.__instances_references.clear()
+        self.__references_instances.clear()
+        self.__recorded_instances.clear()
+        self.__recorded_references.clear()
+        if self.__structural_references is not None:
+            self.__structural_references.clear()
+        if self.__referenced_paths is not None:
+            self.__referenced_paths.clear()
 
     def generate_current_reference(self) -> str:
         """
@@ -38,7 +170,7 @@ class Pickler:
         :return: The unique reference
         """
         # TODO: Change the logic so parts of the path that contain the separator will somehow be escaped
-        return "->".join(self.current_path)
+        return REFERENCE_SEPARATOR.join(self.current_path)
 
     def pickle(self, instance: Any) -> str:
         """
@@ -47,10 +179,209 @@ class Pickler:
         :param instance: The instance to serialize
         :return: The serialized instance
         """
-        result = json.dumps(self.reduce(instance, relative_key=ROOT_RELATIVE_KEY))
-        self._clean_cache()
+        try:
+            serialized_instance = json.dumps(self._reduce_root(instance))
+            if self.__budget is not None:
+                self.__check_output_size(len(serialized_instance))
+
+            return serialized_instance
+        finally:
+            self._clean_cache()
+
+    def __check_output_size(self, size: int) -> None:
+        assert self.__budget is not None, "Output size is only checked while limits are enforced"
+        # Replaces the estimation that was made while reducing, with the actual size.
+        self.__budget.reset()
+        self.current_path.append(ROOT_RELATIVE_KEY)
+        try:
+            self.__budget.consume_bytes(size)
+        finally:
+            self.current_path.pop()
+
+    def __limited_chunks(self, chunks: Iterable[str]) -> Iterator[str]:
+        output_size = 0
+        for chunk in chunks:
+            output_size += len(chunk)
+            self.__check_output_size(output_size)
+            yield chunk
+
+    def reduce_document(self, instance: Any) -> Jsonable:
+        """
+        Reduce the given python object to the document "pickle" would have encoded, without encoding it.
+
+        :param instance: The instance to reduce
+        :return: The reduced instance
+        """
+        try:
+            return self._reduce_root(instance)
+        finally:
+            self._clean_cache()
+
+    def _reduce_root(self, instance: Any) -> Jsonable:
+        reduced_instance = self.reduce(instance, relative_key=ROOT_RELATIVE_KEY)
+        if self.__referenced_paths is None:
+            return reduced_instance
+
+        return {REFERENCED_KEY: sorted(self.__referenced_paths), ENVELOPE_VALUE_KEY: reduced_instance}
+
+    def estimate(self, instance: Any) -> PickleEstimate:
+        """
+        Estimate the size of the serialized form of the given python object, and count the instances within it. The
+        instance is reduced exactly as "pickle" would have reduced it, but the result is measured instead of being
+        encoded.
+
+        :param instance: The instance to estimate
+        :return: The estimate
+        """
+        from kelpickle.estimation import PickleEstimate, estimate_encoded_size
+
+        estimate = PickleEstimate()
+        self.__estimate = estimate
+        emitted_references = self.__emitted_references
+        start_time = perf_counter()
+        try:
+            reduced_instance = self._reduce_root(instance)
+        finally:
+            self.__estimate = None
+            self._clean_cache()
+
+        estimate.seconds = perf_counter() - start_time
+        estimate.references = self.__emitted_references - emitted_references
+        estimate.size = estimate_encoded_size(reduced_instance)
+        return estimate
+
+    def fingerprint(self, instance: Any, *, algorithm: str = "sha256") -> str:
+        """
+        Calculate a digest of the serialized form of the given python object. The serialized form is fed to the hash
+        incrementally as it is encoded, so it is never held in memory as a whole. Only digests of canonical picklers
+        are guaranteed to be equal for equal instances.
+
+        :param instance: The instance to fingerprint
+        :param algorithm: The name of a hashlib algorithm
+        :return: The hex digest
+        """
+        import hashlib
+
+        digest = hashlib.new(algorithm)
+        for chunk in _canonical_encoder.iterencode(self.reduce_document(instance)):
+            digest.update(chunk.encode("utf-8", "surrogatepass"))
+
+        return digest.hexdigest()
+
+    def dump(self, instance: Any, fp: BinaryIO, *, compression: Optional[str] = None) -> None:
+        """
+        serialize the given python object into a binary file. The output is written (and compressed) incrementally as
+        it is encoded, so the entire serialized string never has to be held in memory.
+
+        :param instance: The instance to serialize
+        :param fp: The binary file to write to
+        :param compression: The name of the codec to compress the output with (zlib, lzma or bz2). Compressed outputs
+                            are framed with a small header which allows Unpickler.load to detect the codec.
+        """
+        from kelpickle.compression import write_document
+
+        try:
+            reduced_instance = self._reduce_root(instance)
+            chunks = _streaming_encoder.iterencode(reduced_instance)
+            if self.__budget is not None:
+                chunks = self.__limited_chunks(chunks)
+            write_document(chunks, fp, compression=compression)
+        finally:
+            self._clean_cache()
+
+    def dump_iter(self, instances: Iterable[Any], fp: BinaryIO, *, share_references: bool = False) -> int:
+        """
+        serialize the given python objects into a binary file as a stream of newline delimited records. Instances are
+        consumed (and written) one at a time, so the iterable may be a generator of unbounded length.
+
+        :param instances: The instances to serialize
+        :param fp: The binary file to write to
+        :param share_references: Whether records may reference instances of previous records. Otherwise, every record
+                                 is the same document "pickle" would have returned for its instance. Notice the
+                                 instances of previous records are kept alive (along with their references) until the
+                                 stream ends.
+        :return: The number of written records
+        """
+        records_count = 0
+        try:
+            for records_count, instance in enumerate(instances, 1):
+                if share_references:
+                    # Every record is reduced under its own root, so the references of different records never collide.
+                    # Records are not wrapped with the referenced paths, since later records may reference any of them.
+                    reduced_instance = self.reduce(instance, relative_key=_record_root_key(records_count - 1))
+                else:
+                    reduced_instance = self._reduce_root(instance)
+                    self._clean_cache()
+
+                for chunk in _streaming_encoder.iterencode(reduced_instance):
+                    fp.write(chunk.encode("utf-8", "surrogatepass"))
+                fp.write(RECORD_SEPARATOR)
+        finally:
+            self._clean_cache()
+
+        return records_count
+
+    def pickle_with_index(self, instance: Any) -> tuple[str, PickleIndex]:
+        """
+        serialize the given python object, and generate an index of the locations of its fragments within the output.
+        The output is identical to the one returned by "pickle", unless "mark_referenced" is set (The referenced paths
+        are not listed alongside the output, since the index already covers them). Resource limits are enforced while
+        reducing, but the size of the output is not checked once it's encoded. The index may be stored alongside the
+        output and later be passed to Unpickler.unpickle_path in order to restore only a part of the serialized
+        instance.
+
+        :param instance: The instance to serialize
+        :return: The serialized instance and its index
+        """
+        from kelpickle.indexing import encode_with_index
+
+        self.__indexed_references = {}
+        try:
+            reduced_instance = self.reduce(instance, relative_key=ROOT_RELATIVE_KEY)
+            return encode_with_index(reduced_instance, self.__indexed_references, self.__indexed_referencing_paths)
+        finally:
+            self.__indexed_references = None
+            self.__indexed_referencing_paths.clear()
+            self._clean_cache()
+
+    def pickle_snapshot(self, instance: Any) -> tuple[str, Fingerprints]:
+        """
+        serialize the given python object, and calculate the fingerprints of its serialized form. The fingerprints may
+        later be passed to "pickle_delta" in order to serialize only what has changed since this snapshot.
+
+        :param instance: The instance to serialize
+        :return: The serialized instance and its fingerprints
+        """
+        from kelpickle.delta import fingerprint_document
+
+        try:
+            reduced_instance = self.reduce(instance, relative_key=ROOT_RELATIVE_KEY)
+        finally:
+            self._clean_cache()
+
+        return json.dumps(reduced_instance), fingerprint_document(reduced_instance)
+
+    def pickle_delta(self, instance: Any, previous_fingerprints: Fingerprints) -> tuple[str, Fingerprints]:
+        """
+        serialize only the parts of the given python object that have changed since a previous snapshot (or delta).
+        The result can be applied on top of the previous document using Unpickler.unpickle_with_deltas.
+        The size of the delta is proportional to the amount of change, but its cost is not: The entire instance is
+        reduced and fingerprinted in order to find what has changed.
+
+        :param instance: The instance to serialize
+        :param previous_fingerprints: The fingerprints of the previous snapshot (or delta)
+        :return: The serialized delta and the fingerprints of the current state of the instance
+        """
+        from kelpickle.delta import DELTA_KEY, fingerprint_document, diff_document
+
+        try:
+            reduced_instance = self.reduce(instance, relative_key=ROOT_RELATIVE_KEY)
+        finally:
+            self._clean_cache()
 
-        return result
+        fingerprints = fingerprint_document(reduced_instance)
+        patches = diff_document(reduced_instance, fingerprints, previous_fingerprints)
+        return json.dumps({DELTA_KEY: patches}), fingerprints
 
     def reduce(self, instance: Any, *, relative_key: str) -> Jsonable:
         """
@@ -74,18 +405,152 @@ class Pickler:
         """
         self.current_path.append(relative_key)
         try:
+            if self.__budget is not None:
+                self.__consume_budget(instance)
+
+            if self.__persistent_id is not None:
+                persistent_key = self.__persistent_id(instance)
+                if persistent_key is not None:
+                    # The instance is stored out of band, so only its key is written.
+                    return {"key": persistent_key, STRATEGY_KEY: PERSISTENT_STRATEGY_NAME}
+
             instance_type = instance.__class__
+            if self.__canonical and instance_type is float and instance == 0.0:
+                # Normalizes -0.0, which is equal to 0.0
+                instance = 0.0
+
             strategy = get_pickling_strategy_for(instance_type)
             if strategy.auto_generate_reduction_references:
                 reduced_reference = self.attempt_reduce_by_reference(instance)
                 if reduced_reference is not None:
                     # Instance was encountered previously and was therefore able to be reduced by reference.
-                    return reduced_reference
+                    return self.__emit_reference(reduced_reference)
+
+            if self.__structural_references is not None:
+                reduced_reference = self.attempt_reduce_by_structure(instance)
+                if reduced_reference is not None:
+                    # An equal immutable instance was encountered previously.
+                    return self.__emit_reference(reduced_reference)
+
+            if self.__estimate is not None:
+                self.__estimate.count(instance_type, strategy.name)
 
-            return self._use_strategy(instance, strategy=strategy)
+            if self.__reduction_cache is not None and self.__indexed_references is None:
+                from kelpickle.reduction_cache import is_cacheable_type
+
+                if is_cacheable_type(instance_type):
+                    return self._use_reduction_cache(instance, strategy=strategy,
+                                                     reduction_cache=self.__reduction_cache)
+
+            reduced_instance = self._use_strategy(instance, strategy=strategy)
+            if self.__indexed_references is not None and isinstance(reduced_instance, (dict, list)):
+                self.__indexed_references[id(reduced_instance)] = self.generate_current_reference()
+
+            return reduced_instance
         finally:
             self.current_path.pop()
 
+    def __consume_budget(self, instance: Any) -> None:
+        assert self.__budget is not None, "Budget is only consumed while limits are enforced"
+        depth = len(self.current_path)
+        if depth == 1:
+            # Every root (Ex. every message of a session) gets its own budget.
+            self.__budget.reset()
+
+        self.__budget.visit(depth)
+        instance_type = instance.__class__
+        if instance_type is str:
+            self.__budget.consume_bytes(len(instance))
+        elif instance_type is bytes:
+            # Bytes are written in base64
+            self.__budget.consume_bytes(len(instance) * 4 // 3)
+
+    def reduce_many(self, instances: Sequence[Any]) -> list[Jsonable]:
+        """
+        Reduce the members of a sequence, as if each of them was reduced by "reduce" with its index as the relative key.
+        Runs of members of the same type are handed to their strategy's "reduce_many" at once, which saves most of the
+        per-member overhead of long homogeneous sequences.
+
+        :param instances: The members to reduce
+        :return: The reduced members
+        """
+        if not self._batching_allowed():
+            return [self.reduce(member, relative_key=str(i)) for i, member in enumerate(instances)]
+
+        reduced_instances: list[Jsonable] = []
+        members_count = len(instances)
+        run_start = 0
+        while run_start < members_count:
+            run_type = type(instances[run_start])
+            run_end = run_start + 1
+            while run_end < members_count and type(instances[run_end]) is run_type:
+                run_end += 1
+
+            strategy = get_pickling_strategy_for(run_type)
+            if run_end - run_start >= MIN_BATCH_SIZE and strategy.batches_reductions:
+                reduced_instances.extend(self.__reduce_run(instances[run_start:run_end], run_start, strategy))
+            else:
+                reduced_instances.extend(
+                    self.reduce(instances[i], relative_key=str(i)) for i in range(run_start, run_end)
+                )
+
+            run_start = run_end
+
+        return reduced_instances
+
+    def _batching_allowed(self) -> bool:
+        """
+        Whether instances may be reduced in batches. Features that have to inspect every single instance disable it.
+        """
+        return (
+            self.__persistent_id is None and
+            self.__structural_references is None and
+            self.__reduction_cache is None and
+            self.__indexed_references is None and
+            self.__budget is None and
+            self.__estimate is None and
+            not self.__canonical
+        )
+
+    def __reduce_run(self, run: Sequence[Any], run_start: int, strategy: BaseStrategy) -> list[Jsonable]:
+        relative_keys = [str(i) for i in range(run_start, run_start + len(run))]
+        if not strategy.auto_generate_reduction_references:
+            reduced_run = strategy.reduce_many(instances=run, relative_keys=relative_keys, pickler=self)
+        else:
+            reduced_run = [None] * len(run)
+            pending_positions = []
+            for position, (member, relative_key) in enumerate(zip(run, relative_keys)):
+                self.current_path.append(relative_key)
+                try:
+                    reduced_reference = self.attempt_reduce_by_reference(member)
+                finally:
+                    self.current_path.pop()
+
+                if reduced_reference is None:
+                    pending_positions.append(position)
+                else:
+                    reduced_run[position] = self.__emit_reference(reduced_reference)
+
+            reduced_pending = strategy.reduce_many(
+                instances=[run[position] for position in pending_positions],
+                relative_keys=[relative_keys[position] for position in pending_positions],
+                pickler=self
+            )
+            for position, reduced_instance in zip(pending_positions, reduced_pending):
+                reduced_run[position] = reduced_instance
+
+            if not strategy.is_json_native:
+                for reduced_instance in reduced_pending:
+                    reduced_instance[STRATEGY_KEY] = strategy.name
+
+            return reduced_run
+
+        if not strategy.is_json_native:
+            for reduced_instance in reduced_run:
+                reduced_instance[STRATEGY_KEY] = strategy.name
+
+        return reduced_run
+
     def _use_strategy(self, instance: Any, *, strategy: BaseStrategy) -> Jsonable:
         reduced_instance = strategy.reduce(instance=instance, pickler=self)
         if not strategy.is_json_native:
@@ -93,6 +558,102 @@ class Pickler:
 
         return reduced_instance
 
+    def canonical_order(
+            self,
+            members: Iterable[MemberT],
+            *,
+            key: Optional[Callable[[MemberT], Any]] = None
+    ) -> Iterable[MemberT]:
+        """
+        Order the members of an unordered container. Strategies of such containers should reduce their members in the
+        returned order. Unless the pickler is canonical, the members are returned as they are.
+
+        :param members: The members of the container
+        :param key: A function that returns the part of a member to order by (Ex. the key of a dict item)
+        :return: The ordered members
+        """
+        if not self.__canonical:
+            return members
+
+        if key is None:
+            return sorted(members, key=self.__canonical_sort_key)
+
+        return sorted(members, key=lambda member: self.__canonical_sort_key(key(member)))
+
+    def __canonical_sort_key(self, member: Any) -> str:
+        member_type = type(member)
+        if member_type in _JSON_NATIVE_TYPES:
+            return _canonical_encoder.encode(0.0 if member_type is float and member == 0.0 else member)
+
+        member_id = id(member)
+        if member_id in self.__members_in_ordering:
+            return ""
+
+        # The member is ordered by its own canonical serialized form, which only depends on its value.
+        sort_key_pickler = Pickler(canonical=True)
+        sort_key_pickler.__members_in_ordering = self.__members_in_ordering
+        self.__members_in_ordering.add(member_id)
+        try:
+            return _canonical_encoder.encode(sort_key_pickler.reduce_document(member))
+        finally:
+            self.__members_in_ordering.discard(member_id)
+
+    def __emit_reference(self, reduced_reference: ReferenceReductionResult) -> Json:
+        self.__emitted_references += 1
+        if self.__referenced_paths is not None:
+            self.__referenced_paths.add(reduced_reference["reference"])
+        if self.__indexed_references is not None:
+            self.__indexed_referencing_paths[self.generate_current_reference()] = reduced_reference["reference"]
+
+        # Written as is, along with its strategy key.
+        return cast(Json, reduced_reference)
+
+    def _use_reduction_cache(
+            self,
+            instance: Any,
+            *,
+            strategy: BaseStrategy,
+            reduction_cache: ReductionCache
+    ) -> Jsonable:
+        current_reference = self.generate_current_reference()
+        cached_reduction = reduction_cache.lookup(instance)
+        if cached_reduction is not None:
+            # The members are recorded as if they were reduced, so instances they share with the rest of the output
+            # will be reduced by reference.
+            for relative_reference, member in cached_reduction.members:
+                self.__record_existing_member(member, f"{current_reference}{REFERENCE_SEPARATOR}{relative_reference}")
+
+            # The cached reduction is shared between outputs, so the caller is given a copy it may modify.
+            cached_reduced_instance = cached_reduction.reduced_instance
+            return cached_reduced_instance.copy() if isinstance(cached_reduced_instance, dict) else \
+                cached_reduced_instance
+
+        emitted_references = self.__emitted_references
+        recorded_references_count = len(self.__recorded_references)
+        self.__cacheable_reductions_depth += 1
+        try:
+            reduced_instance = self._use_strategy(instance, strategy=strategy)
+            if self.__emitted_references == emitted_references:
+                # References are relative to the current output, so only self-contained reductions can be reused.
+                prefix_length = len(current_reference) + len(REFERENCE_SEPARATOR)
+                members = tuple(
+                    (reference[prefix_length:], member)
+                    for reference, member in self.__recorded_references[recorded_references_count:]
+                )
+                reduction_cache.put(instance, reduced_instance, members=members)
+        finally:
+            self.__cacheable_reductions_depth -= 1
+            if not self.__cacheable_reductions_depth:
+                self.__recorded_references.clear()
+
+        return reduced_instance
+
+    def __record_existing_member(self, member: Any, reference: str) -> None:
+        if id(member) in self.__instances_references or reference in self.__references_instances:
+            return
+
+        self._record_reference(member, reference)
+
     def default_reduce(self, instance: Any) -> Jsonable:
         """
         Reduce an instance using the default custom_strategies. This function is encouraged to be used by custom
@@ -115,28 +676,140 @@ class Pickler:
         instance_id = id(instance)
         existing_reference_name = self.__instances_references.get(instance_id)
         if existing_reference_name:
-            return {"reference": existing_reference_name, STRATEGY_KEY: "reference"}
+            return cast(ReferenceReductionResult, {"reference": existing_reference_name, STRATEGY_KEY: "reference"})
 
         current_reference = self.generate_current_reference()
         # While unlikely to be the case, we need to make sure the current reference is not referencing any other
         # instance. If so, this means something went wrong, and we have a collision. We would like to raise an exception
         # here instead of letting the user see the problem only upon unpickling.
-        registered_instance_id = self.__instances_references.inverse.setdefault(current_reference, instance_id)
-        if registered_instance_id is not instance_id:
+        registered_instance_id = self.__references_instances.get(current_reference, instance_id)
+        if registered_instance_id != instance_id:
             raise ReductionReferenceCollision(f"Instance id {instance_id} was trying to be recorded under the reference"
                                               f" name {current_reference} but it is already used for instance id "
                                               f"{registered_instance_id}", instance=instance)
 
+        self._record_reference(instance, current_reference)
+
+        return None
+
+    def _record_reference(self, instance: Any, reference: str) -> None:
+        """
+        Record the given instance under the given reference, so it will be reduced by reference from now on.
+        """
+        instance_id = id(instance)
+        self.__references_instances[reference] = instance_id
+        self.__instances_references[instance_id] = reference
+        self.__recorded_instances[instance_id] = instance
+        if self.__cacheable_reductions_depth:
+            self.__recorded_references.append((reference, instance))
+
+    def attempt_reduce_by_structure(self, instance: Any) -> Optional[ReferenceReductionResult]:
+        """
+        Attempt to reduce a deeply immutable instance by referencing a previously encountered instance that is equal to
+        it. If no such instance was encountered, the instance will not be reduced and None will be returned.
+
+        :param instance: The instance to reduce
+        :return: The reduced instance
+        """
+        from kelpickle.deduplication import is_deduplication_candidate, structural_key
+
+        if not is_deduplication_candidate(instance, min_length=self.__min_deduplicated_length):
+            return None
+
+        instance_key = structural_key(instance)
+        if instance_key is None:
+            return None
+
+        assert self.__structural_references is not None, "Structural deduplication is disabled"
+        current_reference = self.generate_current_reference()
+        existing_reference_name = self.__structural_references.setdefault(instance_key, current_reference)
+        if existing_reference_name is current_reference:
+            return None
+
+        # The instance will not be written under the current reference, so it must not be referenced by it either.
+        # The next time it is encountered, it will be deduplicated again.
+        self._forget_reference(current_reference)
+        return cast(ReferenceReductionResult, {"reference": existing_reference_name, STRATEGY_KEY: "reference"})
+
+    def _forget_reference(self, reference: str) -> None:
+        """
+        Forget the instance that was recorded under the given reference, so it will be reduced in full the next time it
+        is encountered.
+        """
+        recorded_instance_id = self.__references_instances.pop(reference, None)
+        if recorded_instance_id is not None:
+            del self.__instances_references[recorded_instance_id]
+            del self.__recorded_instances[recorded_instance_id]
+
 
 class Unpickler:
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            *,
+            persistent_load: Optional[Callable[[Jsonable], Any]] = None,
+            persistent_load_many: Optional[Callable[[list[Hashable]], Mapping[Hashable, Any]]] = None,
+            restore_while_parsing: bool = False,
+            limits: Optional[ResourceLimits] = None,
+            string_interner: Optional[StringInterner] = None,
+            bulk_load: bool = False,
+            freeze_gc: bool = False,
+    ) -> None:
+        """
+        :param persistent_load: A function that returns the instance that was stored out of band under the given key
+                                (the counterpart of the Pickler's persistent_id).
+        :param persistent_load_many: A function that returns a mapping between the given keys and the instances that
+                                     were stored under them. If given, every (hashable) key within the document is
+                                     resolved by a single call before the restoration begins. Keys that are missing
+                                     from the returned mapping are resolved by persistent_load.
+        :param restore_while_parsing: Whether to restore self-contained instances (Ex. dates and naive datetimes) as
+                                      soon as they are parsed, so their parsed form is never kept for the entire
+                                      document. Worthwhile for documents that mostly consist of such instances.
+        :param limits: Limits on the resources each call may consume. A call that exceeds them is aborted with
+                       ResourceLimitExceeded. Inputs that are too large are rejected before they are parsed.
+        :param string_interner: A table to share equal restored strings through. Keys of restored dicts (and
+                                therefore attribute names) are always interned by sys.intern, regardless of it.
+        :param bulk_load: Whether to pause the garbage collector during each call (including the parsing). Worthwhile
+                          for large documents, whose restoration would otherwise trigger many collections. The report
+                          of the last call is kept in "last_bulk_load_report".
+        :param freeze_gc: Whether to gc.freeze the restored instances (and every other tracked object) at the end of
+                          each call, so they can be shared by forked workers without being copied by collections.
+                          Implies bulk_load.
+        """
         self.current_path: list[str] = []
         self.__reference_to_restored_instances: dict[str, Any] = {}
         self.__partial_restores: list[tuple[BaseStrategy, Any]] = []
+        # The serialized instance and its index. Only used while restoring a part of a serialized instance.
+        self.__indexed_source: Optional[tuple[IndexSource, PickleIndex]] = None
+        self.__persistent_load = persistent_load
+        self.__persistent_load_many = persistent_load_many
+        # The instances that were resolved in advance by persistent_load_many.
+        self.__persistent_instances: dict[Hashable, Any] = {}
+        # The references that are used within the restored document (if it lists them), and the depths of their paths.
+        # Only the instances that are referenced are recorded. Otherwise, every restored instance is recorded.
+        self.__referenced_paths: Optional[set[str]] = None
+        self.__referenced_depths: set[int] = set()
+        self.__restore_while_parsing = restore_while_parsing
+        self.__budget = None
+        if limits:
+            from kelpickle.limits import ResourceBudget
+
+            self.__budget = ResourceBudget(limits, current_reference=self.generate_current_reference)
+        # The ids of the existing instances that were updated in place. Only used while restoring into a target.
+        self.__updated_targets: set[int] = set()
+        self.__string_interner = string_interner
+        self.__bulk_load = bulk_load or freeze_gc
+        self.__freeze_gc = freeze_gc
+        self.last_bulk_load_report: Optional[BulkLoadReport] = None
 
     def _clear_cache(self) -> None:
+        if self.__budget is not None:
+            self.__budget.reset()
+        self.__updated_targets.clear()
         self.__reference_to_restored_instances.clear()
         self.__partial_restores.clear()
+        self.__persistent_instances.clear()
+        self.__referenced_paths = None
+        self.__referenced_depths.clear()
 
     def generate_current_reference(self) -> str:
         """
@@ -145,13 +818,211 @@ class Unpickler:
         :return: The unique reference
         """
         # TODO: Change the logic so parts of the path that contain the separator will somehow be escaped
-        return "->".join(self.current_path)
+        return REFERENCE_SEPARATOR.join(self.current_path)
 
-    def unpickle(self, serialized_instance: str) -> Any:
-        result = self.restore(json.loads(serialized_instance), relative_key=ROOT_RELATIVE_KEY)
-        self._clear_cache()
+    @contextmanager
+    def _bulk_loading(self) -> Iterator[None]:
+        """
+        Pause the garbage collector for the duration of the context, if the unpickler is in bulk load mode.
+        """
+        if not self.__bulk_load:
+            yield
+            return
+
+        from kelpickle.bulk_load import bulk_load
+
+        with bulk_load(freeze=self.__freeze_gc) as report:
+            self.last_bulk_load_report = report
+            yield
+
+    def unpickle(self, serialized_instance: SerializedInstance) -> Any:
+        """
+        Deserialize the given serialized instance.
+
+        :param serialized_instance: The output of Pickler.pickle. May be given as a string, or as UTF-8 encoded bytes
+                                    (including bytearrays and memoryviews), in which case it does not have to be
+                                    decoded first.
+        :return: The deserialized instance
+        """
+        try:
+            with self._bulk_loading():
+                return self._restore_document(self._parse(serialized_instance), relative_key=ROOT_RELATIVE_KEY)
+        finally:
+            self._clear_cache()
 
-        return result
+    def _parse(self, serialized_instance: SerializedInstance) -> Jsonable:
+        if isinstance(serialized_instance, memoryview):
+            # json.loads only accepts str, bytes and bytearray
+            serialized_instance = str(serialized_instance, "utf-8")
+
+        if self.__budget is not None:
+            self.__budget.reset()
+            self.current_path.append(ROOT_RELATIVE_KEY)
+            try:
+                # Strings are measured by their length rather than their encoded size, which spares encoding them
+                # (although non-ASCII characters are undercounted).
+                self.__budget.consume_bytes(len(serialized_instance))
+            finally:
+                self.current_path.pop()
+
+        document: Jsonable
+        if self.__restore_while_parsing:
+            document = json.loads(serialized_instance, object_hook=_restore_while_parsing)
+        else:
+            document = json.loads(serialized_instance)
+
+        return document
+
+    def restore_document(self, document: Jsonable) -> Any:
+        """
+        Restore an instance from a document that was reduced by Pickler.reduce_document (or parsed from the output of
+        Pickler.pickle). The document is not modified.
+
+        :param document: The reduced instance
+        :return: The restored instance
+        """
+        try:
+            with self._bulk_loading():
+                return self._restore_document(document, relative_key=ROOT_RELATIVE_KEY)
+        finally:
+            self._clear_cache()
+
+    def load(self, fp: BinaryIO) -> Any:
+        """
+        Deserialize an instance from a binary file that was written by Pickler.dump. Compressed files are detected and
+        decompressed automatically.
+
+        :param fp: The binary file to read from
+        :return: The deserialized instance
+        """
+        from kelpickle.compression import read_document
+
+        try:
+            with self._bulk_loading():
+                max_size = None if self.__budget is None else self.__budget.limits.max_bytes
+                serialized_instance = read_document(fp, max_size=max_size)
+                return self._restore_document(self._parse(serialized_instance), relative_key=ROOT_RELATIVE_KEY)
+        finally:
+            self._clear_cache()
+
+    def iter_load(self, fp: BinaryIO, *, share_references: bool = False) -> Iterator[Any]:
+        """
+        Deserialize the records of a binary file that was written by Pickler.dump_iter, one at a time. Only a single
+        record is read into memory at once.
+
+        :param fp: The binary file to read from
+        :param share_references: Must match the value that was given to Pickler.dump_iter
+        :return: A generator of the deserialized instances
+        """
+        try:
+            for record_index, record in enumerate(filter(bytes.strip, fp)):
+                # The collector is only paused while a record is restored (and never while the caller handles it).
+                with self._bulk_loading():
+                    relative_key = _record_root_key(record_index) if share_references else ROOT_RELATIVE_KEY
+                    result = self._restore_document(self._parse(record), relative_key=relative_key)
+                if not share_references:
+                    self._clear_cache()
+                yield result
+        finally:
+            self._clear_cache()
+
+    def restore_into(self, target: Any, serialized_instance: SerializedInstance) -> Any:
+        """
+        Deserialize the given serialized instance by updating an existing instance in place. Attributes, list items
+        and dict entries of the existing graph are updated recursively, so only the parts whose types (or shapes)
+        differ are newly allocated.
+
+        :param target: The existing instance to update
+        :param serialized_instance: The output of Pickler.pickle (Check "unpickle" for the supported types)
+        :return: The target if it was updated in place. Otherwise (Ex. it's of a different type), the newly restored
+                 instance.
+        """
+        try:
+            with self._bulk_loading():
+                return self._restore_document(self._parse(serialized_instance), relative_key=ROOT_RELATIVE_KEY,
+                                              target=target)
+        finally:
+            self._clear_cache()
+
+    def unpickle_with_deltas(self, serialized_base: str, serialized_deltas: Iterable[str]) -> Any:
+        """
+        Deserialize a base document after applying a chain of deltas on top of it.
+
+        :param serialized_base: The output of Pickler.pickle/Pickler.pickle_snapshot
+        :param serialized_deltas: Outputs of Pickler.pickle_delta, in the order they were created
+        :return: The deserialized instance
+        """
+        from kelpickle.delta import apply_delta
+
+        document = json.loads(serialized_base)
+        for serialized_delta in serialized_deltas:
+            document = apply_delta(document, json.loads(serialized_delta))
+
+        try:
+            return self._restore_document(document, relative_key=ROOT_RELATIVE_KEY)
+        finally:
+            self._clear_cache()
+
+    def unpickle_path(self, serialized_instance: IndexSource, index: PickleIndex, reference: str) -> Any:
+        """
+        Deserialize only the part of the serialized instance that lies under the given reference. Only the fragment of
+        that part is read and parsed. References that point outside of it are resolved on demand, by restoring their
+        own fragments.
+
+        :param serialized_instance: The output of Pickler.pickle_with_index. May be a string, bytes or a seekable
+                                    binary file.
+        :param index: The index that was generated alongside the serialized instance
+        :param reference: The reference of the wanted part. Ex. "$ROOT->0->3"
+        :return: The deserialized part
+        """
+        self.__indexed_source = (serialized_instance, index)
+        try:
+            return self._restore_indexed(reference)
+        finally:
+            self.__indexed_source = None
+            self._clear_cache()
+
+    def _restore_indexed(self, reference: str) -> Any:
+        assert self.__indexed_source is not None, "Indexed restoration requires an indexed source"
+        source, index = self.__indexed_source
+        reference = _resolve_indexed_reference(index, reference)
+        if reference in self.__reference_to_restored_instances:
+            return self.__reference_to_restored_instances[reference]
+
+        from kelpickle.indexing import read_fragment
+
+        fragment = read_fragment(source, index, reference)
+
+        # The fragment has to be restored under its original path, so references within it will be recorded correctly.
+        *parent_path, relative_key = reference.split(REFERENCE_SEPARATOR)
+        current_path = self.current_path
+        self.current_path = parent_path
+        try:
+            return self._restore_document(fragment, relative_key=relative_key)
+        finally:
+            self.current_path = current_path
+
+    def _restore_document(self, document: Jsonable, *, relative_key: str, target: Any = _NO_TARGET) -> Any:
+        """
+        Restore an entire parsed document (or fragment). Unlike "restore", this is only called once per document.
+        If a target is given, it's updated in place wherever possible.
+        """
+        if isinstance(document, dict) and REFERENCED_KEY in document and STRATEGY_KEY not in document:
+            referenced_paths = document[REFERENCED_KEY]
+            self.__referenced_paths = set(referenced_paths)
+            self.__referenced_depths = {path.count(REFERENCE_SEPARATOR) + 1 for path in referenced_paths}
+            document = document[ENVELOPE_VALUE_KEY]
+
+        if self.__persistent_load_many is not None:
+            persistent_keys = [key for key in _collect_persistent_keys(document)
+                               if key not in self.__persistent_instances]
+            if persistent_keys:
+                self.__persistent_instances.update(self.__persistent_load_many(persistent_keys))
+
+        if target is _NO_TARGET:
+            return self.restore(document, relative_key=relative_key)
+
+        return self.restore_in_place(document, relative_key=relative_key, target=target)
 
     def restore(self, reduced_instance: Jsonable, *, relative_key: str) -> Any:
         """
@@ -163,39 +1034,207 @@ class Unpickler:
         """
         self.current_path.append(relative_key)
         try:
+            if self.__budget is not None:
+                self.__consume_budget()
+
             result = self.default_restore(reduced_instance)
 
             return result
         finally:
             self.current_path.pop()
 
+    def __consume_budget(self) -> None:
+        assert self.__budget is not None, "Budget is only consumed while limits are enforced"
+        depth = len(self.current_path)
+        if depth == 1:
+            # Every root (Ex. every record of a stream) gets its own budget.
+            self.__budget.reset()
+
+        self.__budget.visit(depth)
+
+    def restore_in_place(self, reduced_instance: Jsonable, *, relative_key: str, target: Any) -> Any:
+        """
+        The counterpart of "restore" that reuses an existing instance. If the strategy of the reduced instance can
+        update the target in place, the target becomes equal to the reduced instance (reusing its members wherever
+        possible). Otherwise, a new instance is restored instead.
+
+        :param reduced_instance: The result of the "reduce" function
+        :param relative_key: Check the documentation for "restore"
+        :param target: The existing instance to update
+        :return: The target if it was updated in place, or the newly restored instance otherwise
+        """
+        strategy = self.__in_place_strategy(reduced_instance)
+        if (
+                strategy is None or
+                id(target) in self.__updated_targets or
+                not strategy.can_restore_in_place(reduced_instance=reduced_instance, target=target)
+        ):
+            return self.restore(reduced_instance, relative_key=relative_key)
+
+        self.current_path.append(relative_key)
+        try:
+            if self.__budget is not None:
+                self.__consume_budget()
+
+            # An instance that is reachable through multiple paths of the existing graph may only be reused by one of
+            # them. The reduced instances of the other paths may differ from it.
+            self.__updated_targets.add(id(target))
+            self._record_reference(target)
+            strategy.restore_in_place(reduced_instance=reduced_instance, unpickler=self, target=target)
+            return target
+        finally:
+            self.current_path.pop()
+
+    @staticmethod
+    def __in_place_strategy(reduced_instance: Jsonable) -> Optional[BaseStrategy]:
+        reduced_type: type = type(reduced_instance)
+        if reduced_type is _ParsedInstance:
+            return None
+
+        if isinstance(reduced_instance, dict):
+            strategy_name = reduced_instance.get(STRATEGY_KEY, "dict")
+            if strategy_name in (REFERENCE_STRATEGY_NAME, PERSISTENT_STRATEGY_NAME):
+                return None
+            strategy = get_strategy_named(strategy_name)
+        else:
+            strategy = get_unpickling_strategy_for(reduced_type)
+
+        return strategy if strategy.restores_in_place else None
+
     def default_restore(self, reduced_instance: Jsonable) -> Any:
-        reduced_type = type(reduced_instance)
+        # Documents that were parsed by "_parse" may contain parsed instances as well.
+        reduced_type: type = type(reduced_instance)
+        if reduced_type is _ParsedInstance:
+            # Was already restored while parsing. All that's left is to record it.
+            parsed_instance = cast(_ParsedInstance, reduced_instance)
+            if parsed_instance.strategy.auto_generate_reduction_references:
+                self._record_reference(parsed_instance.instance)
+            return parsed_instance.instance
+
+        if reduced_type is str and self.__string_interner is not None:
+            # The interned string is the one that is recorded, so references to it will share it as well.
+            interned_string = self.__string_interner.intern(reduced_instance)  # type: ignore[arg-type]
+            self._record_reference(interned_string)
+            return interned_string
+
         if isinstance(reduced_instance, dict):
-            strategy_name = reduced_instance.pop(STRATEGY_KEY, "dict")
-            if strategy_name == "reference":
-                return self._restore_reference(reduced_instance)
+            # The reduced instance is not modified, since it may be shared (Ex. by a reduction cache or deepcopy).
+            strategy_name = reduced_instance.get(STRATEGY_KEY, "dict")
+            if strategy_name == REFERENCE_STRATEGY_NAME:
+                return self._restore_reference(cast(ReferenceReductionResult, reduced_instance))
+            if strategy_name == PERSISTENT_STRATEGY_NAME:
+                return self._restore_persistent(cast(PersistentReductionResult, reduced_instance))
             strategy = get_strategy_named(strategy_name)
         else:
             strategy = get_unpickling_strategy_for(reduced_type)
         return self._restore_with_strategy(reduced_instance, strategy)
 
+    def restore_many(self, reduced_instances: Sequence[Jsonable]) -> list[Any]:
+        """
+        Restore the members of a sequence that was reduced by Pickler.reduce_many. Runs of members that were reduced by
+        the same strategy are handed to its "restore_many" at once.
+
+        :param reduced_instances: The reduced members
+        :return: The restored members
+        """
+        restored_instances: list[Any] = []
+        members_count = len(reduced_instances)
+        run_start = 0
+        while run_start < members_count:
+            run_strategy_key = _restoration_strategy_key(reduced_instances[run_start])
+            run_end = run_start + 1
+            while run_end < members_count and _restoration_strategy_key(reduced_instances[run_end]) == run_strategy_key:
+                run_end += 1
+
+            strategy = (
+                self.__batching_strategy(run_strategy_key)
+                if run_end - run_start >= MIN_BATCH_SIZE and self.__budget is None else
+                None
+            )
+            if strategy is None:
+                restored_instances.extend(
+                    self.restore(reduced_instances[i], relative_key=str(i)) for i in range(run_start, run_end)
+                )
+            else:
+                restored_instances.extend(
+                    self.__restore_run(reduced_instances[run_start:run_end], run_start, strategy)
+                )
+
+            run_start = run_end
+
+        return restored_instances
+
+    @staticmethod
+    def __batching_strategy(strategy_key: str | type) -> Optional[BaseStrategy]:
+        if strategy_key in (REFERENCE_STRATEGY_NAME, PERSISTENT_STRATEGY_NAME, _ParsedInstance):
+            return None
+
+        if isinstance(strategy_key, str):
+            strategy = get_strategy_named(strategy_key)
+        else:
+            strategy = get_unpickling_strategy_for(strategy_key)
+
+        return strategy if strategy.batches_restorations else None
+
+    def __restore_run(self, run: Sequence[Jsonable], run_start: int, strategy: BaseStrategy) -> list[Any]:
+        relative_keys = [str(i) for i in range(run_start, run_start + len(run))]
+        restored_run = strategy.restore_many(reduced_instances=run, relative_keys=relative_keys, unpickler=self)
+        if type(run[0]) is str and self.__string_interner is not None:
+            restored_run = self.__string_interner.intern_many(restored_run)
+        # Natives are recorded as well, since deduplicated documents reference repeated immutables.
+        if self.__referenced_paths is None or len(self.current_path) + 1 in self.__referenced_depths:
+            for restored_instance, relative_key in zip(restored_run, relative_keys):
+                self.current_path.append(relative_key)
+                try:
+                    self._record_reference(restored_instance)
+                finally:
+                    self.current_path.pop()
+
+        return restored_run
+
     def _restore_with_strategy(self, reduced_instance: Jsonable, strategy: BaseStrategy) -> Any:
         base_instance = strategy.restore_base(reduced_instance=reduced_instance, unpickler=self)
         self._record_reference(base_instance)
         strategy.restore_rest(reduced_instance=reduced_instance, unpickler=self, base_instance=base_instance)
+        return base_instance
 
-    def _restore_reference(self, reduced_instance: ReferenceReductionResult):
+    def _restore_reference(self, reduced_instance: ReferenceReductionResult) -> Any:
         reference = reduced_instance["reference"]
         try:
             return self.__reference_to_restored_instances[reference]
         except KeyError as e:
-            raise ValueError(
-                f"Reference {reference} cannot be restored. The original object was not recorded yet."
-            ) from e
+            if self.__indexed_source is None or reference not in self.__indexed_source[1]:
+                raise ValueError(
+                    f"Reference {reference} cannot be restored. The original object was not recorded yet."
+                ) from e
+
+        if self.generate_current_reference().startswith(f"{reference}{REFERENCE_SEPARATOR}"):
+            # Restoring the referenced instance would mean restoring the part we are currently in the middle of.
+            raise RestoreError(f"Reference {reference} cannot be restored on demand. It points to an instance that "
+                               f"contains the currently restored part.")
+
+        return self._restore_indexed(reference)
+
+    def _restore_persistent(self, reduced_instance: PersistentReductionResult) -> Any:
+        key = reduced_instance["key"]
+        if isinstance(key, Hashable) and key in self.__persistent_instances:
+            return self.__persistent_instances[key]
+
+        if self.__persistent_load is None:
+            raise UnpicklingError(f"Cannot restore the persistent instance stored under {key!r}. A persistent_load "
+                                  f"function was not given.")
+
+        return self.__persistent_load(key)
 
     def _record_reference(self, instance: Any) -> None:
+        if self.__referenced_paths is not None and len(self.current_path) not in self.__referenced_depths:
+            # Nothing at this depth is referenced, so there's no need to even generate the reference.
+            return
+
         current_reference = self.generate_current_reference()
+        if self.__referenced_paths is not None and current_reference not in self.__referenced_paths:
+            return
+
         registered_instance = self.__reference_to_restored_instances.setdefault(current_reference, instance)
 
         if registered_instance is not instance:
@@ -203,19 +1242,326 @@ class Unpickler:
                                                 f"{current_reference}. The reference is already used by "
                                                 f"{registered_instance}")
 
+    def _forget_reference(self, reference: str) -> None:
+        """
+        Forget the instance that was recorded under the given reference.
+        """
+        self.__reference_to_restored_instances.pop(reference, None)
+
+
+def _record_root_key(record_index: int) -> str:
+    return f"$RECORD{record_index}"
+
+
+class _ParsedInstance:
+    """
+    An instance that was restored while its document was parsed.
+    """
+    __slots__ = ("instance", "strategy")
+
+    def __init__(self, instance: Any, strategy: BaseStrategy) -> None:
+        self.instance = instance
+        self.strategy = strategy
+
+
+# Mapping between strategy names and the strategies that restore instances while parsing (or None for the rest).
+_parse_time_strategies: dict[str, Optional[BaseStrategy]] = {
+    REFERENCE_STRATEGY_NAME: None,
+    PERSISTENT_STRATEGY_NAME: None,
+}
+
+
+def _restore_while_parsing(reduced_instance: dict[str, Any]) -> Any:
+    strategy_name = reduced_instance.get(STRATEGY_KEY)
+    if strategy_name is None:
+        return reduced_instance
+
+    try:
+        strategy = _parse_time_strategies[strategy_name]
+    except KeyError:
+        try:
+            strategy = get_strategy_named(strategy_name)
+        except KeyError:
+            # Unknown strategies are reported once the instance is restored.
+            return reduced_instance
+
+        if not strategy.restores_while_parsing:
+            strategy = None
+        _parse_time_strategies[strategy_name] = strategy
+
+    if strategy is None:
+        return reduced_instance
+
+    instance = strategy.restore_while_parsing(reduced_instance)
+    if instance is None:
+        return reduced_instance
+
+    return _ParsedInstance(instance, strategy)
+
+
+def _resolve_indexed_reference(index: PickleIndex, reference: str) -> str:
+    """
+    Follow the paths that were reduced by reference (on the way to the given reference), up to the instances they
+    reference.
+    """
+    path = reference.split(REFERENCE_SEPARATOR)
+    depth = 1
+    while depth <= len(path):
+        location = index.get(REFERENCE_SEPARATOR.join(path[:depth]))
+        if isinstance(location, str):
+            # Continue from the referenced instance, whose own path may contain references as well.
+            path = location.split(REFERENCE_SEPARATOR) + path[depth:]
+            depth = 1
+        else:
+            depth += 1
+
+    return REFERENCE_SEPARATOR.join(path)
+
+
+def _restoration_strategy_key(reduced_instance: Jsonable) -> str | type:
+    # Reduced dicts are restored by the strategy that is named within them, anything else by its type.
+    if isinstance(reduced_instance, dict):
+        strategy_name: str = reduced_instance.get(STRATEGY_KEY, "dict")
+        return strategy_name
+
+    return type(reduced_instance)
+
+
+def _collect_persistent_keys(document: Jsonable) -> list[Hashable]:
+    keys: dict[Hashable, None] = {}
+    pending_nodes = [document]
+    while pending_nodes:
+        node = pending_nodes.pop()
+        if isinstance(node, dict):
+            if node.get(STRATEGY_KEY) == PERSISTENT_STRATEGY_NAME:
+                key = node["key"]
+                if isinstance(key, Hashable):
+                    keys[key] = None
+                continue
 
-# Import all the builtin strategies in order to register them
-from kelpickle.strategies.custom_strategies.bytes_strategy import BytesStrategy  # noqa: F401,E402
-from kelpickle.strategies.custom_strategies.date_strategy import DateStrategy  # noqa: F401,E402
-from kelpickle.strategies.custom_strategies.datetime_strategy import DatetimeStrategy  # noqa: F401,E402
-from kelpickle.strategies.custom_strategies.import_strategy import ImportStrategy  # noqa: F401,E402
-from kelpickle.strategies.custom_strategies.object_strategy import ObjectStrategy  # noqa: F401,E402
-from kelpickle.strategies.custom_strategies.set_strategy import SetStrategy  # noqa: F401,E402
-from kelpickle.strategies.custom_strategies.time_strategy import TimeStrategy  # noqa: F401,E402
-from kelpickle.strategies.custom_strategies.timedelta_strategy import TimeDeltaStrategy  # noqa: F401,E402
-from kelpickle.strategies.custom_strategies.tuple_strategy import TupleStrategy  # noqa: F401,E402
-from kelpickle.strategies.custom_strategies.tzinfo_strategy import TzInfoStrategy  # noqa: F401,E402
+            pending_nodes.extend(node.values())
+        elif isinstance(node, list):
+            pending_nodes.extend(node)
 
+    return list(keys)
+
+
+class PicklingPool:
+    """
+    A thread safe pool of picklers and unpicklers. Pickler and Unpickler instances keep state during each call, so
+    they can't be shared between threads. The pool keeps idle instances for every thread separately, so they can be
+    reused without any locking. Nested usage within the same thread (Ex. a custom __reduce__ that pickles something on
+    its own) is given a different instance.
+    """
+    def __init__(
+            self,
+            pickler_factory: Callable[[], Pickler] = Pickler,
+            unpickler_factory: Callable[[], Unpickler] = Unpickler,
+    ) -> None:
+        self.__pickler_factory = pickler_factory
+        self.__unpickler_factory = unpickler_factory
+        self.__thread_context = threading.local()
+
+    def __idle_instances(self, name: str) -> list[Any]:
+        idle_instances: Optional[list[Any]] = getattr(self.__thread_context, name, None)
+        if idle_instances is None:
+            idle_instances = []
+            setattr(self.__thread_context, name, idle_instances)
+
+        return idle_instances
+
+    @contextmanager
+    def pickler(self) -> Iterator[Pickler]:
+        """
+        Borrow a pickler for the current thread. It is returned to the pool once the context is exited.
+        """
+        idle_picklers = self.__idle_instances("picklers")
+        pickler = idle_picklers.pop() if idle_picklers else self.__pickler_factory()
+        try:
+            yield pickler
+        except BaseException:
+            # The borrowed pickler may have been used directly (Ex. by "reduce"), which does not clean up upon errors.
+            pickler.current_path.clear()
+            pickler._clean_cache()
+            raise
+        finally:
+            idle_picklers.append(pickler)
+
+    @contextmanager
+    def unpickler(self) -> Iterator[Unpickler]:
+        """
+        Borrow an unpickler for the current thread. It is returned to the pool once the context is exited.
+        """
+        idle_unpicklers = self.__idle_instances("unpicklers")
+        unpickler = idle_unpicklers.pop() if idle_unpicklers else self.__unpickler_factory()
+        try:
+            yield unpickler
+        except BaseException:
+            # The borrowed unpickler may have been used directly (Ex. by "restore"), which does not clean up upon
+            # errors.
+            unpickler.current_path.clear()
+            unpickler._clear_cache()
+            raise
+        finally:
+            idle_unpicklers.append(unpickler)
+
+    def dumps(self, instance: Any) -> str:
+        with self.pickler() as pickler:
+            return pickler.pickle(instance)
+
+    def loads(self, serialized_instance: SerializedInstance) -> Any:
+        with self.unpickler() as unpickler:
+            return unpickler.unpickle(serialized_instance)
+
+    def dump(self, instance: Any, fp: BinaryIO, *, compression: Optional[str] = None) -> None:
+        with self.pickler() as pickler:
+            pickler.dump(instance, fp, compression=compression)
+
+    def load(self, fp: BinaryIO) -> Any:
+        with self.unpickler() as unpickler:
+            return unpickler.load(fp)
+
+    def dump_iter(self, instances: Iterable[Any], fp: BinaryIO, *, share_references: bool = False) -> int:
+        with self.pickler() as pickler:
+            return pickler.dump_iter(instances, fp, share_references=share_references)
+
+    def iter_load(self, fp: BinaryIO, *, share_references: bool = False) -> Iterator[Any]:
+        with self.unpickler() as unpickler:
+            yield from unpickler.iter_load(fp, share_references=share_references)
+
+    def deepcopy(self, instance: Any) -> Any:
+        with self.pickler() as pickler, self.unpickler() as unpickler:
+            return unpickler.restore_document(pickler.reduce_document(instance))
+
+    def fingerprint(self, instance: Any, *, algorithm: str = "sha256") -> str:
+        with self.pickler() as pickler:
+            return pickler.fingerprint(instance, algorithm=algorithm)
+
+
+_default_pool = PicklingPool()
+_canonical_pool = PicklingPool(pickler_factory=lambda: Pickler(canonical=True))
+
+
+def dumps(instance: Any) -> str:
+    """
+    serialize the given python object using a pooled pickler. Safe to be called from multiple threads.
+    """
+    return _default_pool.dumps(instance)
+
+
+def loads(serialized_instance: SerializedInstance) -> Any:
+    """
+    Deserialize the given serialized instance using a pooled unpickler. Safe to be called from multiple threads.
+    """
+    return _default_pool.loads(serialized_instance)
+
+
+def dump(instance: Any, fp: BinaryIO, *, compression: Optional[str] = None) -> None:
+    """
+    serialize the given python object into a binary file using a pooled pickler. Check Pickler.dump for more info.
+    """
+    _default_pool.dump(instance, fp, compression=compression)
+
+
+def load(fp: BinaryIO) -> Any:
+    """
+    Deserialize an instance from a binary file using a pooled unpickler. Check Unpickler.load for more info.
+    """
+    return _default_pool.load(fp)
+
+
+def dump_iter(instances: Iterable[Any], fp: BinaryIO, *, share_references: bool = False) -> int:
+    """
+    serialize the given python objects into a binary file as a stream of records using a pooled pickler. Check
+    Pickler.dump_iter for more info.
+    """
+    return _default_pool.dump_iter(instances, fp, share_references=share_references)
+
+
+def iter_load(fp: BinaryIO, *, share_references: bool = False) -> Iterator[Any]:
+    """
+    Deserialize the records of a binary file one at a time using a pooled unpickler. Check Unpickler.iter_load for
+    more info.
+    """
+    return _default_pool.iter_load(fp, share_references=share_references)
+
+
+def deepcopy(instance: Any) -> Any:
+    """
+    Deep copy the given python object by restoring its reduced form right away. The copy is identical to the result of
+    a pickle/unpickle round trip (including shared references and cycles), without the cost of encoding and parsing
+    JSON.
+    """
+    return _default_pool.deepcopy(instance)
+
+
+def fingerprint(instance: Any, *, algorithm: str = "sha256") -> str:
+    """
+    Calculate a digest of the canonical serialized form of the given python object. Equal instances have equal
+    fingerprints, so they may be used as cache keys. Check Pickler.fingerprint for more info.
+    """
+    return _canonical_pool.fingerprint(instance, algorithm=algorithm)
+
+
+# The core strategies are always needed, so they are imported (and registered) right away.
 from kelpickle.strategies.core_strategies import null_strategy  # noqa: F401,E402
 from kelpickle.strategies.core_strategies import list_strategy  # noqa: F401,E402
 from kelpickle.strategies.core_strategies import dict_strategy  # noqa: F401,E402
+
+# The rest of the builtin strategies are only imported once a matching type (or strategy name) is looked up.
+_CUSTOM_STRATEGIES_PACKAGE = "kelpickle.strategies.custom_strategies"
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.array_strategy", name="array",
+                       supported_type_names=("array.array",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.bytearray_strategy", name="bytearray",
+                       supported_type_names=("builtins.bytearray",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.bytes_strategy", name="bytes",
+                       supported_type_names=("builtins.bytes",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.complex_strategy", name="complex",
+                       supported_type_names=("builtins.complex",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.counter_strategy", name="counter",
+                       supported_type_names=("collections.Counter",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.date_strategy", name="date",
+                       supported_type_names=("datetime.date",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.datetime_strategy", name="datetime",
+                       supported_type_names=("datetime.datetime",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.decimal_strategy", name="decimal",
+                       supported_type_names=("decimal.Decimal",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.defaultdict_strategy", name="defaultdict",
+                       supported_type_names=("collections.defaultdict",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.deque_strategy", name="deque",
+                       supported_type_names=("collections.deque",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.enum_strategy", name="enum",
+                       supported_type_names=("enum.Enum",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.fraction_strategy", name="fraction",
+                       supported_type_names=("fractions.Fraction",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.frozenset_strategy", name="frozenset",
+                       supported_type_names=("builtins.frozenset",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.import_strategy", name="import", supported_type_names=(
+    "builtins.type",
+    "builtins.function",
+    "builtins.wrapper_descriptor",
+    "builtins.method_descriptor",
+    "builtins.getset_descriptor",
+    "builtins.member_descriptor",
+))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.memoryview_strategy", name="memoryview",
+                       supported_type_names=("builtins.memoryview",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.object_strategy", name="default",
+                       supported_type_names=("builtins.object",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.ordered_dict_strategy", name="ordered_dict",
+                       supported_type_names=("collections.OrderedDict",))
+# pathlib became a package in python 3.13, which moved the definition of its classes.
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.path_strategy", name="path",
+                       supported_type_names=("pathlib.PurePath", "pathlib._local.PurePath"))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.set_strategy", name="set",
+                       supported_type_names=("builtins.set",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.time_strategy", name="time",
+                       supported_type_names=("datetime.time",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.timedelta_strategy", name="timedelta",
+                       supported_type_names=("datetime.timedelta",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.tuple_strategy", name="tuple",
+                       supported_type_names=("builtins.tuple",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.tzinfo_strategy", name="tzinfo",
+                       supported_type_names=("datetime.tzinfo",))
+register_lazy_strategy(f"{_CUSTOM_STRATEGIES_PACKAGE}.uuid_strategy", name="uuid",
+                       supported_type_names=("uuid.UUID",))
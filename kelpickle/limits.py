@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from kelpickle.errors import ResourceLimitExceeded
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceLimits:
+    """
+    Limits on the resources a single pickling (or unpickling) call may consume. Limits that are None are not enforced.
+    """
+    # The maximal depth of the path of a (reduced or restored) instance
+    max_depth: Optional[int] = None
+    # The maximal number of instances to reduce or restore
+    max_nodes: Optional[int] = None
+    # The maximal size of the output (when pickling), or of the input (when unpickling), in bytes
+    max_bytes: Optional[int] = None
+    # The maximal wall time of the call. Only checked every "check_interval" instances.
+    max_seconds: Optional[float] = None
+    check_interval: int = 256
+
+
+class ResourceBudget:
+    """
+    Tracks the resources consumed by a single call of a pickler (or unpickler), and aborts it once any of its limits is
+    exceeded. Checks are made as instances are visited, so the call is aborted before it consumes much more than
+    allowed.
+    """
+    __slots__ = ("limits", "__current_reference", "__nodes", "__bytes", "__deadline")
+
+    def __init__(self, limits: ResourceLimits, *, current_reference: Callable[[], str]) -> None:
+        """
+        :param limits: The limits to enforce
+        :param current_reference: Generates the reference of the currently visited instance. Only called once a limit
+                                  is exceeded, in order to report where.
+        """
+        self.limits = limits
+        self.__current_reference = current_reference
+        self.__nodes = 0
+        self.__bytes = 0
+        self.__deadline: Optional[float] = None
+
+    def reset(self) -> None:
+        self.__nodes = 0
+        self.__bytes = 0
+        self.__deadline = None
+
+    def __exceeded(self, limit: str, message: str) -> ResourceLimitExceeded:
+        return ResourceLimitExceeded(message, limit=limit, path=self.__current_reference())
+
+    def visit(self, depth: int) -> None:
+        """
+        Account for an instance that is about to be reduced (or restored).
+
+        :param depth: The depth of the path of the instance
+        """
+        limits = self.limits
+        self.__nodes += 1
+        if limits.max_depth is not None and depth > limits.max_depth:
+            raise self.__exceeded("max_depth", f"Exceeded the maximal depth of {limits.max_depth}")
+
+        if limits.max_nodes is not None and self.__nodes > limits.max_nodes:
+            raise self.__exceeded("max_nodes", f"Exceeded the maximal number of {limits.max_nodes} instances")
+
+        if limits.max_seconds is not None:
+            if self.__deadline is None:
+                # The clock starts once the first instance is visited.
+                self.__deadline = time.perf_counter() + limits.max_seconds
+            elif self.__nodes % limits.check_interval == 0 and time.perf_counter() > self.__deadline:
+                raise self.__exceeded("max_seconds", f"Exceeded the maximal time of {limits.max_seconds} seconds")
+
+    def consume_bytes(self, size: int) -> None:
+        """
+        Account for the given number of bytes of output (or input).
+        """
+        self.__bytes += size
+        if self.limits.max_bytes is not None and self.__bytes > self.limits.max_bytes:
+            raise self.__exceeded("max_bytes", f"Exceeded the maximal size of {self.limits.max_bytes} bytes")
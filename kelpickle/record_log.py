@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+
+from kelpickle.errors import UnpicklingError
+from kelpickle.kelpickling import Pickler, Unpickler
+
+# A log is made of a data file and a sidecar index file. The data file starts with the magic bytes, followed by
+# frames: The id of the record and the length of its serialized form, followed by the serialized form itself. Deleted
+# records are marked by a frame without a serialized form (a tombstone). The index holds the id and the frame offset of
+# every record, in the order they were appended. Ids only grow, so the index is sorted and can be binary searched. The
+# index entries of deleted records are marked in place, so deleting never breaks the order of the index.
+LOG_MAGIC = b"KELPLOG\x01"
+INDEX_SUFFIX = ".idx"
+
+_FRAME_HEADER = struct.Struct("<QI")
+_INDEX_ENTRY = struct.Struct("<QQ")
+_TOMBSTONE_LENGTH = 0xFFFFFFFF
+_DELETED_OFFSET = 0xFFFFFFFFFFFFFFFF
+
+
+def _index_path(path: str) -> str:
+    return f"{path}{INDEX_SUFFIX}"
+
+
+class _MappedFile:
+    """
+    A read only memory map of a file that keeps growing. The file is remapped whenever it's accessed beyond the mapped
+    size.
+    """
+    def __init__(self, fp: BinaryIO) -> None:
+        self.__fp = fp
+        self.__map: Optional[mmap.mmap] = None
+
+    def view(self, minimal_size: int) -> mmap.mmap:
+        if self.__map is None or len(self.__map) < minimal_size:
+            self.close()
+            file_size = os.fstat(self.__fp.fileno()).st_size
+            if file_size < minimal_size:
+                raise UnpicklingError(f"The log is truncated. Expected at least {minimal_size} bytes, found "
+                                      f"{file_size} bytes")
+            self.__map = mmap.mmap(self.__fp.fileno(), file_size, access=mmap.ACCESS_READ)
+
+        return self.__map
+
+    def close(self) -> None:
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+
+
+class RecordLog:
+    """
+    An append only log of serialized instances, each of them identified by an increasing record id. Records are read
+    through a memory map of the log, so restoring a record only reads the pages of that record (and a logarithmic
+    number of index pages), no matter how large the log is.
+
+    Deleting records only marks them as deleted. Use "compact" in order to reclaim their space.
+    """
+    def __init__(
+            self,
+            path: str,
+            *,
+            pickler_factory: Callable[[], Pickler] = Pickler,
+            unpickler_factory: Callable[[], Unpickler] = Unpickler,
+    ) -> None:
+        """
+        :param path: The path of the data file. The index is stored alongside it (with an ".idx" suffix). Both are
+                     created if they do not exist. A missing index of an existing log is rebuilt from the data file.
+        :param pickler_factory: Creates the pickler that serializes appended instances
+        :param unpickler_factory: Creates the unpickler that restores records
+        """
+        self.path = path
+        self.__pickler = pickler_factory()
+        self.__unpickler = unpickler_factory()
+        self.__lock = threading.Lock()
+        # Picklers and unpicklers keep state while they run, so each of them is used by a single thread at a time. They
+        # are guarded by locks of their own, so serializing records does not block access to the files.
+        self.__pickler_lock = threading.Lock()
+        self.__unpickler_lock = threading.Lock()
+
+        # An empty data file (Ex. one that was created by the caller) is initialized like a new one.
+        is_new_log = not os.path.exists(path) or os.path.getsize(path) == 0
+        is_missing_index = not os.path.exists(_index_path(path))
+        self.__data_file = open(path, "a+b")
+        # The index is updated in place upon deletion, so it can't be opened in append mode.
+        open(_index_path(path), "ab").close()
+        self.__index_file = open(_index_path(path), "r+b")
+        self.__data_map = _MappedFile(self.__data_file)
+        self.__index_map = _MappedFile(self.__index_file)
+        if is_new_log:
+            self.__data_file.write(LOG_MAGIC)
+            self.__data_file.flush()
+        elif self.__read_magic() != LOG_MAGIC:
+            self.close()
+            raise UnpicklingError(f"{path} is not a kelpickle record log")
+        elif is_missing_index:
+            self.__rebuild_index()
+
+        self.__data_size = os.fstat(self.__data_file.fileno()).st_size
+        self.__index_size = os.fstat(self.__index_file.fileno()).st_size
+        if self.__index_size % _INDEX_ENTRY.size:
+            self.close()
+            raise UnpicklingError(f"The index of {path} is corrupted. Compact the log in order to rebuild it")
+
+        self.__next_record_id = self.__last_record_id() + 1
+
+    def __enter__(self) -> RecordLog:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__data_map.close()
+            self.__index_map.close()
+            self.__data_file.close()
+            self.__index_file.close()
+
+    def __read_magic(self) -> bytes:
+        self.__data_file.seek(0)
+        return self.__data_file.read(len(LOG_MAGIC))
+
+    def __rebuild_index(self) -> None:
+        """
+        Write the index entries of the live records of the data file. Like "compact", the ids of deleted records at the
+        end of the log may be given to new records.
+        """
+        data_size = os.fstat(self.__data_file.fileno()).st_size
+        if data_size == len(LOG_MAGIC):
+            return
+
+        live_frames = _scan_live_frames(self.__data_map.view(data_size))
+        self.__index_file.write(b"".join(
+            _INDEX_ENTRY.pack(record_id, payload_offset - _FRAME_HEADER.size)
+            for record_id, (payload_offset, _) in sorted(live_frames.items())
+        ))
+        self.__index_file.flush()
+
+    @property
+    def __entries_count(self) -> int:
+        return self.__index_size // _INDEX_ENTRY.size
+
+    def __read_entry(self, entry_index: int) -> tuple[int, int]:
+        entry_offset = entry_index * _INDEX_ENTRY.size
+        index_view = self.__index_map.view(entry_offset + _INDEX_ENTRY.size)
+        return _INDEX_ENTRY.unpack_from(index_view, entry_offset)
+
+    def __last_record_id(self) -> int:
+        if not self.__entries_count:
+            return -1
+
+        return self.__read_entry(self.__entries_count - 1)[0]
+
+    def __write_frame(self, record_id: int, payload: Optional[bytes]) -> None:
+        frame_offset = self.__data_size
+        if payload is None:
+            frame = _FRAME_HEADER.pack(record_id, _TOMBSTONE_LENGTH)
+        else:
+            frame = _FRAME_HEADER.pack(record_id, len(payload)) + payload
+
+        # The frame is written before its index entry, so the index never points beyond the data file.
+        self.__data_file.write(frame)
+        self.__data_file.flush()
+        self.__data_size += len(frame)
+        if payload is None:
+            return
+
+        self.__index_file.seek(self.__index_size)
+        self.__index_file.write(_INDEX_ENTRY.pack(record_id, frame_offset))
+        self.__index_file.flush()
+        self.__index_size += _INDEX_ENTRY.size
+
+    def append(self, instance: Any) -> int:
+        """
+        Serialize the given instance as a new record.
+
+        :param instance: The instance to serialize
+        :return: The id of the new record
+        """
+        with self.__pickler_lock:
+            payload = self.__pickler.pickle(instance).encode("utf-8", "surrogatepass")
+        with self.__lock:
+            record_id = self.__next_record_id
+            self.__write_frame(record_id, payload)
+            self.__next_record_id += 1
+
+        return record_id
+
+    def delete(self, record_id: int) -> None:
+        """
+        Delete the given record. The space of the record is only reclaimed once the log is compacted.
+
+        :param record_id: The id of the record to delete
+        """
+        with self.__lock:
+            entry_index = self.__find_entry(record_id)
+            if entry_index is None:
+                raise KeyError(record_id)
+
+            # The tombstone allows "compact" to recover the deletion even without the index.
+            self.__write_frame(record_id, None)
+            self.__index_file.seek(entry_index * _INDEX_ENTRY.size)
+            self.__index_file.write(_INDEX_ENTRY.pack(record_id, _DELETED_OFFSET))
+            self.__index_file.flush()
+
+    def __find_entry(self, record_id: int) -> Optional[int]:
+        """
+        Binary search the index for the entry of the given record.
+
+        :return: The index of the entry, or None if the record does not exist (or was deleted).
+        """
+        low, high = 0, self.__entries_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.__read_entry(middle)[0] < record_id:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == self.__entries_count:
+            return None
+
+        found_record_id, frame_offset = self.__read_entry(low)
+        if found_record_id != record_id or frame_offset == _DELETED_OFFSET:
+            return None
+
+        return low
+
+    def __find_frame(self, record_id: int) -> Optional[tuple[int, int]]:
+        """
+        :return: The offset and length of the serialized record, or None if it does not exist (or was deleted).
+        """
+        entry_index = self.__find_entry(record_id)
+        if entry_index is None:
+            return None
+
+        _, frame_offset = self.__read_entry(entry_index)
+        data_view = self.__data_map.view(frame_offset + _FRAME_HEADER.size)
+        _, payload_length = _FRAME_HEADER.unpack_from(data_view, frame_offset)
+        return frame_offset + _FRAME_HEADER.size, payload_length
+
+    def __read_payload(self, record_id: int) -> Optional[bytes]:
+        with self.__lock:
+            frame = self.__find_frame(record_id)
+            if frame is None:
+                return None
+
+            payload_offset, payload_length = frame
+            return self.__data_map.view(payload_offset + payload_length)[payload_offset:payload_offset + payload_length]
+
+    def __contains__(self, record_id: int) -> bool:
+        with self.__lock:
+            return self.__find_frame(record_id) is not None
+
+    def __getitem__(self, record_id: int) -> Any:
+        payload = self.__read_payload(record_id)
+        if payload is None:
+            raise KeyError(record_id)
+
+        return self.__unpickle(payload)
+
+    def get(self, record_id: int, default: Any = None) -> Any:
+        payload = self.__read_payload(record_id)
+        if payload is None:
+            return default
+
+        return self.__unpickle(payload)
+
+    def __unpickle(self, payload: bytes) -> Any:
+        with self.__unpickler_lock:
+            return self.__unpickler.unpickle(payload)
+
+    def record_ids(self) -> Iterator[int]:
+        """
+        Iterate over the ids of the existing records, in increasing order.
+        """
+        for entry_index in range(self.__entries_count):
+            with self.__lock:
+                record_id, frame_offset = self.__read_entry(entry_index)
+
+            if frame_offset != _DELETED_OFFSET:
+                yield record_id
+
+    def __iter__(self) -> Iterator[int]:
+        return self.record_ids()
+
+
+def compact(path: str) -> None:
+    """
+    Rewrite the given log without its deleted records, and rebuild its index from the data file. Record ids are kept
+    (although the ids of deleted records at the end of the log may be given to new records).
+    The compacted files replace the original ones only once they are complete, so an interrupted compaction leaves the
+    original log intact. The log must not be in use while it's being compacted.
+
+    :param path: The path of the data file of the log
+    """
+    # Frames are scanned directly (instead of through the index) so a missing or corrupted index can be recovered.
+    with open(path, "rb") as data_file:
+        if data_file.read(len(LOG_MAGIC)) != LOG_MAGIC:
+            raise UnpicklingError(f"{path} is not a kelpickle record log")
+
+        if os.fstat(data_file.fileno()).st_size == len(LOG_MAGIC):
+            live_frames: dict[int, tuple[int, int]] = {}
+            data_view: Any = b""
+        else:
+            data_view = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+            live_frames = _scan_live_frames(data_view)
+
+        compacted_path = f"{path}.compacting"
+        try:
+            with (
+                    open(compacted_path, "wb") as compacted_data,
+                    open(_index_path(compacted_path), "wb") as compacted_index,
+            ):
+                compacted_data.write(LOG_MAGIC)
+                frame_offset = len(LOG_MAGIC)
+                for record_id in sorted(live_frames):
+                    payload_offset, payload_length = live_frames[record_id]
+                    compacted_data.write(_FRAME_HEADER.pack(record_id, payload_length))
+                    compacted_data.write(data_view[payload_offset:payload_offset + payload_length])
+                    compacted_index.write(_INDEX_ENTRY.pack(record_id, frame_offset))
+                    frame_offset += _FRAME_HEADER.size + payload_length
+        finally:
+            if isinstance(data_view, mmap.mmap):
+                data_view.close()
+
+    os.replace(compacted_path, path)
+    os.replace(_index_path(compacted_path), _index_path(path))
+
+
+def _scan_live_frames(data_view: mmap.mmap) -> dict[int, tuple[int, int]]:
+    live_frames: dict[int, tuple[int, int]] = {}
+    frame_offset = len(LOG_MAGIC)
+    data_size = len(data_view)
+    while frame_offset + _FRAME_HEADER.size <= data_size:
+        record_id, payload_length = _FRAME_HEADER.unpack_from(data_view, frame_offset)
+        payload_offset = frame_offset + _FRAME_HEADER.size
+        if payload_length == _TOMBSTONE_LENGTH:
+            live_frames.pop(record_id, None)
+            frame_offset = payload_offset
+            continue
+
+        if payload_offset + payload_length > data_size:
+            # A frame that was only partially written (Ex. the process was killed while appending it)
+            break
+
+        live_frames[record_id] = (payload_offset, payload_length)
+        frame_offset = payload_offset + payload_length
+
+    return live_frames
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Any, Callable, Optional
+
+from kelpickle.common import Jsonable
+from kelpickle.deduplication import structural_key
+
+_IMMUTABLE_TYPES = frozenset({tuple, frozenset, bytes, datetime, date, time, timedelta})
+_type_to_cacheability: dict[type, bool] = {}
+
+
+def is_cacheable_type(instance_type: type) -> bool:
+    """
+    Check whether instances of the given type may be immutable, so their reduced form may be reused as long as they
+    live. Only a quick filter, since immutable containers may still hold mutable members (Check ReductionCache.put).
+    """
+    is_cacheable = _type_to_cacheability.get(instance_type)
+    if is_cacheable is None:
+        dataclass_params = getattr(instance_type, "__dataclass_params__", None)
+        is_cacheable = (
+            instance_type in _IMMUTABLE_TYPES or
+            issubclass(instance_type, tzinfo) or
+            (dataclass_params is not None and dataclass_params.frozen)
+        )
+        _type_to_cacheability[instance_type] = is_cacheable
+
+    return is_cacheable
+
+
+class _StrongReference:
+    """
+    Used for instances that do not support weak references. Keeping them alive ensures their id will not be reused by
+    another instance while they are cached.
+    """
+    __slots__ = ("__instance",)
+
+    def __init__(self, instance: Any) -> None:
+        self.__instance = instance
+
+    def __call__(self) -> Any:
+        return self.__instance
+
+
+@dataclass(frozen=True, slots=True)
+class CachedReduction:
+    reduced_instance: Jsonable
+    # The members that were recorded (and may therefore be referenced) while reducing the instance, alongside their
+    # references relative to the instance.
+    members: tuple[tuple[str, Any], ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    instance_reference: Callable[[], Any]
+    reduction: CachedReduction
+
+
+@dataclass(frozen=True, slots=True)
+class ReductionCacheStatistics:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ReductionCache:
+    """
+    Cache of the reduced form of immutable (and hashable) instances, which may be shared by picklers across calls.
+    Entries are keyed by the identity of the instances. Instances that support weak references are evicted once they
+    are garbage collected, the rest are kept alive for as long as they are cached. Once the cache is full, the least
+    recently used entries are evicted.
+    """
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size = max_size
+        self.__entries: OrderedDict[int, _CacheEntry] = OrderedDict()
+        self.__lock = threading.Lock()
+        # Weak reference callbacks may run at any point (even while the lock is held by the same thread), so they
+        # only mark entries for removal. The entries are removed upon the next access to the cache.
+        self.__pending_removals: list[tuple[int, weakref.ref[Any]]] = []
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __remove_pending(self) -> None:
+        while self.__pending_removals:
+            instance_id, instance_reference = self.__pending_removals.pop()
+            entry = self.__entries.get(instance_id)
+            if entry is not None and entry.instance_reference is instance_reference:
+                del self.__entries[instance_id]
+                self.__evictions += 1
+
+    def get(self, instance: Any) -> Optional[Jsonable]:
+        """
+        Get the cached reduced form of the given instance.
+
+        :param instance: The instance to look up
+        :return: The reduced instance, or None if it's not cached
+        """
+        reduction = self.lookup(instance)
+        return None if reduction is None else reduction.reduced_instance
+
+    def lookup(self, instance: Any) -> Optional[CachedReduction]:
+        """
+        Get the cached reduction of the given instance, including the members that were recorded while reducing it.
+
+        :param instance: The instance to look up
+        :return: The cached reduction, or None if it's not cached
+        """
+        instance_id = id(instance)
+        with self.__lock:
+            self.__remove_pending()
+            entry = self.__entries.get(instance_id)
+            if entry is None or entry.instance_reference() is not instance:
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(instance_id)
+            self.__hits += 1
+            return entry.reduction
+
+    def put(self, instance: Any, reduced_instance: Jsonable, *, members: tuple[tuple[str, Any], ...] = ()) -> None:
+        """
+        Cache the reduced form of the given instance. Instances that are not deeply immutable (Ex. tuples that hold
+        mutable members) are ignored, since their reduced form may change while they live.
+
+        :param instance: The reduced instance
+        :param reduced_instance: The reduced form of the instance
+        :param members: The members that were recorded while reducing the instance, alongside their relative references
+        """
+        if structural_key(instance) is None:
+            return
+
+        instance_id = id(instance)
+        instance_reference: Callable[[], Any]
+        try:
+            instance_reference = weakref.ref(
+                instance,
+                lambda reference: self.__pending_removals.append((instance_id, reference))
+            )
+        except TypeError:
+            instance_reference = _StrongReference(instance)
+
+        with self.__lock:
+            self.__remove_pending()
+            self.__entries[instance_id] = _CacheEntry(instance_reference, CachedReduction(reduced_instance, members))
+            self.__entries.move_to_end(instance_id)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__pending_removals.clear()
+
+    def statistics(self) -> ReductionCacheStatistics:
+        with self.__lock:
+            self.__remove_pending()
+            return ReductionCacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                size=len(self.__entries),
+            )
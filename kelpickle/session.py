@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from typing import Any, Optional, TypedDict
+
+from kelpickle.common import Jsonable, SAVED_WORDS_PREFIX
+from kelpickle.errors import SessionOutOfSync, UnpicklingError
+from kelpickle.kelpickling import Pickler, Unpickler, SerializedInstance
+from kelpickle.reduction_cache import ReductionCache
+
+SESSION_KEY = f"{SAVED_WORDS_PREFIX}session"
+MESSAGE_KEY = "value"
+
+
+class SessionHeader(TypedDict):
+    message: int
+    retained: int
+    reset: bool
+
+
+def _message_root_key(message: int) -> str:
+    # Every message is reduced under its own root, so references to instances of previous messages never collide with
+    # the references of the current one.
+    return f"$MSG{message}"
+
+
+class SessionPickler(Pickler):
+    """
+    The sending side of a session. Instances that were already sent within one of the last "max_retained_messages"
+    messages are sent as references only.
+
+    Much like pickle's memo, instances are recognized by their identity. An instance that was modified after it was
+    sent will still be sent as a reference, so the session should be reset (or the instance forgotten) after modifying
+    previously sent instances.
+    """
+    def __init__(self, *, max_retained_messages: int = 64, reduction_cache: Optional[ReductionCache] = None) -> None:
+        """
+        :param max_retained_messages: The number of previous messages whose instances may be referenced. The receiving
+                                      side has to retain the same number of messages.
+        :param reduction_cache: Check Pickler's documentation
+        """
+        super().__init__(reduction_cache=reduction_cache)
+        self.max_retained_messages = max_retained_messages
+        self.__next_message = 0
+        self.__reset_pending = True
+        # The references that were recorded during each of the retained messages, alongside their instances. The
+        # instances are kept alive, so their ids will not be reused by other instances while they are referenced.
+        self.__message_references: OrderedDict[int, list[tuple[str, Any]]] = OrderedDict()
+        self.__current_message_references: list[tuple[str, Any]] = []
+
+    def reset(self) -> None:
+        """
+        Forget every previously sent instance. The next message will instruct the receiving side to do the same, so
+        this is how a session is resynchronized once the receiving side has failed to restore a message.
+        """
+        self.__message_references.clear()
+        self._clean_cache()
+        self.__reset_pending = True
+
+    def pickle(self, instance: Any) -> str:
+        """
+        serialize the given python object as the next message of the session.
+
+        :param instance: The instance to serialize
+        :return: The serialized message
+        """
+        message = self.__next_message
+        self.__evict_messages_before(message - self.max_retained_messages)
+
+        self.__current_message_references = []
+        try:
+            reduced_instance = self.reduce(instance, relative_key=_message_root_key(message))
+        except BaseException:
+            # The receiving side will never see this message, so nothing that was recorded during it may be referenced.
+            for reference, _ in self.__current_message_references:
+                self._forget_reference(reference)
+            raise
+        finally:
+            self.current_path.clear()
+
+        self.__message_references[message] = self.__current_message_references
+        header: SessionHeader = {
+            "message": message,
+            "retained": self.max_retained_messages,
+            "reset": self.__reset_pending,
+        }
+        self.__next_message += 1
+        self.__reset_pending = False
+
+        return json.dumps({SESSION_KEY: header, MESSAGE_KEY: reduced_instance})
+
+    def _record_reference(self, instance: Any, reference: str) -> None:
+        super()._record_reference(instance, reference)
+        self.__current_message_references.append((reference, instance))
+
+    def __evict_messages_before(self, message: int) -> None:
+        while self.__message_references and next(iter(self.__message_references)) < message:
+            _, references = self.__message_references.popitem(last=False)
+            for reference, _ in references:
+                self._forget_reference(reference)
+
+
+class SessionUnpickler(Unpickler):
+    """
+    The receiving side of a session. Messages must be restored in the order they were sent. If a message is missing,
+    the session is out of sync until the sending side is reset.
+    """
+    def __init__(self, *, max_retained_messages: int = 64) -> None:
+        """
+        :param max_retained_messages: The maximal number of previous messages the sending side may reference. Messages
+                                      that require more than that are rejected.
+        """
+        super().__init__()
+        self.max_retained_messages = max_retained_messages
+        self.__expected_message: Optional[int] = None
+        self.__message_references: OrderedDict[int, list[str]] = OrderedDict()
+        self.__current_message_references: list[str] = []
+
+    def reset(self) -> None:
+        """
+        Forget every previously received instance. Messages will be rejected until a message of a reset sending side
+        is received.
+        """
+        self.__message_references.clear()
+        self._clear_cache()
+        self.__expected_message = None
+
+    def unpickle(self, serialized_instance: SerializedInstance) -> Any:
+        """
+        Deserialize the next message of the session.
+
+        :param serialized_instance: A message that was serialized by SessionPickler.pickle
+        :return: The deserialized instance
+        """
+        # Anything but a dict with the expected keys is rejected below.
+        document: Any = self._parse(serialized_instance)
+        try:
+            header: SessionHeader = document[SESSION_KEY]
+            reduced_instance: Jsonable = document[MESSAGE_KEY]
+            message = header["message"]
+            retained_messages = header["retained"]
+            reset = header["reset"]
+        except (KeyError, TypeError) as e:
+            raise UnpicklingError("The given message is not a valid kelpickle session message") from e
+
+        if reset:
+            self.reset()
+        elif message != self.__expected_message:
+            expected_message = self.__expected_message
+            self.reset()
+            raise SessionOutOfSync(f"Received message {message} while expecting message {expected_message}. The "
+                                   f"sending side has to be reset.")
+
+        if retained_messages > self.max_retained_messages:
+            self.reset()
+            raise SessionOutOfSync(f"The sending side retains {retained_messages} messages, while at most "
+                                   f"{self.max_retained_messages} messages may be retained")
+
+        self.__evict_messages_before(message - retained_messages)
+        self.__current_message_references = []
+        try:
+            result = self._restore_document(reduced_instance, relative_key=_message_root_key(message))
+        except BaseException:
+            # The sending side considers the message as delivered, so we can no longer restore the messages after it.
+            self.reset()
+            raise
+        finally:
+            self.current_path.clear()
+
+        self.__message_references[message] = self.__current_message_references
+        self.__expected_message = message + 1
+
+        return result
+
+    def _record_reference(self, instance: Any) -> None:
+        super()._record_reference(instance)
+        self.__current_message_references.append(self.generate_current_reference())
+
+    def __evict_messages_before(self, message: int) -> None:
+        while self.__message_references and next(iter(self.__message_references)) < message:
+            _, references = self.__message_references.popitem(last=False)
+            for reference in references:
+                self._forget_reference(reference)
+
+
+class Session:
+    """
+    Both sides of a connection: Messages are sent through a SessionPickler and received through a SessionUnpickler.
+    """
+    def __init__(self, *, max_retained_messages: int = 64, reduction_cache: Optional[ReductionCache] = None) -> None:
+        self.pickler = SessionPickler(max_retained_messages=max_retained_messages, reduction_cache=reduction_cache)
+        self.unpickler = SessionUnpickler(max_retained_messages=max_retained_messages)
+
+    def send(self, instance: Any) -> str:
+        return self.pickler.pickle(instance)
+
+    def receive(self, serialized_message: str) -> Any:
+        return self.unpickler.unpickle(serialized_message)
+
+    def resync(self) -> None:
+        """
+        Reset the sending side. Should be called once the other side reports its receiving side is out of sync.
+        """
+        self.pickler.reset()
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import sqlite3
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Iterator, Mapping, MutableMapping, Optional
+
+from kelpickle.kelpickling import Pickler, Unpickler
+
+_TABLE_NAME = "kelpickle_shelf"
+# SQLite limits the number of parameters of a single statement (999 on older versions).
+_MAX_QUERY_PARAMETERS = 900
+_DELETED = object()
+
+
+class Shelf(MutableMapping[str, Any]):
+    """
+    A persistent mapping of strings to python objects, much like "shelve", stored in an SQLite database.
+
+    Writes are buffered and committed in batches, within a single transaction each. Restored instances are kept in a
+    bounded LRU cache, so reading a recently used key does not unpickle it again. Much like shelve (without writeback),
+    modifying an instance that was read from the shelf does not modify the shelf. Unlike shelve, the same (cached)
+    instance may be returned by multiple reads, so instances should be set again after they are modified.
+    """
+    def __init__(
+            self,
+            path: str,
+            *,
+            cache_size: int = 1024,
+            batch_size: int = 256,
+            pickler_factory: Callable[[], Pickler] = Pickler,
+            unpickler_factory: Callable[[], Unpickler] = Unpickler,
+    ) -> None:
+        """
+        :param path: The path of the database. It's created if it does not exist.
+        :param cache_size: The maximal number of restored instances to cache
+        :param batch_size: The number of buffered writes that trigger a commit
+        :param pickler_factory: Creates the pickler that serializes the values
+        :param unpickler_factory: Creates the unpickler that restores the values
+        """
+        self.path = path
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self.__pickler = pickler_factory()
+        self.__unpickler = unpickler_factory()
+        self.__connection: Optional[sqlite3.Connection] = sqlite3.connect(path)
+        self.__connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {_TABLE_NAME} (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self.__connection.commit()
+        # The serialized values that are yet to be written (or _DELETED for keys that are yet to be deleted).
+        self.__pending_writes: dict[str, Any] = {}
+        self.__cache: OrderedDict[str, Any] = OrderedDict()
+
+    def __enter__(self) -> Shelf:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    @property
+    def __open_connection(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            raise ValueError("Invalid operation on a closed shelf")
+
+        return self.__connection
+
+    def close(self) -> None:
+        if self.__connection is None:
+            return
+
+        self.sync()
+        self.__connection.close()
+        self.__connection = None
+        self.__cache.clear()
+
+    def sync(self) -> None:
+        """
+        Commit the buffered writes.
+        """
+        if not self.__pending_writes:
+            return
+
+        upserts = [(key, value) for key, value in self.__pending_writes.items() if value is not _DELETED]
+        deletions = [(key,) for key, value in self.__pending_writes.items() if value is _DELETED]
+        with self.__open_connection as connection:
+            connection.executemany(f"INSERT OR REPLACE INTO {_TABLE_NAME} (key, value) VALUES (?, ?)", upserts)
+            connection.executemany(f"DELETE FROM {_TABLE_NAME} WHERE key = ?", deletions)
+
+        self.__pending_writes.clear()
+
+    def __cache_instance(self, key: str, instance: Any) -> None:
+        if self.cache_size <= 0:
+            return
+
+        self.__cache[key] = instance
+        self.__cache.move_to_end(key)
+        while len(self.__cache) > self.cache_size:
+            self.__cache.popitem(last=False)
+
+    def __write(self, key: str, serialized_value: Any) -> None:
+        self.__pending_writes[key] = serialized_value
+        if len(self.__pending_writes) >= self.batch_size:
+            self.sync()
+
+    def __fetch_serialized(self, keys: list[str]) -> dict[str, str]:
+        """
+        Fetch the serialized values of the given keys, preferring the buffered writes over the database.
+        """
+        serialized_values: dict[str, str] = {}
+        missing_keys: list[str] = []
+        for key in keys:
+            pending_value = self.__pending_writes.get(key)
+            if pending_value is None:
+                missing_keys.append(key)
+            elif pending_value is not _DELETED:
+                serialized_values[key] = pending_value
+
+        connection = self.__open_connection
+        for chunk_start in range(0, len(missing_keys), _MAX_QUERY_PARAMETERS):
+            chunk = missing_keys[chunk_start:chunk_start + _MAX_QUERY_PARAMETERS]
+            placeholders = ", ".join("?" * len(chunk))
+            serialized_values.update(connection.execute(
+                f"SELECT key, value FROM {_TABLE_NAME} WHERE key IN ({placeholders})",
+                chunk
+            ))
+
+        return serialized_values
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Get the values of multiple keys at once. The values that are not cached are fetched by a single query (per
+        chunk of keys) and restored one after the other.
+
+        :param keys: The keys to look up
+        :return: The values of the given keys that exist in the shelf
+        """
+        keys = list(keys)
+        instances: dict[str, Any] = {}
+        uncached_keys: list[str] = []
+        for key in keys:
+            if key in self.__cache:
+                self.__cache.move_to_end(key)
+                instances[key] = self.__cache[key]
+            else:
+                uncached_keys.append(key)
+
+        for key, serialized_value in self.__fetch_serialized(uncached_keys).items():
+            instance = self.__unpickler.unpickle(serialized_value)
+            self.__cache_instance(key, instance)
+            instances[key] = instance
+
+        # Keep the order of the given keys
+        return {key: instances[key] for key in keys if key in instances}
+
+    def set_many(self, items: Mapping[str, Any] | Iterable[tuple[str, Any]]) -> None:
+        """
+        Set multiple values at once. The values are serialized one after the other and committed in a single
+        transaction.
+
+        :param items: A mapping (or pairs) of keys and values
+        """
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            self.__pending_writes[key] = self.__pickler.pickle(value)
+            self.__cache.pop(key, None)
+
+        self.sync()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__cache:
+            self.__cache.move_to_end(key)
+            return self.__cache[key]
+
+        serialized_value = self.__fetch_serialized([key]).get(key)
+        if serialized_value is None:
+            raise KeyError(key)
+
+        instance = self.__unpickler.unpickle(serialized_value)
+        self.__cache_instance(key, instance)
+        return instance
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.__write(key, self.__pickler.pickle(value))
+        # The given instance is not cached, since the caller may keep modifying it. It's restored on the next read.
+        self.__cache.pop(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        self.__cache.pop(key, None)
+        self.__write(key, _DELETED)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self.__cache:
+            return True
+
+        pending_value = self.__pending_writes.get(key) if isinstance(key, str) else None
+        if pending_value is not None:
+            return pending_value is not _DELETED
+
+        row = self.__open_connection.execute(f"SELECT 1 FROM {_TABLE_NAME} WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __iter__(self) -> Iterator[str]:
+        self.sync()
+        for (key,) in self.__open_connection.execute(f"SELECT key FROM {_TABLE_NAME}"):
+            yield key
+
+    def __len__(self) -> int:
+        self.sync()
+        (length,) = self.__open_connection.execute(f"SELECT COUNT(*) FROM {_TABLE_NAME}").fetchone()
+        return int(length)
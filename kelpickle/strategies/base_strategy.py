@@ -1,4 +1,6 @@
 from __future__ import annotations
+import importlib
+import threading
 from abc import ABCMeta, abstractmethod
 from typing import Generic, TypeVar, final, Type, Callable, Optional, TYPE_CHECKING, Sequence
 
@@ -17,6 +19,20 @@ __superclass_to_pickling_strategy: dict[type, BaseStrategy] = {}
 __name_to_strategy: dict[str, BaseStrategy] = {}
 __reduced_type_to_strategy: dict[type, BaseStrategy] = {}
 
+# Strategies that were declared but not yet imported. Both map to the module that registers the strategy upon import.
+__lazy_type_name_to_module: dict[str, str] = {}
+__lazy_strategy_name_to_module: dict[str, str] = {}
+
+# Cache of the result of the strategy lookup for every type (including the types that rely on a superclass strategy).
+# The cache is never cleared in place. It is replaced as a whole instead, so lookups that were already in progress
+# while a strategy was registered can only populate the old cache.
+__resolved_pickling_strategies: dict[type, BaseStrategy] = {}
+
+# Lookups never take this lock. They only read from the registries, which are always modified while holding it.
+# Modules of lazy strategies are never imported while holding it, since they register their strategies (which takes
+# it) while holding their import lock.
+__registration_lock = threading.RLock()
+
 
 class BaseStrategy(Generic[T, ReducedT], metaclass=ABCMeta):
     @final
@@ -33,6 +49,12 @@ class BaseStrategy(Generic[T, ReducedT], metaclass=ABCMeta):
         self.supported_types = supported_types
         self.consider_subclasses = consider_subclasses
         self.is_json_native = is_json_native
+        # The batch hooks are only used by the picklers if they were overridden, since the default implementations gain
+        # nothing over handling the instances one by one.
+        self.batches_reductions = type(self).reduce_many is not BaseStrategy.reduce_many
+        self.batches_restorations = type(self).restore_many is not BaseStrategy.restore_many
+        self.restores_while_parsing = type(self).restore_while_parsing is not BaseStrategy.restore_while_parsing
+        self.restores_in_place = type(self).restore_in_place is not BaseStrategy.restore_in_place
 
     @abstractmethod
     def reduce(self, *, instance: T, pickler: Pickler) -> ReducedT:
@@ -45,6 +67,98 @@ class BaseStrategy(Generic[T, ReducedT], metaclass=ABCMeta):
     def restore_rest(self, *, reduced_instance: ReducedT, unpickler: Unpickler, base_instance: T) -> None:
         return base_instance
 
+    def restore_while_parsing(self, reduced_instance: ReducedT) -> Optional[T]:
+        """
+        Restore an instance as soon as its reduced form is parsed, before its place within the document is known.
+        This is only possible if the reduced instance contains nothing the unpickler has to restore, so implementations
+        should return None for reduced instances they cannot restore on their own.
+
+        :param reduced_instance: The reduced instance
+        :return: The restored instance, or None
+        """
+        return None
+
+    def accepts_subclass(self, subclass: type) -> bool:
+        """
+        Whether instances of the given subclass of one of the supported types may be reduced by this strategy. Only
+        consulted for strategies that consider subclasses. Subclasses that are rejected are looked up further along
+        their MRO.
+
+        :param subclass: The subclass (The result is cached per subclass)
+        """
+        return True
+
+    def can_restore_in_place(self, *, reduced_instance: ReducedT, target: object) -> bool:
+        """
+        Whether the given existing instance can be updated in place, so it becomes equal to the given reduced instance.
+
+        :param reduced_instance: The reduced instance
+        :param target: The existing instance
+        """
+        return False
+
+    def restore_in_place(self, *, reduced_instance: ReducedT, unpickler: Unpickler, target: T) -> None:
+        """
+        Update an existing instance in place, so it becomes equal to the given reduced instance. Only called if
+        "can_restore_in_place" allowed it. Implementations are encouraged to restore the members of the instance using
+        Unpickler.restore_in_place as well, so the existing members are reused.
+
+        :param reduced_instance: The reduced instance
+        :param unpickler: The unpickler
+        :param target: The instance to update
+        """
+        raise NotImplementedError()
+
+    def reduce_many(self, *, instances: Sequence[T], relative_keys: Sequence[str], pickler: Pickler) -> list[ReducedT]:
+        """
+        Reduce a run of sibling instances at once. The pickler has already taken care of their references, so
+        overriding implementations only need to reduce them (reducing their members under their relative keys).
+
+        Overriding this is only correct if the instances can never contain one another (Ex. dates, but not tuples).
+
+        :param instances: The instances to reduce
+        :param relative_keys: The relative key of each of the instances
+        :param pickler: The pickler
+        :return: The reduced instances
+        """
+        reduced_instances = []
+        for instance, relative_key in zip(instances, relative_keys):
+            pickler.current_path.append(relative_key)
+            try:
+                reduced_instances.append(self.reduce(instance=instance, pickler=pickler))
+            finally:
+                pickler.current_path.pop()
+
+        return reduced_instances
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[ReducedT],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[T]:
+        """
+        Restore a run of sibling instances at once. The unpickler records their references once they are all
+        restored, so overriding this is only correct for strategies that restore everything in "restore_base".
+
+        :param reduced_instances: The instances to restore
+        :param relative_keys: The relative key of each of the instances
+        :param unpickler: The unpickler
+        :return: The restored instances
+        """
+        restored_instances = []
+        for reduced_instance, relative_key in zip(reduced_instances, relative_keys):
+            unpickler.current_path.append(relative_key)
+            try:
+                base_instance = self.restore_base(reduced_instance=reduced_instance, unpickler=unpickler)
+                self.restore_rest(reduced_instance=reduced_instance, unpickler=unpickler, base_instance=base_instance)
+                restored_instances.append(base_instance)
+            finally:
+                unpickler.current_path.pop()
+
+        return restored_instances
+
 
 _StrategyT = TypeVar('_StrategyT', bound=Type[BaseStrategy])
 
@@ -59,6 +173,8 @@ def _register_strategy(
         is_json_native: bool,
 ) -> Callable:
     def class_decorator(strategy_class: _StrategyT) -> _StrategyT:
+        global __resolved_pickling_strategies
+
         strategy = strategy_class(
             name=name,
             auto_generate_reduction_references=auto_generate_reduction_references,
@@ -67,30 +183,35 @@ def _register_strategy(
             is_json_native=is_json_native
         )
 
-        if __name_to_strategy.get(name) is not None:
-            raise StrategyConflictError(f"Cannot register strategy with name {name}. Name is already taken by "
-                                        f"{__name_to_strategy[name]}")
+        with __registration_lock:
+            if __name_to_strategy.get(name) is not None:
+                raise StrategyConflictError(f"Cannot register strategy with name {name}. Name is already taken by "
+                                            f"{__name_to_strategy[name]}")
 
-        __name_to_strategy[name] = strategy
+            __name_to_strategy[name] = strategy
 
-        if reduced_type is not None:
-            if __reduced_type_to_strategy.get(reduced_type) is not None:
-                raise StrategyConflictError(f"Cannot configure type {reduced_type} for strategy {strategy}. It "
-                                            f"is already configured to {__reduced_type_to_strategy[reduced_type]}")
-            __reduced_type_to_strategy[reduced_type] = strategy
+            if reduced_type is not None:
+                if __reduced_type_to_strategy.get(reduced_type) is not None:
+                    raise StrategyConflictError(f"Cannot configure type {reduced_type} for strategy {strategy}. It "
+                                                f"is already configured to {__reduced_type_to_strategy[reduced_type]}")
+                __reduced_type_to_strategy[reduced_type] = strategy
 
-        for supported_type in supported_types:
-            if __type_to_strategy.get(supported_type) is not None:
-                raise StrategyConflictError(f"Cannot configure type {supported_type} to strategy {strategy_class.__name__}."
-                                            f" It is already configured to strategy "
-                                            f"{__type_to_strategy[supported_type].__class__.__name__}")
-            __type_to_strategy[supported_type] = strategy
+            for supported_type in supported_types:
+                if __type_to_strategy.get(supported_type) is not None:
+                    raise StrategyConflictError(f"Cannot configure type {supported_type} to strategy "
+                                                f"{strategy_class.__name__}. It is already configured to strategy "
+                                                f"{__type_to_strategy[supported_type].__class__.__name__}")
+                __type_to_strategy[supported_type] = strategy
 
-            if consider_subclasses:
-                if __superclass_to_pickling_strategy.get(supported_type) is not None:
-                    raise StrategyConflictError(f"Cannot configure type {supported_type} for strategy {strategy}. It "
-                                                f"is already configured to {__superclass_to_pickling_strategy[supported_type]}")
-                __superclass_to_pickling_strategy[supported_type] = strategy
+                if consider_subclasses:
+                    if __superclass_to_pickling_strategy.get(supported_type) is not None:
+                        raise StrategyConflictError(f"Cannot configure type {supported_type} for strategy {strategy}. "
+                                                    f"It is already configured to "
+                                                    f"{__superclass_to_pickling_strategy[supported_type]}")
+                    __superclass_to_pickling_strategy[supported_type] = strategy
+
+            # The new strategy may change the lookup result of any type.
+            __resolved_pickling_strategies = {}
 
         return strategy_class
 
@@ -119,9 +240,10 @@ def register_core_strategy(
         *,
         auto_generate_reduction_references: bool,
         supported_type: type,
+        name: Optional[str] = None,
 ) -> Callable:
     return _register_strategy(
-        name=str(supported_type),
+        name=str(supported_type) if name is None else name,
         auto_generate_reduction_references=auto_generate_reduction_references,
         supported_types=(supported_type,),
         consider_subclasses=False,
@@ -130,22 +252,81 @@ def register_core_strategy(
     )
 
 
-def get_pickling_strategy_for(instance_type: type, /) -> BaseStrategy:
+def register_lazy_strategy(module_name: str, *, name: str, supported_type_names: Sequence[str]) -> None:
+    """
+    Declare a strategy without importing the module that registers it. The module will only be imported the first time
+    one of the given types (or one of their subclasses) or the given strategy name is looked up.
+
+    :param module_name: The module that registers the strategy once imported
+    :param name: The name of the strategy
+    :param supported_type_names: The full names ("module.qualname") of the types supported by the strategy
+    """
+    with __registration_lock:
+        __lazy_strategy_name_to_module[name] = module_name
+        for type_name in supported_type_names:
+            __lazy_type_name_to_module[type_name] = module_name
+
+
+def _import_lazy_strategy(module_name: str) -> None:
+    # The import system makes sure the module is executed once. Concurrent importers wait until it's done, by which
+    # point its strategies are registered.
+    importlib.import_module(module_name)
+    with __registration_lock:
+        for lazy_mapping in (__lazy_type_name_to_module, __lazy_strategy_name_to_module):
+            for key in [key for key, value in lazy_mapping.items() if value == module_name]:
+                del lazy_mapping[key]
+
+
+def _import_lazy_strategy_of_type(instance_type: type) -> None:
+    type_name = f"{instance_type.__module__}.{getattr(instance_type, '__qualname__', instance_type.__name__)}"
+    module_name = __lazy_type_name_to_module.get(type_name)
+    if module_name is not None:
+        _import_lazy_strategy(module_name)
+
+
+def _resolve_pickling_strategy(instance_type: type) -> BaseStrategy:
     strategy = __type_to_strategy.get(instance_type)
     if strategy is not None:
         return strategy
 
-    for base_class in instance_type.mro()[1:]:
-        strategy = __superclass_to_pickling_strategy.get(base_class)
+    if __lazy_type_name_to_module:
+        _import_lazy_strategy_of_type(instance_type)
+        strategy = __type_to_strategy.get(instance_type)
         if strategy is not None:
             return strategy
 
+    for base_class in instance_type.__mro__[1:]:
+        if __lazy_type_name_to_module:
+            _import_lazy_strategy_of_type(base_class)
+
+        strategy = __superclass_to_pickling_strategy.get(base_class)
+        if strategy is not None and strategy.accepts_subclass(instance_type):
+            return strategy
+
     raise UnsupportedPicklingType(f'Type {instance_type} has no viable strategy available to use')
 
 
+def get_pickling_strategy_for(instance_type: type, /) -> BaseStrategy:
+    resolved_pickling_strategies = __resolved_pickling_strategies
+    strategy = resolved_pickling_strategies.get(instance_type)
+    if strategy is None:
+        strategy = _resolve_pickling_strategy(instance_type)
+        resolved_pickling_strategies[instance_type] = strategy
+
+    return strategy
+
+
 def get_unpickling_strategy_for(reduced_type: Type[Jsonable], /) -> BaseStrategy:
     return __reduced_type_to_strategy[reduced_type]
 
 
 def get_strategy_named(strategy_name: str, /) -> BaseStrategy:
-    return __name_to_strategy[strategy_name]
+    strategy = __name_to_strategy.get(strategy_name)
+    if strategy is None:
+        module_name = __lazy_strategy_name_to_module.get(strategy_name)
+        if module_name is not None:
+            _import_lazy_strategy(module_name)
+
+        strategy = __name_to_strategy[strategy_name]
+
+    return strategy
@@ -1,6 +1,9 @@
 from __future__ import annotations
+import sys
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
+from kelpickle.common import STRATEGY_KEY
 from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
 
 if TYPE_CHECKING:
@@ -8,12 +11,26 @@ if TYPE_CHECKING:
 
 
 def _reduce_key(key: Any, pickler: Pickler, *, relative_key: str) -> str:
+    if type(key) is str:
+        # Strings are reduced to themselves. Skipping the reduction also ensures they will never be reduced by
+        # reference, which is not possible for keys.
+        return key
+
     reduced_key = pickler.reduce(key, relative_key=relative_key)
     assert isinstance(reduced_key, str), "Complex dict keys are not yet supported"
     # TODO: Add support for complex keys
     return reduced_key
 
 
+_MISSING = object()
+
+
+def _restore_key(key: str) -> str:
+    # Keys are usually repeated across many dicts (Ex. attribute names), so they are interned in order to share a
+    # single string between all of them.
+    return sys.intern(key)
+
+
 @register_strategy(
     name="dict",
     auto_generate_reduction_references=True,
@@ -27,7 +44,7 @@ class DictStrategy(BaseStrategy):
             #      in order to maintain readability and when reading the result manually as well as consistency between
             #      pickling and unpickling.
             _reduce_key(key, pickler, relative_key=f"{i}_KEY"): pickler.reduce(value, relative_key=str(i))
-            for i, (key, value) in enumerate(instance.items())
+            for i, (key, value) in enumerate(pickler.canonical_order(instance.items(), key=itemgetter(0)))
         }
 
     def restore_base(self, *, reduced_instance: dict, unpickler: Unpickler) -> dict:
@@ -35,4 +52,34 @@ class DictStrategy(BaseStrategy):
 
     def restore_rest(self, *, reduced_instance: dict, unpickler: Unpickler, base_instance: dict) -> None:
         for i, (key, value) in enumerate(reduced_instance.items()):
-            base_instance[unpickler.restore(key, relative_key=f"{i}_KEY")] = unpickler.restore(value, relative_key=str(i))
+            if key == STRATEGY_KEY:
+                continue
+
+            base_instance[_restore_key(key)] = unpickler.restore(value, relative_key=str(i))
+
+    def can_restore_in_place(self, *, reduced_instance: dict, target: object) -> bool:
+        return type(target) is dict
+
+    def restore_in_place(self, *, reduced_instance: dict, unpickler: Unpickler, target: dict) -> None:
+        restored_keys = []
+        for i, (key, value) in enumerate(reduced_instance.items()):
+            if key == STRATEGY_KEY:
+                continue
+
+            restored_key = _restore_key(key)
+            existing_value = target.get(restored_key, _MISSING)
+            if existing_value is _MISSING:
+                target[restored_key] = unpickler.restore(value, relative_key=str(i))
+            else:
+                target[restored_key] = unpickler.restore_in_place(value, relative_key=str(i), target=existing_value)
+            restored_keys.append(restored_key)
+
+        if len(target) != len(restored_keys):
+            kept_keys = set(restored_keys)
+            for removed_key in [key for key in target if key not in kept_keys]:
+                del target[removed_key]
+
+        if list(target) != restored_keys:
+            # Keep the order of the restored dict
+            for key in restored_keys:
+                target[key] = target.pop(key)
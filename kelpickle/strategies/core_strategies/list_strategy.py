@@ -1,25 +1,73 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeAlias
 
 from kelpickle.strategies.base_strategy import BaseStrategy, register_core_strategy
 if TYPE_CHECKING:
     from kelpickle.kelpickling import Pickler, Unpickler
 
-from kelpickle.common import JsonList
+from kelpickle.common import Json, JsonList
+
+LIST_STRATEGY_NAME = "list"
+# Shorter lists gain nothing from being packed
+MIN_PACKED_LENGTH = 16
+
+# Lists are reduced to JSON lists, unless they were packed into a dict (Check "pack_numeric_list").
+ReducedList: TypeAlias = JsonList | Json
+
+
+def _unpack_list(reduced_instance: Json) -> list:
+    # Imported upon first use, like any other custom strategy.
+    from kelpickle.strategies.custom_strategies.array_strategy import unpack_array
+
+    return unpack_array(reduced_instance["typecode"], reduced_instance["buffer"]).tolist()
 
 
 @register_core_strategy(
     auto_generate_reduction_references=True,
-    supported_type=list
+    supported_type=list,
+    name=LIST_STRATEGY_NAME
 )
 class ListStrategy(BaseStrategy):
-    def reduce(self, *, instance: list, pickler: Pickler) -> JsonList:
-        return [pickler.reduce(member, relative_key=str(i)) for i, member in enumerate(instance)]
+    def reduce(self, *, instance: list, pickler: Pickler) -> ReducedList:
+        if pickler.packs_numeric_lists and len(instance) >= MIN_PACKED_LENGTH and pickler._batching_allowed():
+            from kelpickle.strategies.custom_strategies.array_strategy import pack_numeric_list
+
+            packed_list = pack_numeric_list(instance)
+            if packed_list is not None:
+                return packed_list
+
+        return pickler.reduce_many(instance)
+
+    def restore_base(self, *, reduced_instance: ReducedList, unpickler: Unpickler) -> list:
+        if isinstance(reduced_instance, dict):
+            # Packed lists contain nothing but numbers, so they are restored as a whole.
+            return _unpack_list(reduced_instance)
 
-    def restore_base(self, *, reduced_instance: JsonList, unpickler: Unpickler) -> list:
         return []
 
-    def restore_rest(self, *, reduced_instance: list, unpickler: Unpickler, base_instance: list) -> None:
-        for i, member in enumerate(reduced_instance):
-            base_instance.append(unpickler.restore(member, relative_key=str(i)))
+    def restore_rest(self, *, reduced_instance: ReducedList, unpickler: Unpickler, base_instance: list) -> None:
+        if isinstance(reduced_instance, list):
+            base_instance.extend(unpickler.restore_many(reduced_instance))
+
+    def restore_while_parsing(self, reduced_instance: ReducedList) -> list:
+        # Only packed lists are parsed as dicts, and they contain nothing the unpickler has to restore.
+        assert isinstance(reduced_instance, dict), "JSON lists are never restored while parsing"
+        return _unpack_list(reduced_instance)
+
+    def can_restore_in_place(self, *, reduced_instance: ReducedList, target: object) -> bool:
+        return type(target) is list
+
+    def restore_in_place(self, *, reduced_instance: ReducedList, unpickler: Unpickler, target: list) -> None:
+        if isinstance(reduced_instance, dict):
+            target[:] = _unpack_list(reduced_instance)
+            return
+
+        existing_length = len(target)
+        for i, reduced_member in enumerate(reduced_instance):
+            if i < existing_length:
+                target[i] = unpickler.restore_in_place(reduced_member, relative_key=str(i), target=target[i])
+            else:
+                target.append(unpickler.restore(reduced_member, relative_key=str(i)))
+
+        del target[len(reduced_instance):]
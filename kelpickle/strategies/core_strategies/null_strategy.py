@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from types import NoneType
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, TypeVar, Sequence
 
 from kelpickle.strategies.base_strategy import BaseStrategy, register_core_strategy
 from kelpickle.common import JsonNative
@@ -25,3 +25,20 @@ class EmptyStrategy(BaseStrategy):
     def restore_base(self, *, reduced_instance: NativeT, unpickler: Unpickler) -> NativeT:
         return reduced_instance
 
+    def reduce_many(
+            self,
+            *,
+            instances: Sequence[NativeT],
+            relative_keys: Sequence[str],
+            pickler: Pickler
+    ) -> list[NativeT]:
+        return list(instances)
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[NativeT],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[NativeT]:
+        return list(reduced_instances)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import base64
+import sys
+from array import array
+from typing import Any, Optional, TypedDict
+
+from kelpickle.common import STRATEGY_KEY
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.strategies.core_strategies.list_strategy import LIST_STRATEGY_NAME
+from kelpickle.kelpickling import Pickler, Unpickler
+
+# Lists are packed into 8 byte items, so their range is never platform dependent.
+_INT_TYPECODE = "q"
+_FLOAT_TYPECODE = "d"
+
+# The items of these typecodes are as wide as their C types on the pickling platform, so they are packed as the fixed
+# width items they fit in on every platform. Unicode items are packed as UTF-32 for the same reason.
+_FIXED_WIDTH_TYPECODES = {"l": "q", "L": "Q"}
+_UNICODE_TYPECODE = "u"
+_UNICODE_ENCODING = "utf-32-le"
+
+_IS_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class ArrayReductionResult(TypedDict):
+    typecode: str
+    buffer: str
+
+
+def pack_array(instance: array) -> str:
+    """
+    Encode the items of the given array as a base64 buffer of little endian items, whose width doesn't depend on the
+    platform.
+    """
+    if instance.typecode == _UNICODE_TYPECODE:
+        return base64.b64encode(instance.tounicode().encode(_UNICODE_ENCODING)).decode("utf-8")
+
+    fixed_width_typecode = _FIXED_WIDTH_TYPECODES.get(instance.typecode, instance.typecode)
+    if fixed_width_typecode != instance.typecode or (_IS_BIG_ENDIAN and instance.itemsize > 1):
+        instance = array(fixed_width_typecode, instance)
+        if _IS_BIG_ENDIAN and instance.itemsize > 1:
+            instance.byteswap()
+
+    return base64.b64encode(instance.tobytes()).decode("utf-8")
+
+
+def unpack_array(typecode: str, buffer: str) -> array:
+    """
+    The counterpart of "pack_array".
+    """
+    if typecode == _UNICODE_TYPECODE:
+        return array(typecode, base64.b64decode(buffer).decode(_UNICODE_ENCODING))
+
+    fixed_width_typecode = _FIXED_WIDTH_TYPECODES.get(typecode, typecode)
+    instance = array(fixed_width_typecode)
+    instance.frombytes(base64.b64decode(buffer))
+    if _IS_BIG_ENDIAN and instance.itemsize > 1:
+        instance.byteswap()
+
+    if fixed_width_typecode != typecode:
+        # Raises an OverflowError for items that don't fit the C type on this platform.
+        instance = array(typecode, instance)
+
+    return instance
+
+
+def pack_numeric_list(instance: list) -> Optional[dict[str, Any]]:
+    """
+    Pack a list whose items are all ints (of 64 bits) or all floats.
+
+    :param instance: The list to pack
+    :return: The reduced list (restored by the ListStrategy), or None if it can't be packed
+    """
+    first_item_type = type(instance[0])
+    if first_item_type is float:
+        typecode = _FLOAT_TYPECODE
+    elif first_item_type is int:
+        typecode = _INT_TYPECODE
+    else:
+        return None
+
+    for item in instance:
+        if type(item) is not first_item_type:
+            return None
+
+    try:
+        packed_items = array(typecode, instance)
+    except OverflowError:
+        return None
+
+    return {"typecode": typecode, "buffer": pack_array(packed_items), STRATEGY_KEY: LIST_STRATEGY_NAME}
+
+
+@register_strategy(
+    name="array",
+    supported_types=array,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class ArrayStrategy(BaseStrategy):
+    def reduce(self, instance: array, pickler: Pickler) -> ArrayReductionResult:
+        return {"typecode": instance.typecode, "buffer": pack_array(instance)}
+
+    def restore_base(self, reduced_instance: ArrayReductionResult, unpickler: Unpickler) -> array:
+        return unpack_array(reduced_instance["typecode"], reduced_instance["buffer"])
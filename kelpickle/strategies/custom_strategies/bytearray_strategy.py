@@ -0,0 +1,36 @@
+from __future__ import annotations
+import base64
+from typing import TypedDict
+
+from kelpickle.kelpickling import Pickler, Unpickler
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+
+
+class BytearrayReductionResult(TypedDict):
+    buffer: str
+
+
+@register_strategy(
+    name='bytearray',
+    supported_types=bytearray,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class BytearrayStrategy(BaseStrategy):
+    def reduce(self, instance: bytearray, pickler: Pickler) -> BytearrayReductionResult:
+        return {'buffer': base64.b64encode(instance).decode('utf-8')}
+
+    def restore_base(self, *, reduced_instance: BytearrayReductionResult, unpickler: Unpickler) -> bytearray:
+        return bytearray(base64.b64decode(reduced_instance['buffer']))
+
+    def can_restore_in_place(self, *, reduced_instance: BytearrayReductionResult, target: object) -> bool:
+        return type(target) is bytearray
+
+    def restore_in_place(
+            self,
+            *,
+            reduced_instance: BytearrayReductionResult,
+            unpickler: Unpickler,
+            target: bytearray
+    ) -> None:
+        target[:] = base64.b64decode(reduced_instance['buffer'])
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import base64
-from typing import TypedDict
+from typing import TypedDict, Sequence
 
 from kelpickle.kelpickling import Pickler, Unpickler
 from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
@@ -17,3 +17,26 @@ class BytesStrategy(BaseStrategy):
 
     def restore_base(self, *, reduced_instance: BytesReductionResult, unpickler: Unpickler) -> bytes:
         return base64.b64decode(reduced_instance['buffer'])
+
+    def restore_while_parsing(self, reduced_instance: BytesReductionResult) -> bytes:
+        return base64.b64decode(reduced_instance['buffer'])
+
+    def reduce_many(
+            self,
+            *,
+            instances: Sequence[bytes],
+            relative_keys: Sequence[str],
+            pickler: Pickler
+    ) -> list[BytesReductionResult]:
+        encode = base64.b64encode
+        return [{'buffer': encode(instance).decode('utf-8')} for instance in instances]
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[BytesReductionResult],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[bytes]:
+        decode = base64.b64decode
+        return [decode(reduced_instance['buffer']) for reduced_instance in reduced_instances]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+from typing import TypedDict, Sequence
+
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class ComplexReductionResult(TypedDict):
+    real: float
+    imag: float
+
+
+@register_strategy(
+    name='complex',
+    supported_types=complex,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class ComplexStrategy(BaseStrategy):
+    def reduce(self, instance: complex, pickler: Pickler) -> ComplexReductionResult:
+        return {'real': instance.real, 'imag': instance.imag}
+
+    def restore_base(self, reduced_instance: ComplexReductionResult, unpickler: Unpickler) -> complex:
+        return complex(reduced_instance['real'], reduced_instance['imag'])
+
+    def restore_while_parsing(self, reduced_instance: ComplexReductionResult) -> complex:
+        return complex(reduced_instance['real'], reduced_instance['imag'])
+
+    def reduce_many(
+            self,
+            *,
+            instances: Sequence[complex],
+            relative_keys: Sequence[str],
+            pickler: Pickler
+    ) -> list[ComplexReductionResult]:
+        return [{'real': instance.real, 'imag': instance.imag} for instance in instances]
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[ComplexReductionResult],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[complex]:
+        return [complex(reduced_instance['real'], reduced_instance['imag']) for reduced_instance in reduced_instances]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from collections import Counter
+from operator import itemgetter
+from typing import TypedDict
+
+from kelpickle.common import JsonList
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.strategies.custom_strategies.mapping_utils import reduce_items, restore_items
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class CounterReductionResult(TypedDict):
+    items: JsonList
+
+
+@register_strategy(
+    name='counter',
+    supported_types=Counter,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class CounterStrategy(BaseStrategy):
+    def reduce(self, instance: Counter, pickler: Pickler) -> CounterReductionResult:
+        return {'items': reduce_items(pickler.canonical_order(instance.items(), key=itemgetter(0)), pickler)}
+
+    def restore_base(self, reduced_instance: CounterReductionResult, unpickler: Unpickler) -> Counter:
+        return Counter()
+
+    def restore_rest(
+            self,
+            *,
+            reduced_instance: CounterReductionResult,
+            unpickler: Unpickler,
+            base_instance: Counter
+    ) -> None:
+        restore_items(reduced_instance['items'], unpickler, base_instance)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TypedDict
+from typing import TypedDict, Sequence
 from datetime import date
 
 from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
@@ -19,3 +19,25 @@ class DateStrategy(BaseStrategy):
 
     def restore_base(self, reduced_instance: DateReductionResult, unpickler: Unpickler) -> date:
         return date.fromisoformat(reduced_instance['value'])
+
+    def restore_while_parsing(self, reduced_instance: DateReductionResult) -> date:
+        return date.fromisoformat(reduced_instance['value'])
+
+    def reduce_many(
+            self,
+            *,
+            instances: Sequence[date],
+            relative_keys: Sequence[str],
+            pickler: Pickler
+    ) -> list[DateReductionResult]:
+        return [{'value': instance.isoformat()} for instance in instances]
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[DateReductionResult],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[date]:
+        from_isoformat = date.fromisoformat
+        return [from_isoformat(reduced_instance['value']) for reduced_instance in reduced_instances]
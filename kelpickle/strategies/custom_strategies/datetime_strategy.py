@@ -1,6 +1,6 @@
 from __future__ import annotations
 from datetime import datetime
-from typing import TypedDict
+from typing import Optional, TypedDict, Sequence
 
 from kelpickle.common import Jsonable
 from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
@@ -27,3 +27,56 @@ class DatetimeStrategy(BaseStrategy):
         restored_datetime = datetime.fromisoformat(reduced_instance['value'])
 
         return restored_datetime.replace(fold=reduced_instance['fold'], tzinfo=restored_tzinfo)
+
+    def restore_while_parsing(self, reduced_instance: DatetimeStrategyResult) -> Optional[datetime]:
+        if reduced_instance['tzinfo'] is not None:
+            # The tzinfo has to be restored by the unpickler
+            return None
+
+        return datetime.fromisoformat(reduced_instance['value']).replace(fold=reduced_instance['fold'])
+
+    def reduce_many(
+            self,
+            *,
+            instances: Sequence[datetime],
+            relative_keys: Sequence[str],
+            pickler: Pickler
+    ) -> list[DatetimeStrategyResult]:
+        reduced_instances: list[DatetimeStrategyResult] = []
+        for instance, relative_key in zip(instances, relative_keys):
+            if instance.tzinfo is None:
+                # Naive datetimes have nothing to reduce by the pickler.
+                reduced_instances.append({'value': instance.isoformat(), 'fold': instance.fold, 'tzinfo': None})
+                continue
+
+            pickler.current_path.append(relative_key)
+            try:
+                reduced_instances.append(self.reduce(instance, pickler))
+            finally:
+                pickler.current_path.pop()
+
+        return reduced_instances
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[DatetimeStrategyResult],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[datetime]:
+        from_isoformat = datetime.fromisoformat
+        restored_instances: list[datetime] = []
+        for reduced_instance, relative_key in zip(reduced_instances, relative_keys):
+            if reduced_instance['tzinfo'] is None:
+                restored_datetime = from_isoformat(reduced_instance['value'])
+                fold = reduced_instance['fold']
+                restored_instances.append(restored_datetime.replace(fold=fold) if fold else restored_datetime)
+                continue
+
+            unpickler.current_path.append(relative_key)
+            try:
+                restored_instances.append(self.restore_base(reduced_instance, unpickler))
+            finally:
+                unpickler.current_path.pop()
+
+        return restored_instances
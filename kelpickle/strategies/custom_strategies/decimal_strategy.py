@@ -0,0 +1,46 @@
+from __future__ import annotations
+from decimal import Decimal
+from typing import TypedDict, Sequence
+
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class DecimalReductionResult(TypedDict):
+    value: str
+
+
+@register_strategy(
+    name='decimal',
+    supported_types=Decimal,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class DecimalStrategy(BaseStrategy):
+    def reduce(self, instance: Decimal, pickler: Pickler) -> DecimalReductionResult:
+        # The string form is exact (including the exponent, the sign of zeros and special values)
+        return {'value': str(instance)}
+
+    def restore_base(self, reduced_instance: DecimalReductionResult, unpickler: Unpickler) -> Decimal:
+        return Decimal(reduced_instance['value'])
+
+    def restore_while_parsing(self, reduced_instance: DecimalReductionResult) -> Decimal:
+        return Decimal(reduced_instance['value'])
+
+    def reduce_many(
+            self,
+            *,
+            instances: Sequence[Decimal],
+            relative_keys: Sequence[str],
+            pickler: Pickler
+    ) -> list[DecimalReductionResult]:
+        return [{'value': str(instance)} for instance in instances]
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[DecimalReductionResult],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[Decimal]:
+        return [Decimal(reduced_instance['value']) for reduced_instance in reduced_instances]
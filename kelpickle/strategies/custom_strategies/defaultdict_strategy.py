@@ -0,0 +1,40 @@
+from __future__ import annotations
+from collections import defaultdict
+from operator import itemgetter
+from typing import TypedDict
+
+from kelpickle.common import Jsonable, JsonList
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.strategies.custom_strategies.mapping_utils import reduce_items, restore_items
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class DefaultDictReductionResult(TypedDict):
+    default_factory: Jsonable
+    items: JsonList
+
+
+@register_strategy(
+    name='defaultdict',
+    supported_types=defaultdict,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class DefaultDictStrategy(BaseStrategy):
+    def reduce(self, instance: defaultdict, pickler: Pickler) -> DefaultDictReductionResult:
+        return {
+            'default_factory': pickler.reduce(instance.default_factory, relative_key='default_factory'),
+            'items': reduce_items(pickler.canonical_order(instance.items(), key=itemgetter(0)), pickler),
+        }
+
+    def restore_base(self, reduced_instance: DefaultDictReductionResult, unpickler: Unpickler) -> defaultdict:
+        return defaultdict(unpickler.restore(reduced_instance['default_factory'], relative_key='default_factory'))
+
+    def restore_rest(
+            self,
+            *,
+            reduced_instance: DefaultDictReductionResult,
+            unpickler: Unpickler,
+            base_instance: defaultdict
+    ) -> None:
+        restore_items(reduced_instance['items'], unpickler, base_instance)
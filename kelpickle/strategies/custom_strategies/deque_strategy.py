@@ -0,0 +1,40 @@
+from __future__ import annotations
+from collections import deque
+from typing import TypedDict, NotRequired
+
+from kelpickle.common import JsonList
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class DequeReductionResult(TypedDict):
+    value: JsonList
+    maxlen: NotRequired[int]
+
+
+@register_strategy(
+    name='deque',
+    supported_types=deque,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class DequeStrategy(BaseStrategy):
+    def reduce(self, instance: deque, pickler: Pickler) -> DequeReductionResult:
+        # Deques are indexed in linear time, so their members are copied to a list first.
+        result: DequeReductionResult = {'value': pickler.reduce_many(list(instance))}
+        if instance.maxlen is not None:
+            result['maxlen'] = instance.maxlen
+
+        return result
+
+    def restore_base(self, reduced_instance: DequeReductionResult, unpickler: Unpickler) -> deque:
+        return deque(maxlen=reduced_instance.get('maxlen'))
+
+    def restore_rest(
+            self,
+            *,
+            reduced_instance: DequeReductionResult,
+            unpickler: Unpickler,
+            base_instance: deque
+    ) -> None:
+        base_instance.extend(unpickler.restore_many(reduced_instance['value']))
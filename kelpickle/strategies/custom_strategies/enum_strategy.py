@@ -0,0 +1,45 @@
+from __future__ import annotations
+from enum import Enum
+from typing import Optional, TypedDict, cast
+
+from kelpickle.common import Jsonable
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.strategies.custom_strategies.import_strategy import get_import_string, restore_import_string
+from kelpickle.kelpickling import Pickler, Unpickler
+
+_NATIVE_VALUE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+class EnumReductionResult(TypedDict):
+    type: str
+    value: Jsonable
+
+
+@register_strategy(
+    name='enum',
+    supported_types=Enum,
+    auto_generate_reduction_references=False,
+    consider_subclasses=True
+)
+class EnumStrategy(BaseStrategy):
+    def accepts_subclass(self, subclass: type) -> bool:
+        # Members are looked up by their value, the same as Enum.__reduce_ex__ does. Enums that are reduced
+        # differently (Ex. by their name) are left to the default strategy.
+        return getattr(subclass, '__reduce_ex__') is Enum.__reduce_ex__
+
+    def reduce(self, instance: Enum, pickler: Pickler) -> EnumReductionResult:
+        return {
+            'type': get_import_string(type(instance)),
+            'value': pickler.reduce(instance.value, relative_key='value'),
+        }
+
+    def restore_base(self, reduced_instance: EnumReductionResult, unpickler: Unpickler) -> Enum:
+        enum_type = cast(type[Enum], restore_import_string(reduced_instance['type']))
+        return enum_type(unpickler.restore(reduced_instance['value'], relative_key='value'))
+
+    def restore_while_parsing(self, reduced_instance: EnumReductionResult) -> Optional[Enum]:
+        value = reduced_instance['value']
+        if type(value) not in _NATIVE_VALUE_TYPES:
+            return None
+
+        return cast(type[Enum], restore_import_string(reduced_instance['type']))(value)
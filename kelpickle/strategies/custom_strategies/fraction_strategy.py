@@ -0,0 +1,49 @@
+from __future__ import annotations
+from fractions import Fraction
+from typing import TypedDict, Sequence
+
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class FractionReductionResult(TypedDict):
+    numerator: int
+    denominator: int
+
+
+@register_strategy(
+    name='fraction',
+    supported_types=Fraction,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class FractionStrategy(BaseStrategy):
+    def reduce(self, instance: Fraction, pickler: Pickler) -> FractionReductionResult:
+        return {'numerator': instance.numerator, 'denominator': instance.denominator}
+
+    def restore_base(self, reduced_instance: FractionReductionResult, unpickler: Unpickler) -> Fraction:
+        return Fraction(reduced_instance['numerator'], reduced_instance['denominator'])
+
+    def restore_while_parsing(self, reduced_instance: FractionReductionResult) -> Fraction:
+        return Fraction(reduced_instance['numerator'], reduced_instance['denominator'])
+
+    def reduce_many(
+            self,
+            *,
+            instances: Sequence[Fraction],
+            relative_keys: Sequence[str],
+            pickler: Pickler
+    ) -> list[FractionReductionResult]:
+        return [{'numerator': instance.numerator, 'denominator': instance.denominator} for instance in instances]
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[FractionReductionResult],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[Fraction]:
+        return [
+            Fraction(reduced_instance['numerator'], reduced_instance['denominator'])
+            for reduced_instance in reduced_instances
+        ]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import TypedDict
+
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.common import JsonList
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class FrozensetReductionResult(TypedDict):
+    value: JsonList
+
+
+@register_strategy(
+    name='frozenset',
+    supported_types=frozenset,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class FrozensetStrategy(BaseStrategy):
+    def reduce(self, instance: frozenset, pickler: Pickler) -> FrozensetReductionResult:
+        return {'value': pickler.reduce_many(list(pickler.canonical_order(instance)))}
+
+    def restore_base(self, reduced_instance: FrozensetReductionResult, unpickler: Unpickler) -> frozenset:
+        return frozenset(unpickler.restore_many(reduced_instance['value']))
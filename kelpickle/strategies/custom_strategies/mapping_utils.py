@@ -0,0 +1,27 @@
+from __future__ import annotations
+import sys
+from typing import Any, Iterable, MutableMapping
+
+from kelpickle.common import JsonList
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+def reduce_items(items: Iterable[tuple[Any, Any]], pickler: Pickler) -> JsonList:
+    """
+    Reduce the items of a mapping as a list of key-value pairs, so keys of any type are supported. Keys and values are
+    reduced under the same relative keys the dict strategy uses.
+    """
+    return [
+        [pickler.reduce(key, relative_key=f"{i}_KEY"), pickler.reduce(value, relative_key=str(i))]
+        for i, (key, value) in enumerate(items)
+    ]
+
+
+def restore_items(reduced_items: JsonList, unpickler: Unpickler, mapping: MutableMapping[Any, Any]) -> None:
+    """
+    Restore the items that were reduced by reduce_items into the given mapping, in their original order.
+    """
+    for i, (key, value) in enumerate(reduced_items):
+        # Much like dict keys, string keys are interned.
+        restored_key = sys.intern(key) if type(key) is str else unpickler.restore(key, relative_key=f"{i}_KEY")
+        mapping[restored_key] = unpickler.restore(value, relative_key=str(i))
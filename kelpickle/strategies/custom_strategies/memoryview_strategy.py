@@ -0,0 +1,57 @@
+from __future__ import annotations
+import base64
+from array import array
+from typing import Any, Literal, TypedDict, cast, get_args
+
+from kelpickle.kelpickling import Pickler, Unpickler
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.strategies.custom_strategies.array_strategy import pack_array, unpack_array
+
+# Formats of items that can be byte swapped through an array. Items of other formats are written as raw bytes.
+_ArrayFormat = Literal["b", "B", "h", "H", "i", "I", "l", "L", "q", "Q", "f", "d"]
+_ARRAY_FORMATS = frozenset(get_args(_ArrayFormat))
+
+
+class MemoryviewReductionResult(TypedDict):
+    buffer: str
+    format: _ArrayFormat
+    shape: list[int]
+    readonly: bool
+
+
+@register_strategy(
+    name='memoryview',
+    supported_types=memoryview,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class MemoryviewStrategy(BaseStrategy):
+    """
+    Memoryviews are restored as views of a copy of their contents (a bytearray, or bytes if they are read only).
+    """
+    def reduce(self, instance: memoryview, pickler: Pickler) -> MemoryviewReductionResult:
+        item_format: _ArrayFormat
+        if instance.format in _ARRAY_FORMATS:
+            item_format = cast(_ArrayFormat, instance.format)
+            buffer = pack_array(array(item_format, instance.tobytes()))
+        else:
+            # Exotic formats (Ex. structs) are only restored as their raw bytes.
+            item_format = 'B'
+            buffer = base64.b64encode(instance.tobytes()).decode('utf-8')
+
+        return {
+            'buffer': buffer,
+            'format': item_format,
+            'shape': list(instance.shape or ()) if item_format == instance.format else [instance.nbytes],
+            'readonly': instance.readonly,
+        }
+
+    def restore_base(self, *, reduced_instance: MemoryviewReductionResult, unpickler: Unpickler) -> memoryview[Any]:
+        item_format = reduced_instance['format']
+        if item_format == 'B':
+            data = base64.b64decode(reduced_instance['buffer'])
+        else:
+            data = unpack_array(item_format, reduced_instance['buffer']).tobytes()
+
+        restored_view = memoryview(data if reduced_instance['readonly'] else bytearray(data))
+        return restored_view.cast(item_format, reduced_instance['shape'])
@@ -2,12 +2,10 @@ from __future__ import annotations
 
 from pickle import DEFAULT_PROTOCOL
 from copyreg import __newobj__, __newobj_ex__  # type: ignore
-from typing import Any, TypeAlias, cast, TypedDict, Iterable, Callable
-
-from typing_extensions import NotRequired
+from typing import Any, TypeAlias, cast, TypedDict, Iterable, Callable, NotRequired
 
 from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
-from kelpickle.common import JsonList, Json, Jsonable
+from kelpickle.common import JsonList, Json, Jsonable, STRATEGY_KEY
 from kelpickle.errors import ReductionError
 from kelpickle.strategies.custom_strategies.import_strategy import restore_import_string, get_import_string
 from kelpickle.kelpickling import Pickler, Unpickler
@@ -89,6 +87,9 @@ class ObjectStrategy(BaseStrategy):
         # This is done so the args part will be more readable (just a list instead of a json created from the tuple
         # strategy).
         args = list(reduce_result[1])
+        if isinstance(instance, (set, frozenset)) and args:
+            # Sets (and their subclasses) are reduced to a list of their members, in their iteration order.
+            args[0] = list(pickler.canonical_order(args[0]))
 
         jsonified_result = [
             pickler.reduce(callable_, relative_key="0"),
@@ -141,11 +142,12 @@ class ObjectStrategy(BaseStrategy):
             # 2. Add list items (if defined)
             # 3. Add dict items (if defined)
             # 4. Add state (if defined) and use custom setstate (if defined)
-            if reduce_result_length > 3:
+            # Like pickle, missing items are given as None
+            if reduce_result_length > 3 and flattened_reduce[3] is not None:
                 list_items: Iterable[Any] = unpickler.restore(flattened_reduce[3], relative_key='3')
                 build_list_items_from_reduce(base_instance, list_items)
 
-            if reduce_result_length > 4:
+            if reduce_result_length > 4 and flattened_reduce[4] is not None:
                 dict_items: Iterable[tuple[Any, Any]] = unpickler.restore(flattened_reduce[4], relative_key='4')
                 build_dict_items_from_reduce(base_instance, dict_items)
 
@@ -168,3 +170,95 @@ class ObjectStrategy(BaseStrategy):
             reduced_state = reduced_object.get('state')
             if reduced_state:
                 set_state(base_instance, unpickler.restore(reduced_state, relative_key="state"))
+
+    def can_restore_in_place(self, *, reduced_instance: ObjectReductionResult, target: object) -> bool:
+        # Only instances that are restored by setting their attributes can be updated attribute by attribute.
+        if "reduce" in reduced_instance or "new_args" in reduced_instance or "new_kwargs" in reduced_instance:
+            return False
+
+        reduced_object = cast(CustomStateResult, reduced_instance)
+        target_type = type(target)
+        if hasattr(target_type, "__setstate__") or restore_import_string(reduced_object["type"]) is not target_type:
+            return False
+
+        reduced_state = reduced_object.get("state")
+        if not reduced_state:
+            return True
+
+        if _is_reduced_dict(reduced_state):
+            return hasattr(target, "__dict__")
+
+        if not isinstance(reduced_state, dict) or reduced_state.get(STRATEGY_KEY) != "tuple":
+            return False
+
+        # The state of slotted instances: (dynamic attributes, slotted attributes)
+        dynamic_state, slotted_state = reduced_state["value"]
+        return (
+            (dynamic_state is None or (_is_reduced_dict(dynamic_state) and hasattr(target, "__dict__"))) and
+            (slotted_state is None or _is_reduced_dict(slotted_state))
+        )
+
+    def restore_in_place(self, *, reduced_instance: ObjectReductionResult, unpickler: Unpickler, target: Any) -> None:
+        reduced_state = cast(CustomStateResult, reduced_instance).get("state")
+        if not reduced_state:
+            _clear_attributes(target)
+            return
+
+        if _is_reduced_dict(reduced_state):
+            unpickler.restore_in_place(reduced_state, relative_key="state", target=target.__dict__)
+            return
+
+        # Otherwise, "can_restore_in_place" made sure this is the reduced tuple of a slotted instance.
+        dynamic_state, slotted_state = cast(Json, reduced_state)["value"]
+        unpickler.current_path.append("state")
+        try:
+            if dynamic_state is None:
+                _clear_attributes(target)
+            else:
+                unpickler.restore_in_place(dynamic_state, relative_key="0", target=target.__dict__)
+
+            unpickler.current_path.append("1")
+            try:
+                _restore_slotted_attributes_in_place(target, slotted_state or {}, unpickler)
+            finally:
+                unpickler.current_path.pop()
+        finally:
+            unpickler.current_path.pop()
+
+
+_MISSING = object()
+
+
+def _is_reduced_dict(reduced_instance: Jsonable) -> bool:
+    return isinstance(reduced_instance, dict) and reduced_instance.get(STRATEGY_KEY, "dict") == "dict"
+
+
+def _clear_attributes(instance: Any) -> None:
+    instance_dict = getattr(instance, "__dict__", None)
+    if instance_dict is not None:
+        instance_dict.clear()
+
+
+def _restore_slotted_attributes_in_place(instance: Any, reduced_attributes: dict, unpickler: Unpickler) -> None:
+    restored_names = set()
+    for i, (attribute_name, reduced_value) in enumerate(reduced_attributes.items()):
+        if attribute_name == STRATEGY_KEY:
+            continue
+
+        existing_value = getattr(instance, attribute_name, _MISSING)
+        if existing_value is _MISSING:
+            restored_value = unpickler.restore(reduced_value, relative_key=str(i))
+        else:
+            restored_value = unpickler.restore_in_place(reduced_value, relative_key=str(i), target=existing_value)
+        setattr(instance, attribute_name, restored_value)
+        restored_names.add(attribute_name)
+
+    for slots_owner in type(instance).__mro__:
+        slots = getattr(slots_owner, "__slots__", ())
+        for attribute_name in (slots,) if isinstance(slots, str) else slots:
+            if (
+                    attribute_name not in restored_names and
+                    attribute_name not in ("__dict__", "__weakref__") and
+                    hasattr(instance, attribute_name)
+            ):
+                delattr(instance, attribute_name)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import TypedDict
+
+from kelpickle.common import JsonList
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.strategies.custom_strategies.mapping_utils import reduce_items, restore_items
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class OrderedDictReductionResult(TypedDict):
+    items: JsonList
+
+
+@register_strategy(
+    name='ordered_dict',
+    supported_types=OrderedDict,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class OrderedDictStrategy(BaseStrategy):
+    def reduce(self, instance: OrderedDict, pickler: Pickler) -> OrderedDictReductionResult:
+        # The order of an OrderedDict is part of its value (it's compared by it), so it's kept even by canonical
+        # picklers.
+        return {'items': reduce_items(instance.items(), pickler)}
+
+    def restore_base(self, reduced_instance: OrderedDictReductionResult, unpickler: Unpickler) -> OrderedDict:
+        return OrderedDict()
+
+    def restore_rest(
+            self,
+            *,
+            reduced_instance: OrderedDictReductionResult,
+            unpickler: Unpickler,
+            base_instance: OrderedDict
+    ) -> None:
+        restore_items(reduced_instance['items'], unpickler, base_instance)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from pathlib import PurePath
+from typing import TypedDict, cast
+
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.strategies.custom_strategies.import_strategy import get_import_string, restore_import_string
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class PathReductionResult(TypedDict):
+    type: str
+    value: str
+
+
+@register_strategy(
+    name='path',
+    supported_types=PurePath,
+    auto_generate_reduction_references=True,
+    consider_subclasses=True
+)
+class PathStrategy(BaseStrategy):
+    def accepts_subclass(self, subclass: type) -> bool:
+        # Paths are rebuilt from their string form, the same as PurePath.__reduce__ does.
+        return (
+            getattr(subclass, '__reduce__') is PurePath.__reduce__ and
+            getattr(subclass, '__reduce_ex__') is PurePath.__reduce_ex__
+        )
+
+    def reduce(self, instance: PurePath, pickler: Pickler) -> PathReductionResult:
+        return {'type': get_import_string(type(instance)), 'value': str(instance)}
+
+    def restore_base(self, reduced_instance: PathReductionResult, unpickler: Unpickler) -> PurePath:
+        return cast(type[PurePath], restore_import_string(reduced_instance['type']))(reduced_instance['value'])
+
+    def restore_while_parsing(self, reduced_instance: PathReductionResult) -> PurePath:
+        return cast(type[PurePath], restore_import_string(reduced_instance['type']))(reduced_instance['value'])
@@ -17,11 +17,18 @@ class SetStrategy(BaseStrategy):
         # We allow ourselves to have the relative key work by index even though this is a set (which is supposedly
         # unordered) this is fine because we are basically converting it to an order list and it will stay as an order
         # list for all the steps that use the relative key.
-        return {'value': [pickler.reduce(member, relative_key=str(i)) for i, member in enumerate(instance)]}
+        return {'value': pickler.reduce_many(list(pickler.canonical_order(instance)))}
 
     def restore_base(self, reduced_instance: SetReductionResult, unpickler: Unpickler) -> set:
         return set()
 
     def restore_rest(self, *, reduced_instance: SetReductionResult, unpickler: Unpickler, base_instance: set):
-        for i, member in enumerate(reduced_instance["value"]):
-            base_instance.add(unpickler.restore(member, relative_key=str(i)))
+        base_instance.update(unpickler.restore_many(reduced_instance["value"]))
+
+    def can_restore_in_place(self, *, reduced_instance: SetReductionResult, target: object) -> bool:
+        return type(target) is set
+
+    def restore_in_place(self, *, reduced_instance: SetReductionResult, unpickler: Unpickler, target: set) -> None:
+        restored_members = unpickler.restore_many(reduced_instance["value"])
+        target.intersection_update(restored_members)
+        target.update(restored_members)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from datetime import time
-from typing import TypedDict
+from typing import Optional, TypedDict
 
 from kelpickle.common import Jsonable
 from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
@@ -27,3 +27,10 @@ class TimeStrategy(BaseStrategy):
         restored_time = time.fromisoformat(reduced_instance['value'])
 
         return restored_time.replace(fold=reduced_instance['fold'], tzinfo=restored_tzinfo)
+
+    def restore_while_parsing(self, reduced_instance: TimeStrategyResult) -> Optional[time]:
+        if reduced_instance['tzinfo'] is not None:
+            # The tzinfo has to be restored by the unpickler
+            return None
+
+        return time.fromisoformat(reduced_instance['value']).replace(fold=reduced_instance['fold'])
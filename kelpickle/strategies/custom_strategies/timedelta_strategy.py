@@ -1,6 +1,6 @@
 from __future__ import annotations
 from datetime import timedelta
-from typing import TypedDict
+from typing import TypedDict, Sequence
 
 from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
 from kelpickle.kelpickling import Pickler, Unpickler
@@ -19,3 +19,24 @@ class TimeDeltaStrategy(BaseStrategy):
 
     def restore_base(self, reduced_instance: TimedeltaStrategyResult, unpickler: Unpickler) -> timedelta:
         return timedelta(seconds=reduced_instance['total_seconds'])
+
+    def restore_while_parsing(self, reduced_instance: TimedeltaStrategyResult) -> timedelta:
+        return timedelta(seconds=reduced_instance['total_seconds'])
+
+    def reduce_many(
+            self,
+            *,
+            instances: Sequence[timedelta],
+            relative_keys: Sequence[str],
+            pickler: Pickler
+    ) -> list[TimedeltaStrategyResult]:
+        return [{'total_seconds': instance.total_seconds()} for instance in instances]
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[TimedeltaStrategyResult],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[timedelta]:
+        return [timedelta(seconds=reduced_instance['total_seconds']) for reduced_instance in reduced_instances]
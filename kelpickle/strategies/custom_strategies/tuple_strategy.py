@@ -1,22 +1,62 @@
 from __future__ import annotations
 
-from typing import TypedDict
+from collections import namedtuple
+from typing import Any, Iterable, NotRequired, Protocol, TypedDict, cast
 
 from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.strategies.custom_strategies.import_strategy import get_import_string, restore_import_string
 from kelpickle.common import JsonList
 from kelpickle.kelpickling import Pickler, Unpickler
 
+# Every namedtuple (including typing.NamedTuple) shares the code of the __getnewargs__ that namedtuple generates.
+_NAMEDTUPLE_GETNEWARGS_CODE = getattr(namedtuple('_Sample', ()), '__getnewargs__').__code__
+
+
+class _NamedTupleType(Protocol):
+    def _make(self, iterable: Iterable[Any], /) -> tuple: ...
+
+
+def _is_plain_namedtuple(instance_type: type) -> bool:
+    getnewargs = getattr(instance_type, '__getnewargs__', None)
+    return (
+        getattr(getnewargs, '__code__', None) is _NAMEDTUPLE_GETNEWARGS_CODE and
+        # Subclasses without __slots__ have a state of their own.
+        instance_type.__dictoffset__ == 0 and
+        getattr(instance_type, '__reduce_ex__') is tuple.__reduce_ex__ and
+        getattr(instance_type, '__reduce__') is tuple.__reduce__
+    )
+
 
 class TupleReductionResult(TypedDict):
     value: JsonList
+    # Only given for namedtuples
+    type: NotRequired[str]
 
 
-@register_strategy(name='tuple', supported_types=tuple, auto_generate_reduction_references=True, consider_subclasses=False)
+@register_strategy(
+    name='tuple',
+    supported_types=tuple,
+    auto_generate_reduction_references=True,
+    consider_subclasses=True
+)
 class TupleStrategy(BaseStrategy):
+    def accepts_subclass(self, subclass: type) -> bool:
+        # Other subclasses of tuple (Ex. struct sequences) are left to the default strategy.
+        return _is_plain_namedtuple(subclass)
+
     def reduce(self, instance: tuple, pickler: Pickler) -> TupleReductionResult:
-        return {'value': [pickler.reduce(member, relative_key=str(i)) for i, member in enumerate(instance)]}
+        instance_type = type(instance)
+        if instance_type is tuple:
+            return {'value': pickler.reduce_many(instance)}
+
+        return {'type': get_import_string(instance_type), 'value': pickler.reduce_many(instance)}
 
     def restore_base(self, reduced_instance: TupleReductionResult, unpickler: Unpickler) -> tuple:
         # TODO: Create the tuple one member at a time so you can record reference of the set beforehand
         #  (Use PyTuple_SET)
-        return tuple(unpickler.restore(member, relative_key=str(i)) for i, member in enumerate(reduced_instance['value']))
+        members = unpickler.restore_many(reduced_instance['value'])
+        if 'type' in reduced_instance:
+            namedtuple_type = cast(_NamedTupleType, restore_import_string(reduced_instance['type']))
+            return namedtuple_type._make(members)
+
+        return tuple(members)
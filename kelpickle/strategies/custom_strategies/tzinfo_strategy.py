@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import cache
 from typing import Optional, TypedDict
 from datetime import tzinfo, datetime
 
@@ -6,7 +7,11 @@ from kelpickle.common import Jsonable
 from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
 from kelpickle.kelpickling import Pickler, Unpickler
 
-_some_datetime = datetime.now()
+
+@cache
+def _some_datetime() -> datetime:
+    # Calculated upon first use instead of upon import, in order to keep the import cheap.
+    return datetime.now()
 
 
 class TzInfoStrategyResult(TypedDict):
@@ -17,7 +22,7 @@ class TzInfoStrategyResult(TypedDict):
 @register_strategy(name='tzinfo', supported_types=tzinfo, auto_generate_reduction_references=True, consider_subclasses=True)
 class TzInfoStrategy(BaseStrategy):
     def reduce(self, instance: tzinfo, pickler: Pickler) -> TzInfoStrategyResult:
-        offset_delta = instance.utcoffset(_some_datetime)
+        offset_delta = instance.utcoffset(_some_datetime())
         offset_seconds = offset_delta.total_seconds() if offset_delta else None
         return {
             'tzinfo': pickler.default_reduce(instance),
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from typing import TypedDict, Sequence, NotRequired, Optional
+from uuid import UUID, SafeUUID
+
+from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class UUIDReductionResult(TypedDict):
+    hex: str
+    is_safe: NotRequired[Optional[bool]]
+
+
+def _reduce_uuid(instance: UUID) -> UUIDReductionResult:
+    result: UUIDReductionResult = {'hex': instance.hex}
+    if instance.is_safe is not SafeUUID.unknown:
+        # Like pickle, the safety of the UUID is only kept if it's known
+        result['is_safe'] = instance.is_safe.value
+
+    return result
+
+
+def _restore_uuid(reduced_instance: UUIDReductionResult) -> UUID:
+    if 'is_safe' in reduced_instance:
+        return UUID(hex=reduced_instance['hex'], is_safe=SafeUUID(reduced_instance['is_safe']))
+
+    return UUID(hex=reduced_instance['hex'])
+
+
+@register_strategy(
+    name='uuid',
+    supported_types=UUID,
+    auto_generate_reduction_references=True,
+    consider_subclasses=False
+)
+class UUIDStrategy(BaseStrategy):
+    def reduce(self, instance: UUID, pickler: Pickler) -> UUIDReductionResult:
+        return _reduce_uuid(instance)
+
+    def restore_base(self, reduced_instance: UUIDReductionResult, unpickler: Unpickler) -> UUID:
+        return _restore_uuid(reduced_instance)
+
+    def restore_while_parsing(self, reduced_instance: UUIDReductionResult) -> UUID:
+        return _restore_uuid(reduced_instance)
+
+    def reduce_many(
+            self,
+            *,
+            instances: Sequence[UUID],
+            relative_keys: Sequence[str],
+            pickler: Pickler
+    ) -> list[UUIDReductionResult]:
+        return [_reduce_uuid(instance) for instance in instances]
+
+    def restore_many(
+            self,
+            *,
+            reduced_instances: Sequence[UUIDReductionResult],
+            relative_keys: Sequence[str],
+            unpickler: Unpickler
+    ) -> list[UUID]:
+        return [_restore_uuid(reduced_instance) for reduced_instance in reduced_instances]
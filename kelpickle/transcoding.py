@@ -0,0 +1,889 @@
+"""
+Conversion between kelpickle documents and pickle streams (protocol 4), without restoring the serialized instances.
+Only the instances of builtin strategies can be converted. Their reduced form mirrors pickle's reduce protocol, so every
+node of one format has a counterpart in the other. No constructor (or __setstate__) of the serialized classes is run,
+and their modules are never imported. Memoryviews, which pickle does not support, are converted into bytes.
+"""
+from __future__ import annotations
+
+import _compat_pickle
+import base64
+import io
+import json
+import pickle
+import pickletools
+import struct
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Optional, cast
+
+from kelpickle.common import Jsonable, STRATEGY_KEY
+from kelpickle.errors import TranscodingError
+from kelpickle.kelpickling import ROOT_RELATIVE_KEY, REFERENCE_SEPARATOR, REFERENCE_STRATEGY_NAME, \
+    PERSISTENT_STRATEGY_NAME, REFERENCED_KEY, ENVELOPE_VALUE_KEY, SerializedInstance
+from kelpickle.strategies.core_strategies.list_strategy import LIST_STRATEGY_NAME
+from kelpickle.strategies.custom_strategies.array_strategy import unpack_array
+
+PICKLE_PROTOCOL = 4
+
+_APPENDS_BATCH_SIZE = 1000
+_NATIVE_TYPES = (str, int, float, bool, type(None))
+_TEMPORAL_TYPES: dict[str, type] = {"datetime": datetime, "date": date, "time": time, "timedelta": timedelta}
+
+
+def _split_import_string(import_string: str) -> tuple[str, Optional[str]]:
+    module_name, _, qualified_name = import_string.partition("/")
+    return module_name, qualified_name or None
+
+
+def _parse_document(serialized_instance: SerializedInstance) -> tuple[Jsonable, set[str]]:
+    if isinstance(serialized_instance, memoryview):
+        serialized_instance = str(serialized_instance, "utf-8")
+
+    document = json.loads(serialized_instance)
+    if isinstance(document, dict) and REFERENCED_KEY in document and STRATEGY_KEY not in document:
+        return document[ENVELOPE_VALUE_KEY], set(document[REFERENCED_KEY])
+
+    referenced_paths = set()
+    pending_nodes = [document]
+    while pending_nodes:
+        node = pending_nodes.pop()
+        if isinstance(node, dict):
+            if node.get(STRATEGY_KEY) == REFERENCE_STRATEGY_NAME:
+                referenced_paths.add(node["reference"])
+            else:
+                pending_nodes.extend(node.values())
+        elif isinstance(node, list):
+            pending_nodes.extend(node)
+
+    return document, referenced_paths
+
+
+class _PickleWriter:
+    """
+    Writes the opcodes that build a kelpickle document. Nodes are written in the order the Unpickler restores them,
+    so every reference is written after the instance it references. Only referenced instances are memoized.
+    """
+    def __init__(self, referenced_paths: set[str]) -> None:
+        self.current_path: list[str] = []
+        self.__output = io.BytesIO()
+        self.__write = self.__output.write
+        self.__referenced_paths = referenced_paths
+        self.__memo: dict[str, int] = {}
+        self.__memo_size = 0
+        self.__strategy_writers: dict[str, Callable[[dict[str, Any]], None]] = {
+            "dict": self.__write_dict,
+            "tuple": self.__write_tuple,
+            "set": self.__write_set,
+            "frozenset": self.__write_frozenset,
+            "deque": self.__write_deque,
+            "ordered_dict": self.__write_mapping,
+            "counter": self.__write_mapping,
+            "defaultdict": self.__write_mapping,
+            "enum": self.__write_by_value,
+            "path": self.__write_by_value,
+            "decimal": self.__write_scalar,
+            "complex": self.__write_scalar,
+            "fraction": self.__write_scalar,
+            "uuid": self.__write_uuid,
+            "bytes": self.__write_bytes,
+            "bytearray": self.__write_bytearray,
+            "array": self.__write_array,
+            # Reduced lists are only dicts once they were packed.
+            LIST_STRATEGY_NAME: self.__write_packed_list,
+            "memoryview": self.__write_memoryview,
+            "import": self.__write_import,
+            "default": self.__write_object,
+            "tzinfo": self.__write_tzinfo,
+            "datetime": self.__write_temporal,
+            "date": self.__write_temporal,
+            "time": self.__write_temporal,
+            "timedelta": self.__write_temporal,
+            REFERENCE_STRATEGY_NAME: self.__write_reference,
+            PERSISTENT_STRATEGY_NAME: self.__write_persistent,
+        }
+
+    def write_document(self, document: Jsonable) -> bytes:
+        self.__write(pickle.PROTO + bytes((PICKLE_PROTOCOL,)))
+        self.write(document, relative_key=ROOT_RELATIVE_KEY)
+        self.__write(pickle.STOP)
+        return self.__output.getvalue()
+
+    def write(self, node: Jsonable, *, relative_key: str) -> None:
+        self.current_path.append(relative_key)
+        try:
+            self.__write_node(node)
+        finally:
+            self.current_path.pop()
+
+    def __write_node(self, node: Jsonable) -> None:
+        if isinstance(node, list):
+            self.__write(pickle.EMPTY_LIST)
+            self.__memoize()
+            self.__write_members(node, pickle.APPENDS)
+        elif isinstance(node, dict):
+            strategy_name = node.get(STRATEGY_KEY, "dict")
+            try:
+                strategy_writer = self.__strategy_writers[strategy_name]
+            except KeyError:
+                raise TranscodingError(f"Instances of the {strategy_name} strategy cannot be transcoded "
+                                       f"(At {self.__current_reference()})") from None
+            strategy_writer(node)
+        else:
+            self.__write_native(node)
+
+    def __current_reference(self) -> str:
+        return REFERENCE_SEPARATOR.join(self.current_path)
+
+    def __memoize(self, *, force: bool = False) -> None:
+        """
+        Memoize the instance on top of the stack, if it's referenced by the current path.
+        """
+        current_reference = self.__current_reference()
+        if current_reference in self.__memo or (not force and current_reference not in self.__referenced_paths):
+            return
+
+        self.__memo[current_reference] = self.__memoize_anonymous()
+
+    def __memoize_anonymous(self) -> int:
+        self.__write(pickle.MEMOIZE)
+        self.__memo_size += 1
+        return self.__memo_size - 1
+
+    def __write_get(self, memo_index: int) -> None:
+        if memo_index < 256:
+            self.__write(pickle.BINGET + bytes((memo_index,)))
+        else:
+            self.__write(pickle.LONG_BINGET + struct.pack("<I", memo_index))
+
+    def __write_members(self, members: list[Jsonable], batch_opcode: bytes) -> None:
+        for batch_start in range(0, len(members), _APPENDS_BATCH_SIZE):
+            self.__write(pickle.MARK)
+            for i in range(batch_start, min(batch_start + _APPENDS_BATCH_SIZE, len(members))):
+                self.write(members[i], relative_key=str(i))
+            self.__write(batch_opcode)
+
+    def __write_native(self, value: Any) -> None:
+        if value is None:
+            self.__write(pickle.NONE)
+        elif value is True:
+            self.__write(pickle.NEWTRUE)
+        elif value is False:
+            self.__write(pickle.NEWFALSE)
+        elif isinstance(value, int):
+            if 0 <= value < 256:
+                self.__write(pickle.BININT1 + bytes((value,)))
+            elif 0 <= value < 65536:
+                self.__write(pickle.BININT2 + struct.pack("<H", value))
+            elif -2 ** 31 <= value < 2 ** 31:
+                self.__write(pickle.BININT + struct.pack("<i", value))
+            else:
+                encoded_value = pickle.encode_long(value)
+                if len(encoded_value) < 256:
+                    self.__write(pickle.LONG1 + bytes((len(encoded_value),)) + encoded_value)
+                else:
+                    self.__write(pickle.LONG4 + struct.pack("<i", len(encoded_value)) + encoded_value)
+        elif isinstance(value, float):
+            self.__write(pickle.BINFLOAT + struct.pack(">d", value))
+        else:
+            assert isinstance(value, str), f"Unexpected native value of type {type(value)}"
+            encoded_value = value.encode("utf-8", "surrogatepass")
+            if len(encoded_value) < 256:
+                self.__write(pickle.SHORT_BINUNICODE + bytes((len(encoded_value),)) + encoded_value)
+            elif len(encoded_value) < 2 ** 32:
+                self.__write(pickle.BINUNICODE + struct.pack("<I", len(encoded_value)) + encoded_value)
+            else:
+                self.__write(pickle.BINUNICODE8 + struct.pack("<Q", len(encoded_value)) + encoded_value)
+
+    def __write_bytes_value(self, value: bytes) -> None:
+        if len(value) < 256:
+            self.__write(pickle.SHORT_BINBYTES + bytes((len(value),)) + value)
+        elif len(value) < 2 ** 32:
+            self.__write(pickle.BINBYTES + struct.pack("<I", len(value)) + value)
+        else:
+            self.__write(pickle.BINBYTES8 + struct.pack("<Q", len(value)) + value)
+
+    def __write_global(self, module_name: str, qualified_name: str) -> None:
+        self.__write_native(module_name)
+        self.__write_native(qualified_name)
+        self.__write(pickle.STACK_GLOBAL)
+
+    def __write_import_string(self, import_string: str) -> None:
+        module_name, qualified_name = _split_import_string(import_string)
+        if qualified_name is not None:
+            self.__write_global(module_name, qualified_name)
+            return
+
+        # The import string of a module
+        self.__write_global("importlib", "import_module")
+        self.__write_native(module_name)
+        self.__write(pickle.TUPLE1 + pickle.REDUCE)
+
+    def __write_as_tuple(self, node: Jsonable, *, relative_key: str) -> None:
+        if not isinstance(node, list):
+            self.write(node, relative_key=relative_key)
+            return
+
+        # Arguments are reduced as lists, which are freshly created by the reduction (so they are never referenced).
+        self.current_path.append(relative_key)
+        try:
+            self.__write(pickle.MARK)
+            for i, member in enumerate(node):
+                self.write(member, relative_key=str(i))
+            self.__write(pickle.TUPLE)
+        finally:
+            self.current_path.pop()
+
+    def __write_dict(self, node: dict[str, Any]) -> None:
+        self.__write(pickle.EMPTY_DICT)
+        self.__memoize()
+        items = [(key, value) for key, value in node.items() if key != STRATEGY_KEY]
+        for batch_start in range(0, len(items), _APPENDS_BATCH_SIZE):
+            self.__write(pickle.MARK)
+            for i in range(batch_start, min(batch_start + _APPENDS_BATCH_SIZE, len(items))):
+                key, value = items[i]
+                self.__write_native(key)
+                self.write(value, relative_key=str(i))
+            self.__write(pickle.SETITEMS)
+
+    def __write_tuple(self, node: dict[str, Any]) -> None:
+        if "type" in node:
+            # A namedtuple, which pickle creates by cls.__new__(cls, *members)
+            self.__write_import_string(node["type"])
+        self.__write(pickle.MARK)
+        for i, member in enumerate(node["value"]):
+            self.write(member, relative_key=str(i))
+        self.__write(pickle.TUPLE)
+        if "type" in node:
+            self.__write(pickle.NEWOBJ)
+        self.__memoize()
+
+    def __write_frozenset(self, node: dict[str, Any]) -> None:
+        self.__write(pickle.MARK)
+        for i, member in enumerate(node["value"]):
+            self.write(member, relative_key=str(i))
+        self.__write(pickle.FROZENSET)
+        self.__memoize()
+
+    def __write_deque(self, node: dict[str, Any]) -> None:
+        self.__write_global("collections", "deque")
+        self.__write(pickle.EMPTY_TUPLE)
+        self.__write_native(node.get("maxlen"))
+        self.__write(pickle.TUPLE2 + pickle.REDUCE)
+        self.__memoize()
+        self.__write_members(node["value"], pickle.APPENDS)
+
+    def __write_mapping(self, node: dict[str, Any]) -> None:
+        strategy_name = node[STRATEGY_KEY]
+        if strategy_name == "defaultdict":
+            self.__write_global("collections", "defaultdict")
+            self.write(node["default_factory"], relative_key="default_factory")
+            self.__write(pickle.TUPLE1)
+        else:
+            self.__write_global("collections", "OrderedDict" if strategy_name == "ordered_dict" else "Counter")
+            self.__write(pickle.EMPTY_TUPLE)
+        self.__write(pickle.REDUCE)
+        self.__memoize()
+
+        # Items are reduced as key-value pairs (Check mapping_utils)
+        items = node["items"]
+        for batch_start in range(0, len(items), _APPENDS_BATCH_SIZE):
+            self.__write(pickle.MARK)
+            for i in range(batch_start, min(batch_start + _APPENDS_BATCH_SIZE, len(items))):
+                key, value = items[i]
+                self.write(key, relative_key=f"{i}_KEY")
+                self.write(value, relative_key=str(i))
+            self.__write(pickle.SETITEMS)
+
+    def __write_by_value(self, node: dict[str, Any]) -> None:
+        # Enum members and paths are created by calling their type with their value
+        self.__write_import_string(node["type"])
+        self.write(node["value"], relative_key="value")
+        self.__write(pickle.TUPLE1 + pickle.REDUCE)
+        self.__memoize()
+
+    def __write_scalar(self, node: dict[str, Any]) -> None:
+        strategy_name = node[STRATEGY_KEY]
+        if strategy_name == "decimal":
+            self.__write_global("decimal", "Decimal")
+            arguments = [node["value"]]
+        elif strategy_name == "complex":
+            self.__write_global("builtins", "complex")
+            arguments = [node["real"], node["imag"]]
+        else:
+            self.__write_global("fractions", "Fraction")
+            arguments = [node["numerator"], node["denominator"]]
+
+        self.__write(pickle.MARK)
+        for argument in arguments:
+            self.__write_native(argument)
+        self.__write(pickle.TUPLE + pickle.REDUCE)
+        self.__memoize()
+
+    def __write_uuid(self, node: dict[str, Any]) -> None:
+        # The same state pickle uses (which is applied by UUID.__setstate__)
+        self.__write_global("uuid", "UUID")
+        self.__write(pickle.EMPTY_TUPLE + pickle.NEWOBJ)
+        self.__memoize()
+        self.__write(pickle.EMPTY_DICT + pickle.MARK)
+        self.__write_native("int")
+        self.__write_native(int(node["hex"], 16))
+        if "is_safe" in node:
+            self.__write_native("is_safe")
+            self.__write_native(node["is_safe"])
+        self.__write(pickle.SETITEMS + pickle.BUILD)
+
+    def __write_set(self, node: dict[str, Any]) -> None:
+        self.__write(pickle.EMPTY_SET)
+        self.__memoize()
+        self.__write_members(node["value"], pickle.ADDITEMS)
+
+    def __write_bytes(self, node: dict[str, Any]) -> None:
+        self.__write_bytes_value(base64.b64decode(node["buffer"]))
+        self.__memoize()
+
+    def __write_bytearray(self, node: dict[str, Any]) -> None:
+        self.__write_global("builtins", "bytearray")
+        self.__write_bytes_value(base64.b64decode(node["buffer"]))
+        self.__write(pickle.TUPLE1 + pickle.REDUCE)
+        self.__memoize()
+
+    def __write_array(self, node: dict[str, Any]) -> None:
+        # The arguments of the reconstructor describe the machine format of the items, which can only be calculated by
+        # the array module itself.
+        restored_array = unpack_array(node["typecode"], node["buffer"])
+        reduced_array = cast(tuple[Any, tuple[type, str, int, bytes]], restored_array.__reduce_ex__(PICKLE_PROTOCOL))
+        _, typecode, machine_format, items = reduced_array[1]
+        self.__write_global("array", "_array_reconstructor")
+        self.__write(pickle.MARK)
+        self.__write_global("array", "array")
+        self.__write_native(typecode)
+        self.__write_native(machine_format)
+        self.__write_bytes_value(items)
+        self.__write(pickle.TUPLE + pickle.REDUCE)
+        self.__memoize()
+
+    def __write_packed_list(self, node: dict[str, Any]) -> None:
+        self.__write(pickle.EMPTY_LIST)
+        self.__memoize()
+        self.__write_members(unpack_array(node["typecode"], node["buffer"]).tolist(), pickle.APPENDS)
+
+    def __write_memoryview(self, node: dict[str, Any]) -> None:
+        # Pickle can't serialize memoryviews, so their contents are written as bytes.
+        if node["format"] == "B":
+            self.__write_bytes_value(base64.b64decode(node["buffer"]))
+        else:
+            self.__write_bytes_value(unpack_array(node["format"], node["buffer"]).tobytes())
+        self.__memoize()
+
+    def __write_import(self, node: dict[str, Any]) -> None:
+        self.__write_import_string(node["import_string"])
+
+    def __write_tzinfo(self, node: dict[str, Any]) -> None:
+        # The actual tzinfo is reduced under the same path.
+        self.__write_node(node["tzinfo"])
+
+    def __write_temporal(self, node: dict[str, Any]) -> None:
+        strategy_name = node[STRATEGY_KEY]
+        if strategy_name == "timedelta":
+            arguments = timedelta(seconds=node["total_seconds"]).__reduce_ex__(PICKLE_PROTOCOL)[1]
+            self.__write_global("datetime", "timedelta")
+            self.__write(pickle.MARK)
+            for argument in arguments:
+                self.__write_native(argument)
+            self.__write(pickle.TUPLE + pickle.REDUCE)
+            self.__memoize()
+            return
+
+        # The pickled state of dates and times is their binary representation, which can only be calculated by the
+        # datetime module itself. The state never includes the tzinfo.
+        value: date | time
+        if strategy_name == "date":
+            value = date.fromisoformat(node["value"])
+        else:
+            timestamp_type = cast(type[datetime] | type[time], _TEMPORAL_TYPES[strategy_name])
+            value = timestamp_type.fromisoformat(node["value"]).replace(tzinfo=None, fold=node["fold"])
+
+        reduced_value = cast(tuple[Any, tuple[bytes, ...]], value.__reduce_ex__(PICKLE_PROTOCOL))
+        self.__write_global("datetime", strategy_name)
+        self.__write_bytes_value(reduced_value[1][0])
+        if node.get("tzinfo") is None:
+            self.__write(pickle.TUPLE1)
+        else:
+            self.write(node["tzinfo"], relative_key="tzinfo")
+            self.__write(pickle.TUPLE2)
+        self.__write(pickle.REDUCE)
+        self.__memoize()
+
+    def __write_reference(self, node: dict[str, Any]) -> None:
+        reference = node["reference"]
+        try:
+            memo_index = self.__memo[reference]
+        except KeyError:
+            raise TranscodingError(f"Reference {reference} (At {self.__current_reference()}) points to an instance "
+                                   f"that is only restored after it") from None
+        self.__write_get(memo_index)
+
+    def __write_persistent(self, node: dict[str, Any]) -> None:
+        self.__write_node(node["key"])
+        self.__write(pickle.BINPERSID)
+
+    def __write_object(self, node: dict[str, Any]) -> None:
+        if "reduce" not in node:
+            self.__write_import_string(node["type"])
+            if "new_args" in node:
+                self.__write_as_tuple(node["new_args"], relative_key="new_args")
+            else:
+                self.__write(pickle.EMPTY_TUPLE)
+
+            if "new_kwargs" in node:
+                self.write(node["new_kwargs"], relative_key="new_kwargs")
+                self.__write(pickle.NEWOBJ_EX)
+            else:
+                self.__write(pickle.NEWOBJ)
+            self.__memoize()
+
+            if node.get("state"):
+                self.write(node["state"], relative_key="state")
+                self.__write(pickle.BUILD)
+            return
+
+        flattened_reduce = node["reduce"]
+        if isinstance(flattened_reduce, str):
+            self.__write_import_string(flattened_reduce)
+            self.__memoize()
+            return
+
+        reduce_length = len(flattened_reduce)
+        self.write(flattened_reduce[0], relative_key="0")
+        self.__write_as_tuple(flattened_reduce[1], relative_key="1")
+        self.__write(pickle.REDUCE)
+        has_items = any(flattened_reduce[i] is not None for i in (3, 4) if i < reduce_length)
+        has_state_setter = reduce_length > 5 and flattened_reduce[5] is not None
+        # The list/dict items and the state setter are applied by calls that receive the instance as an argument.
+        self.__memoize(force=has_items or has_state_setter)
+
+        # The same order the Unpickler restores the rest of the instance in.
+        if reduce_length > 3 and flattened_reduce[3] is not None:
+            self.__write_global("builtins", "getattr")
+            self.__write_get(self.__memo[self.__current_reference()])
+            self.__write_native("extend")
+            self.__write(pickle.TUPLE2 + pickle.REDUCE)
+            self.write(flattened_reduce[3], relative_key="3")
+            self.__write(pickle.TUPLE1 + pickle.REDUCE + pickle.POP)
+
+        if reduce_length > 4 and flattened_reduce[4] is not None:
+            # MutableMapping.update sets the items one by one (as the Unpickler does), even for non-mapping instances.
+            self.__write_global("collections.abc", "MutableMapping.update")
+            self.__write_get(self.__memo[self.__current_reference()])
+            self.write(flattened_reduce[4], relative_key="4")
+            self.__write(pickle.TUPLE2 + pickle.REDUCE + pickle.POP)
+
+        if reduce_length > 2 and flattened_reduce[2]:
+            if not has_state_setter:
+                self.write(flattened_reduce[2], relative_key="2")
+                self.__write(pickle.BUILD)
+                return
+
+            # The state is restored before the state setter, so it has to be memoized until the setter is on the stack.
+            self.write(flattened_reduce[2], relative_key="2")
+            state_memo_index = self.__memoize_anonymous()
+            self.__write(pickle.POP)
+            self.write(flattened_reduce[5], relative_key="5")
+            self.__write_get(self.__memo[self.__current_reference()])
+            self.__write_get(state_memo_index)
+            self.__write(pickle.TUPLE2 + pickle.REDUCE + pickle.POP)
+
+
+def kelpickle_to_pickle(serialized_instance: SerializedInstance) -> bytes:
+    """
+    Convert the output of Pickler.pickle into a pickle stream that restores the same instance.
+
+    :param serialized_instance: The output of Pickler.pickle (May be UTF-8 encoded)
+    :return: A pickle stream (protocol 4), which may be loaded by pickle.loads
+    """
+    document, referenced_paths = _parse_document(serialized_instance)
+    return _PickleWriter(referenced_paths).write_document(document)
+
+
+class _Global:
+    __slots__ = ("module_name", "qualified_name")
+
+    def __init__(self, module_name: str, qualified_name: str) -> None:
+        self.module_name = module_name
+        self.qualified_name = qualified_name
+
+
+class _Container:
+    __slots__ = ("members",)
+
+    def __init__(self, members: list[Any]) -> None:
+        self.members = members
+
+
+class _List(_Container):
+    __slots__ = ()
+
+
+class _Tuple(_Container):
+    __slots__ = ()
+
+
+class _Set(_Container):
+    __slots__ = ()
+
+
+class _Dict(_Container):
+    __slots__ = ()
+
+
+class _Bytes:
+    __slots__ = ("value",)
+
+    def __init__(self, value: bytes) -> None:
+        self.value = value
+
+
+class _Persistent:
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any) -> None:
+        self.key = key
+
+
+class _Object:
+    __slots__ = ("callable", "arguments", "keyword_arguments", "is_new_object", "state", "list_items", "dict_items")
+
+    def __init__(self, callable_: Any, arguments: Any, *, keyword_arguments: Any = None,
+                 is_new_object: bool = False) -> None:
+        self.callable = callable_
+        self.arguments = arguments
+        self.keyword_arguments = keyword_arguments
+        self.is_new_object = is_new_object
+        self.state: Any = None
+        self.list_items: Optional[list[Any]] = None
+        self.dict_items: Optional[list[tuple[Any, Any]]] = None
+
+
+_MARK = object()
+
+
+class _PickleReader:
+    """
+    Executes the opcodes of a pickle stream, building a graph of nodes instead of the actual instances. Memoized
+    instances are shared nodes within the graph.
+    """
+    def __init__(self) -> None:
+        self.__stack: list[Any] = []
+        self.__memo: dict[int, Any] = {}
+        self.__protocol = 0
+
+    def __pop_mark(self) -> list[Any]:
+        stack = self.__stack
+        mark_index = len(stack) - 1 - stack[::-1].index(_MARK)
+        members = stack[mark_index + 1:]
+        del stack[mark_index:]
+        return members
+
+    def read(self, data: bytes) -> Any:
+        stack = self.__stack
+        # The type of the argument depends on the opcode (Ex. the memo index of BINPUT, or the bytes of BINBYTES).
+        argument: Any
+        for opcode, argument, position in pickletools.genops(data):
+            name = opcode.name
+            if name == "PROTO":
+                self.__protocol = argument
+                continue
+            if name == "FRAME":
+                continue
+            if name == "STOP":
+                break
+            if name == "MARK":
+                stack.append(_MARK)
+            elif name in ("NONE", "NEWTRUE", "NEWFALSE"):
+                stack.append({"NONE": None, "NEWTRUE": True, "NEWFALSE": False}[name])
+            elif name in ("INT", "BININT", "BININT1", "BININT2", "LONG", "LONG1", "LONG4", "FLOAT", "BINFLOAT",
+                          "UNICODE", "SHORT_BINUNICODE", "BINUNICODE", "BINUNICODE8"):
+                stack.append(argument)
+            elif name in ("SHORT_BINBYTES", "BINBYTES", "BINBYTES8"):
+                stack.append(_Bytes(argument))
+            elif name == "BYTEARRAY8":
+                stack.append(_Object(_Global("builtins", "bytearray"), _Tuple([_Bytes(argument)])))
+            elif name == "EMPTY_LIST":
+                stack.append(_List([]))
+            elif name == "EMPTY_DICT":
+                stack.append(_Dict([]))
+            elif name == "EMPTY_SET":
+                stack.append(_Set([]))
+            elif name == "EMPTY_TUPLE":
+                stack.append(_Tuple([]))
+            elif name == "LIST":
+                stack.append(_List(self.__pop_mark()))
+            elif name == "TUPLE":
+                stack.append(_Tuple(self.__pop_mark()))
+            elif name in ("TUPLE1", "TUPLE2", "TUPLE3"):
+                size = int(name[-1])
+                members = stack[-size:]
+                del stack[-size:]
+                stack.append(_Tuple(members))
+            elif name == "DICT":
+                members = self.__pop_mark()
+                stack.append(_Dict(list(zip(members[::2], members[1::2]))))
+            elif name == "FROZENSET":
+                stack.append(_Object(_Global("builtins", "frozenset"), _Tuple([_List(self.__pop_mark())])))
+            elif name == "APPEND":
+                self.__append(stack[-2], [stack.pop()])
+            elif name == "APPENDS":
+                members = self.__pop_mark()
+                self.__append(stack[-1], members)
+            elif name == "SETITEM":
+                value = stack.pop()
+                key = stack.pop()
+                self.__set_items(stack[-1], [(key, value)])
+            elif name == "SETITEMS":
+                members = self.__pop_mark()
+                self.__set_items(stack[-1], list(zip(members[::2], members[1::2])))
+            elif name == "ADDITEMS":
+                members = self.__pop_mark()
+                target = stack[-1]
+                if not isinstance(target, _Set):
+                    raise TranscodingError(f"Cannot add items to {type(target)} (At position {position})")
+                target.members.extend(members)
+            elif name == "GLOBAL":
+                module_name, qualified_name = argument.split(" ")
+                stack.append(self.__global(module_name, qualified_name))
+            elif name == "STACK_GLOBAL":
+                qualified_name = stack.pop()
+                module_name = stack.pop()
+                stack.append(self.__global(module_name, qualified_name))
+            elif name == "REDUCE":
+                arguments = stack.pop()
+                stack.append(_Object(stack.pop(), arguments))
+            elif name == "NEWOBJ":
+                arguments = stack.pop()
+                stack.append(_Object(stack.pop(), arguments, is_new_object=True))
+            elif name == "NEWOBJ_EX":
+                keyword_arguments = stack.pop()
+                arguments = stack.pop()
+                stack.append(_Object(stack.pop(), arguments, keyword_arguments=keyword_arguments,
+                                     is_new_object=True))
+            elif name == "BUILD":
+                state = stack.pop()
+                target = stack[-1]
+                if not isinstance(target, _Object) or target.state is not None:
+                    raise TranscodingError(f"Cannot set the state of {type(target)} (At position {position})")
+                target.state = state
+            elif name in ("PUT", "BINPUT", "LONG_BINPUT"):
+                self.__memo[argument] = stack[-1]
+            elif name == "MEMOIZE":
+                self.__memo[len(self.__memo)] = stack[-1]
+            elif name in ("GET", "BINGET", "LONG_BINGET"):
+                stack.append(self.__memo[argument])
+            elif name == "POP":
+                if not stack:
+                    raise TranscodingError(f"Cannot pop from an empty stack (At position {position})")
+                popped = stack.pop()
+                if isinstance(popped, _Object) and not popped.is_new_object:
+                    # The result of a call that was only made for its side effects (Ex. a state setter)
+                    raise TranscodingError(f"Calls that are made for their side effects cannot be transcoded (At "
+                                           f"position {position})")
+            elif name == "POP_MARK":
+                self.__pop_mark()
+            elif name == "DUP":
+                stack.append(stack[-1])
+            elif name == "PERSID":
+                stack.append(_Persistent(argument))
+            elif name == "BINPERSID":
+                stack.append(_Persistent(stack.pop()))
+            else:
+                raise TranscodingError(f"The {name} opcode is not supported (At position {position})")
+
+        return stack.pop()
+
+    def __global(self, module_name: str, qualified_name: str) -> _Global:
+        if self.__protocol < 3:
+            # Streams of older protocols may have been written by Python 2, so its names are mapped the same way
+            # pickle.Unpickler.find_class maps them.
+            if (module_name, qualified_name) in _compat_pickle.NAME_MAPPING:
+                module_name, qualified_name = _compat_pickle.NAME_MAPPING[(module_name, qualified_name)]
+            elif module_name in _compat_pickle.IMPORT_MAPPING:
+                module_name = _compat_pickle.IMPORT_MAPPING[module_name]
+
+        return _Global(module_name, qualified_name)
+
+    @staticmethod
+    def __append(target: Any, members: list[Any]) -> None:
+        if isinstance(target, _List):
+            target.members.extend(members)
+        elif isinstance(target, _Object):
+            target.list_items = (target.list_items or []) + members
+        else:
+            raise TranscodingError(f"Cannot append items to {type(target)}")
+
+    @staticmethod
+    def __set_items(target: Any, items: list[tuple[Any, Any]]) -> None:
+        if isinstance(target, _Dict):
+            target.members.extend(items)
+        elif isinstance(target, _Object):
+            target.dict_items = (target.dict_items or []) + items
+        else:
+            raise TranscodingError(f"Cannot set items of {type(target)}")
+
+
+class _DocumentBuilder:
+    """
+    Reduces a graph of nodes the same way the Pickler reduces the instances they stand for. Nodes that are encountered
+    more than once are reduced by reference.
+    """
+    def __init__(self) -> None:
+        self.current_path: list[str] = []
+        self.__references: dict[int, str] = {}
+        # Some nodes are created while building (Ex. the argument lists of reduce forms). They are kept alive, so their
+        # ids will not be reused by other nodes.
+        self.__built_nodes: list[Any] = []
+
+    def build(self, node: Any, *, relative_key: str) -> Jsonable:
+        if isinstance(node, _NATIVE_TYPES):
+            return node
+
+        self.current_path.append(relative_key)
+        try:
+            if isinstance(node, _Global):
+                return {"import_string": f"{node.module_name}/{node.qualified_name}", STRATEGY_KEY: "import"}
+
+            if isinstance(node, _Persistent):
+                return {"key": node.key, STRATEGY_KEY: PERSISTENT_STRATEGY_NAME}
+
+            existing_reference = self.__references.get(id(node))
+            if existing_reference is not None:
+                return {"reference": existing_reference, STRATEGY_KEY: REFERENCE_STRATEGY_NAME}
+
+            self.__references[id(node)] = REFERENCE_SEPARATOR.join(self.current_path)
+            self.__built_nodes.append(node)
+            return self.__build_node(node)
+        finally:
+            self.current_path.pop()
+
+    def __build_members(self, members: list[Any]) -> list[Jsonable]:
+        return [self.build(member, relative_key=str(i)) for i, member in enumerate(members)]
+
+    def __build_node(self, node: Any) -> Jsonable:
+        if isinstance(node, _List):
+            return self.__build_members(node.members)
+        if isinstance(node, _Tuple):
+            return {"value": self.__build_members(node.members), STRATEGY_KEY: "tuple"}
+        if isinstance(node, _Set):
+            return {"value": self.__build_members(node.members), STRATEGY_KEY: "set"}
+        if isinstance(node, _Bytes):
+            return {"buffer": base64.b64encode(node.value).decode("utf-8"), STRATEGY_KEY: "bytes"}
+        if isinstance(node, _Dict):
+            reduced_dict: dict[str, Jsonable] = {}
+            for i, (key, value) in enumerate(node.members):
+                if type(key) is not str:
+                    raise TranscodingError(f"Dicts with keys of type {type(key)} are not supported (At "
+                                           f"{REFERENCE_SEPARATOR.join(self.current_path)})")
+                reduced_dict[key] = self.build(value, relative_key=str(i))
+            reduced_dict[STRATEGY_KEY] = "dict"
+            return reduced_dict
+
+        assert isinstance(node, _Object), f"Unexpected node of type {type(node)}"
+        reduced_temporal = self.__build_temporal(node)
+        if reduced_temporal is not None:
+            return reduced_temporal
+
+        if node.is_new_object:
+            return self.__build_new_object(node)
+
+        return {"reduce": self.__build_reduce(node, node.callable, node.arguments), STRATEGY_KEY: "default"}
+
+    def __build_temporal(self, node: _Object) -> Optional[Jsonable]:
+        callable_ = node.callable
+        if (
+                node.is_new_object or node.state is not None or node.list_items or node.dict_items or
+                not isinstance(callable_, _Global) or callable_.module_name != "datetime" or
+                callable_.qualified_name not in _TEMPORAL_TYPES or not isinstance(node.arguments, _Tuple)
+        ):
+            return None
+
+        strategy_name = callable_.qualified_name
+        arguments = node.arguments.members
+        if strategy_name == "timedelta":
+            if not all(type(argument) is int for argument in arguments):
+                return None
+            return {"total_seconds": timedelta(*arguments).total_seconds(), STRATEGY_KEY: "timedelta"}
+
+        # Dates and times are pickled as their binary representation (and their tzinfo), which is exactly what their
+        # constructors accept. The tzinfo is left out, so no user code is run.
+        if not arguments or not isinstance(arguments[0], _Bytes) or len(arguments) > 2:
+            return None
+
+        value = _TEMPORAL_TYPES[strategy_name](arguments[0].value)
+        if strategy_name == "date":
+            return {"value": value.isoformat(), STRATEGY_KEY: "date"}
+
+        tzinfo = arguments[1] if len(arguments) > 1 else None
+        return {
+            "value": value.isoformat(),
+            "fold": value.fold,
+            "tzinfo": self.build(tzinfo, relative_key="tzinfo"),
+            STRATEGY_KEY: strategy_name,
+        }
+
+    def __build_new_object(self, node: _Object) -> Jsonable:
+        if node.list_items or node.dict_items or not isinstance(node.callable, _Global):
+            # Only the reduce form can express list/dict items.
+            if node.keyword_arguments is None:
+                arguments = _List([node.callable, *node.arguments.members])
+                return {"reduce": self.__build_reduce(node, _Global("copyreg", "__newobj__"), arguments),
+                        STRATEGY_KEY: "default"}
+
+            arguments = _List([node.callable, node.arguments, node.keyword_arguments])
+            return {"reduce": self.__build_reduce(node, _Global("copyreg", "__newobj_ex__"), arguments),
+                    STRATEGY_KEY: "default"}
+
+        reduced_object: dict[str, Jsonable] = {
+            "type": f"{node.callable.module_name}/{node.callable.qualified_name}",
+        }
+        if node.arguments.members:
+            # Like the Pickler, positional arguments are reduced as a list unless keyword arguments are given as well.
+            new_args = node.arguments if node.keyword_arguments is not None else _List(node.arguments.members)
+            reduced_object["new_args"] = self.build(new_args, relative_key="new_args")
+        if node.keyword_arguments is not None and node.keyword_arguments.members:
+            reduced_object["new_kwargs"] = self.build(node.keyword_arguments, relative_key="new_kwargs")
+        if node.state is not None:
+            reduced_object["state"] = self.build(node.state, relative_key="state")
+
+        reduced_object[STRATEGY_KEY] = "default"
+        return reduced_object
+
+    def __build_reduce(self, node: _Object, callable_: Any, arguments: Any) -> list[Jsonable]:
+        if isinstance(arguments, _Tuple):
+            # The Pickler reduces the arguments as a (new) list
+            arguments = _List(arguments.members)
+
+        flattened_reduce = [
+            self.build(callable_, relative_key="0"),
+            self.build(arguments, relative_key="1"),
+        ]
+        if node.state is None and node.list_items is None and node.dict_items is None:
+            return flattened_reduce
+
+        flattened_reduce.append(self.build(node.state, relative_key="2"))
+        flattened_reduce.append(None if node.list_items is None else self.build(_List(node.list_items),
+                                                                                relative_key="3"))
+        if node.dict_items is not None:
+            pairs = _List([_List([key, value]) for key, value in node.dict_items])
+            flattened_reduce.append(self.build(pairs, relative_key="4"))
+
+        return flattened_reduce
+
+
+def pickle_to_kelpickle(data: bytes) -> str:
+    """
+    Convert a pickle stream into the output Pickler.pickle would have produced for the pickled instance (up to the
+    formatting of instances that may be reduced in multiple ways).
+
+    :param data: A pickle stream of protocol 2 or above
+    :return: The serialized instance
+    """
+    root = _PickleReader().read(data)
+    return json.dumps(_DocumentBuilder().build(root, relative_key=ROOT_RELATIVE_KEY))
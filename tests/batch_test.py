@@ -0,0 +1,50 @@
+from datetime import datetime, date, timedelta, timezone
+
+import pytest
+
+import kelpickle.kelpickling
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import TzInfo
+
+
+def _build_homogeneous_runs() -> list:
+    tzinfo = TzInfo(timedelta(hours=1))
+    return [
+        *[datetime(2020, 1, 1, i) for i in range(5)],
+        *[datetime(2020, 1, 1, i, tzinfo=tzinfo) for i in range(5)],
+        datetime(2020, 1, 1, fold=1),
+        *[date(2020, 1, i) for i in range(1, 6)],
+        *[bytes([i]) * i for i in range(5)],
+        *[timedelta(seconds=i) for i in range(5)],
+        *range(5),
+        *[str(i) for i in range(5)],
+    ]
+
+
+def test_batches_are_reduced_like_single_instances(monkeypatch: pytest.MonkeyPatch):
+    values = _build_homogeneous_runs()
+    batched = Pickler().pickle(values)
+
+    monkeypatch.setattr(kelpickle.kelpickling, "MIN_BATCH_SIZE", len(values) + 1)
+    assert batched == Pickler().pickle(values)
+
+
+@pytest.mark.parametrize("container_type", [list, tuple, set])
+def test_batches_are_restored(container_type: type):
+    values = container_type(_build_homogeneous_runs())
+
+    restored = Unpickler().unpickle(Pickler().pickle(values))
+
+    assert restored == values
+    assert type(restored) is container_type
+
+
+def test_references_within_batches_are_kept():
+    shared = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    values = [shared, datetime(2021, 1, 1, tzinfo=timezone.utc), shared, shared, shared]
+
+    restored = Unpickler().unpickle(Pickler().pickle(values))
+
+    assert restored == values
+    assert all(value is restored[0] for value in restored[2:])
+    assert restored[1].tzinfo is restored[0].tzinfo
@@ -0,0 +1,96 @@
+import gc
+import threading
+
+import pytest
+
+from kelpickle.bulk_load import bulk_load, paused_gc
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import DataClass
+
+
+@pytest.fixture(autouse=True)
+def enabled_gc():
+    gc.enable()
+    yield
+    gc.unfreeze()
+    gc.enable()
+
+
+def test_bulk_load_pauses_gc():
+    instances = [DataClass([i, {"value": i}]) for i in range(2000)]
+    serialized = Pickler().pickle(instances)
+    unpickler = Unpickler(bulk_load=True)
+    callbacks: list[str] = []
+
+    def record_collection(phase: str, _: dict) -> None:
+        callbacks.append(phase)
+
+    gc.callbacks.append(record_collection)
+    try:
+        restored = unpickler.unpickle(serialized)
+    finally:
+        gc.callbacks.remove(record_collection)
+
+    assert restored == instances
+    # At most a single collection, once the collector is resumed
+    assert callbacks.count("start") <= 1
+    assert gc.isenabled()
+    report = unpickler.last_bulk_load_report
+    assert report is not None and report.paused
+    assert sum(report.avoided_collections) > 0
+    assert report.frozen_objects == 0
+
+
+def test_bulk_load_freezes_result():
+    unpickler = Unpickler(freeze_gc=True)
+
+    restored = unpickler.unpickle(Pickler().pickle([DataClass(i) for i in range(100)]))
+
+    assert gc.get_freeze_count() >= len(restored)
+    assert unpickler.last_bulk_load_report.frozen_objects >= len(restored)
+
+
+def test_nested_pauses():
+    with paused_gc():
+        with paused_gc():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+
+def test_disabled_gc_is_kept_disabled():
+    gc.disable()
+    with bulk_load() as report:
+        pass
+
+    assert not gc.isenabled()
+    assert not report.paused
+    assert report.avoided_collections == (0, 0, 0)
+
+
+def test_concurrent_pauses():
+    entered = threading.Barrier(2)
+    first_exited = threading.Event()
+
+    def first_load() -> None:
+        with bulk_load():
+            entered.wait()
+        first_exited.set()
+
+    thread = threading.Thread(target=first_load)
+    thread.start()
+    with bulk_load():
+        entered.wait()
+        first_exited.wait()
+        # The other load has ended, but this one is still in progress
+        assert not gc.isenabled()
+    thread.join()
+
+    assert gc.isenabled()
+
+
+def test_gc_is_resumed_after_failure():
+    with pytest.raises(Exception):
+        Unpickler(bulk_load=True).unpickle("{")
+
+    assert gc.isenabled()
@@ -0,0 +1,48 @@
+from kelpickle import fingerprint
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import DataClass, FrozenDataClass
+
+
+def _build_differently_ordered_values() -> tuple[object, object]:
+    first = {
+        "a": 1,
+        "b": {"x", "y", "z", 1, 2.5},
+        "c": frozenset({(1, 2), (3, 4)}),
+        "d": {FrozenDataClass(1), FrozenDataClass(2)},
+        "e": DataClass(-0.0),
+    }
+    second = {
+        "e": DataClass(0.0),
+        "d": {FrozenDataClass(2), FrozenDataClass(1)},
+        "c": frozenset({(3, 4), (1, 2)}),
+        "b": {2.5, 1, "z", "y", "x"},
+        "a": 1,
+    }
+    return first, second
+
+
+def test_equal_instances_are_serialized_identically():
+    first, second = _build_differently_ordered_values()
+
+    serialized = Pickler(canonical=True).pickle(first)
+
+    assert serialized == Pickler(canonical=True).pickle(second)
+    assert Unpickler().unpickle(serialized) == first
+
+
+def test_equal_instances_have_equal_fingerprints():
+    first, second = _build_differently_ordered_values()
+
+    assert fingerprint(first) == fingerprint(second)
+    assert fingerprint(first) != fingerprint({**first, "a": 2})
+    assert fingerprint([1]) != fingerprint([1.0])
+
+
+def test_references_are_kept_in_canonical_mode():
+    shared = DataClass(1)
+    value = {"z": shared, "a": [shared]}
+
+    restored = Unpickler().unpickle(Pickler(canonical=True).pickle(value))
+
+    assert restored == value
+    assert restored["a"][0] is restored["z"]
@@ -0,0 +1,51 @@
+import io
+
+import pytest
+
+from kelpickle.compression import FRAME_MAGIC
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import DataClass
+
+VALUE = {"users": [DataClass(i) for i in range(1000)], "name": "some name"}
+
+
+def test_uncompressed_dump_is_identical_to_pickle():
+    fp = io.BytesIO()
+    Pickler().dump(VALUE, fp)
+
+    assert fp.getvalue().decode() == Pickler().pickle(VALUE)
+
+
+@pytest.mark.parametrize("compression", [None, "zlib", "lzma", "bz2"])
+def test_dump_and_load(compression):
+    fp = io.BytesIO()
+    Pickler().dump(VALUE, fp, compression=compression)
+    fp.seek(0)
+
+    assert Unpickler().load(fp) == VALUE
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma", "bz2"])
+def test_compressed_output_is_framed(compression):
+    fp = io.BytesIO()
+    Pickler().dump(VALUE, fp, compression=compression)
+
+    assert fp.getvalue().startswith(FRAME_MAGIC)
+    assert len(fp.getvalue()) < len(Pickler().pickle(VALUE)) / 10
+
+
+def test_unsupported_compression():
+    with pytest.raises(ValueError):
+        Pickler().dump(VALUE, io.BytesIO(), compression="zip")
+
+
+def test_load_after_failed_load():
+    unpickler = Unpickler()
+    with pytest.raises(KeyError):
+        unpickler.load(io.BytesIO(b'[[1], {"kelp/strategy": "unknown strategy"}]'))
+
+    fp = io.BytesIO()
+    Pickler().dump([[2]], fp)
+    fp.seek(0)
+
+    assert unpickler.load(fp) == [[2]]
@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import FrozenDataClass, DataClass
+
+
+def _distinct_copy(value: str) -> str:
+    return "".join(list(value))
+
+
+def test_equal_strings_are_shared():
+    message = "Connection to the upstream server was reset by peer, retrying in 5 seconds " * 3
+    records = [{"level": "INFO", "message": _distinct_copy(message)} for _ in range(100)]
+
+    regular = Pickler().pickle(records)
+    deduplicated = Pickler(deduplicate_immutables=True).pickle(records)
+    restored = Unpickler().unpickle(deduplicated)
+
+    assert restored == records
+    assert len(deduplicated) < len(regular) / 2
+    assert all(record["message"] is restored[0]["message"] for record in restored)
+
+
+def test_short_strings_are_not_deduplicated():
+    serialized = Pickler(deduplicate_immutables=True).pickle(["short", _distinct_copy("short")])
+
+    assert "reference" not in serialized
+
+
+def test_equal_immutable_values_are_shared():
+    values = [
+        (1, "a", (2.5, None)),
+        datetime(2020, 1, 1, tzinfo=timezone.utc),
+        FrozenDataClass((1, 2)),
+    ]
+    copies = [(1, "a", (2.5, None)), datetime(2020, 1, 1, tzinfo=timezone.utc), FrozenDataClass((1, 2))]
+
+    restored = Unpickler().unpickle(Pickler(deduplicate_immutables=True).pickle(values + copies))
+
+    assert restored == values + copies
+    for original, copy in zip(restored[:3], restored[3:]):
+        assert original is copy
+
+
+def test_values_of_different_types_are_not_shared():
+    values = [(1,), (1.0,), (True,), (0.0,), (-0.0,)]
+
+    restored = Unpickler().unpickle(Pickler(deduplicate_immutables=True).pickle(values))
+
+    assert [type(value[0]) for value in restored] == [int, float, bool, float, float]
+    assert str(restored[4][0]) == "-0.0"
+
+
+def test_mutable_members_are_not_shared():
+    values = [(DataClass(1),), (DataClass(1),)]
+
+    restored = Unpickler().unpickle(Pickler(deduplicate_immutables=True).pickle(values))
+
+    assert restored == values
+    assert restored[0] is not restored[1]
+
+
+def test_identity_references_to_deduplicated_instances():
+    first = (1, 2)
+    second = (1, 2)
+    values = [first, second, second]
+
+    restored = Unpickler().unpickle(Pickler(deduplicate_immutables=True).pickle(values))
+
+    assert restored == values
+    assert restored[0] is restored[1] is restored[2]
+
+
+def test_strings_shared_from_long_runs():
+    message = "Connection to the upstream server was reset by peer, retrying in 5 seconds"
+    records = [["a", "b", "c", message], _distinct_copy(message)]
+
+    restored = Unpickler().unpickle(Pickler(deduplicate_immutables=True).pickle(records))
+
+    assert restored == records
+    assert restored[1] is restored[0][3]
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import kelpickle
+from kelpickle.kelpickling import Pickler
+from tests.objects_db import DataClass, TestParameters, TzInfo, FrozenDataClass, CustomStateDataClass, \
+    CustomReduceClass, CustomReduceExClass, SlottedClass, SlottedClassWithDynamicDict
+
+
+@pytest.mark.parametrize(['test_value'], [
+    [TestParameters("complex", 1 + 2j)],
+    [TestParameters("bytes", b'\x00\x01\x02')],
+    [TestParameters("nested containers", {"a": [1, (2, 3), {4, 5}]})],
+    [TestParameters("range", range(1))],
+    [TestParameters("instance", DataClass([1, 2]))],
+    [TestParameters("frozen instance", FrozenDataClass(3))],
+    [TestParameters("instance with get/set state", CustomStateDataClass(3))],
+    [TestParameters("instance with reduce", CustomReduceClass(3))],
+    [TestParameters("instance with reduce_ex", CustomReduceExClass(Pickler.PICKLE_PROTOCOL, 1))],
+    [TestParameters("instance with slots", SlottedClass(3))],
+    [TestParameters("instance with slots and dynamic dict", SlottedClassWithDynamicDict(3, 4))],
+    [TestParameters("custom tz aware datetime", datetime(2020, 1, 1, 10, tzinfo=TzInfo(timedelta(hours=1))))],
+    ],
+    ids=lambda x: x.description
+)
+def test_equal_values(test_value: TestParameters):
+    copied_value = kelpickle.deepcopy(test_value.value)
+
+    assert copied_value == test_value.value
+    assert type(copied_value) is type(test_value.value)
+
+
+def test_mutable_values_are_copied():
+    value = DataClass([1, 2])
+
+    copied_value = kelpickle.deepcopy(value)
+    copied_value.x.append(3)
+
+    assert value.x == [1, 2]
+
+
+def test_references_and_cycles_are_kept():
+    shared = DataClass(1)
+    value = [shared, {"shared": shared}]
+    value.append(value)
+
+    copied_value = kelpickle.deepcopy(value)
+
+    assert copied_value[0] is not shared
+    assert copied_value[1]["shared"] is copied_value[0]
+    assert copied_value[2] is copied_value
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from kelpickle.delta import squash_deltas, DELTA_KEY
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import DataClass
+
+
+def test_unchanged_state_yields_empty_delta():
+    state = {"users": [DataClass(i) for i in range(10)]}
+    pickler = Pickler()
+
+    _, fingerprints = pickler.pickle_snapshot(state)
+    delta, _ = pickler.pickle_delta(state, fingerprints)
+
+    assert json.loads(delta) == {DELTA_KEY: []}
+
+
+def test_delta_contains_only_changed_subtrees():
+    state = {"users": [DataClass(i) for i in range(100)], "version": 1}
+    pickler = Pickler()
+
+    base, fingerprints = pickler.pickle_snapshot(state)
+    state["users"][50].x = "changed"
+    delta, _ = pickler.pickle_delta(state, fingerprints)
+
+    patches = json.loads(delta)[DELTA_KEY]
+    assert len(patches) == 1
+    assert len(delta) < len(base) / 20
+
+
+def test_chain_of_deltas():
+    state = {"users": [DataClass(i) for i in range(5)], "version": 1}
+    pickler = Pickler()
+
+    base, fingerprints = pickler.pickle_snapshot(state)
+    deltas = []
+
+    state["version"] = 2
+    delta, fingerprints = pickler.pickle_delta(state, fingerprints)
+    deltas.append(delta)
+
+    state["users"].append(DataClass(5))
+    state["users"][0].x = [1, 2, 3]
+    delta, fingerprints = pickler.pickle_delta(state, fingerprints)
+    deltas.append(delta)
+
+    state["owner"] = state["users"][0]
+    delta, fingerprints = pickler.pickle_delta(state, fingerprints)
+    deltas.append(delta)
+
+    restored = Unpickler().unpickle_with_deltas(base, deltas)
+    assert restored == state
+    assert restored["owner"] is restored["users"][0]
+    assert Unpickler().unpickle(squash_deltas(base, deltas)) == state
+
+
+def test_root_type_change():
+    pickler = Pickler()
+
+    base, fingerprints = pickler.pickle_snapshot([1, 2])
+    delta, _ = pickler.pickle_delta({"a": 1}, fingerprints)
+
+    assert Unpickler().unpickle_with_deltas(base, [delta]) == {"a": 1}
+
+
+def test_failed_snapshot_does_not_leak_references():
+    pickler = Pickler()
+    shared = [1]
+    with pytest.raises(TypeError):
+        pickler.pickle_snapshot([shared, (i for i in range(1))])
+
+    serialized, _ = pickler.pickle_snapshot([[0], shared])
+
+    assert Unpickler().unpickle(serialized) == [[0], [1]]
+
+
+def test_failed_unpickle_with_deltas_does_not_leak_references():
+    unpickler = Unpickler()
+    with pytest.raises(KeyError):
+        unpickler.unpickle_with_deltas('[[1], {"kelp/strategy": "unknown strategy"}]', [])
+
+    assert unpickler.unpickle_with_deltas(Pickler().pickle([[2]]), []) == [[2]]
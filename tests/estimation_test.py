@@ -0,0 +1,29 @@
+from datetime import datetime
+
+import pytest
+
+from kelpickle.kelpickling import Pickler
+from tests.objects_db import DataClass, TestParameters
+
+
+@pytest.mark.parametrize(['test_value'], [
+    [TestParameters("natives", [None, True, False, 1, -20, 1.5, "abc", 'quote " and \\ backslash'])],
+    [TestParameters("unicode", ["אבג", "\U0001F600"])],
+    [TestParameters("nested containers", {"a": [1, (2, 3), {4, 5}], "b": {}, "c": []})],
+    [TestParameters("instances", [DataClass(i) for i in range(10)] + [datetime(2020, 1, 1), b"bytes"])],
+    ],
+    ids=lambda x: x.description
+)
+def test_estimated_size(test_value: TestParameters):
+    assert Pickler().estimate(test_value.value).size == len(Pickler().pickle(test_value.value))
+
+
+def test_node_counts():
+    shared = DataClass([1, 2])
+    estimate = Pickler().estimate([shared, shared, "a"])
+
+    assert estimate.references == 1
+    assert estimate.nodes_per_type[DataClass] == 1
+    assert estimate.nodes_per_type[int] == 2
+    assert estimate.nodes_per_strategy["default"] == 1
+    assert estimate.nodes == sum(estimate.nodes_per_type.values())
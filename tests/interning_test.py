@@ -0,0 +1,52 @@
+import json
+
+from kelpickle.interning import StringInterner
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import DataClass
+
+
+def test_dict_keys_are_interned():
+    serialized = Pickler().pickle([{"some_key": 1}, DataClass(2)])
+
+    # Every parse creates its own strings
+    first_restored = Unpickler().unpickle(serialized)
+    second_restored = Unpickler().unpickle(serialized)
+
+    assert next(iter(first_restored[0])) is next(iter(second_restored[0]))
+    assert next(iter(vars(first_restored[1]))) is next(iter(vars(second_restored[1])))
+
+
+def test_string_values_are_interned():
+    interner = StringInterner()
+    values = [{"status": "active", "name": f"user{i}"} for i in range(10)] + ["active"] * 10
+    serialized = Pickler().pickle(values)
+
+    restored = Unpickler(string_interner=interner).unpickle(serialized)
+    statistics = interner.statistics()
+
+    assert restored == values
+    assert all(value is restored[-1] for value in restored[10:])
+    assert all(instance["status"] is restored[-1] for instance in restored[:10])
+    assert statistics.hits == 19
+    assert statistics.saved_bytes > 0
+
+
+def test_interning_table_is_bounded():
+    interner = StringInterner(max_size=2, max_length=5)
+    values = ["a", "b", "c", "c", "long string"]
+
+    restored = Unpickler(string_interner=interner).unpickle(json.dumps(values))
+
+    assert restored == values
+    assert len(interner) == 2
+    assert interner.statistics().hits == 0
+
+
+def test_deduplicated_strings_are_interned():
+    value = "x" * 100
+    serialized = Pickler(deduplicate_immutables=True).pickle([value, "".join(value)])
+
+    restored = Unpickler(string_interner=StringInterner()).unpickle(serialized)
+
+    assert restored == [value, value]
+    assert restored[0] is restored[1]
@@ -0,0 +1,95 @@
+import subprocess
+import sys
+from datetime import datetime
+
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+def _run_isolated(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def test_custom_strategies_are_not_imported_eagerly():
+    output = _run_isolated(
+        "import sys, kelpickle.kelpickling\n"
+        "print(sorted(name for name in sys.modules if 'custom_strategies.' in name or name == 'bidict'))"
+    )
+
+    assert output == "[]"
+
+
+def test_optional_features_are_not_imported_eagerly():
+    output = _run_isolated(
+        "import sys, kelpickle.kelpickling\n"
+        "print(sorted(name for name in sys.modules if name.startswith('kelpickle.') and\n"
+        "             name.count('.') == 1 and name not in ('kelpickle.common', 'kelpickle.errors',\n"
+        "                                                   'kelpickle.kelpickling', 'kelpickle.strategies')))"
+    )
+
+    assert output == "[]"
+
+
+def test_strategy_is_imported_upon_type_lookup():
+    output = _run_isolated(
+        "import sys\n"
+        "from datetime import datetime\n"
+        "from kelpickle.kelpickling import Pickler\n"
+        "Pickler().pickle(datetime(2020, 1, 1))\n"
+        "print('custom_strategies.datetime_strategy' in str(list(sys.modules)))"
+    )
+
+    assert output == "True"
+
+
+def test_strategy_is_imported_upon_name_lookup():
+    serialized = Pickler().pickle(datetime(2020, 1, 1))
+
+    output = _run_isolated(
+        "from kelpickle.kelpickling import Unpickler\n"
+        f"print(repr(Unpickler().unpickle({serialized!r})))"
+    )
+
+    assert output == repr(datetime(2020, 1, 1))
+    assert Unpickler().unpickle(serialized) == datetime(2020, 1, 1)
+
+
+def test_concurrent_import_and_lazy_lookup(tmp_path):
+    # One thread imports a strategy module directly, while another one looks its strategy up lazily.
+    (tmp_path / "slow_strategy_module.py").write_text(
+        "import time\n"
+        "from kelpickle.strategies.base_strategy import BaseStrategy, register_strategy\n"
+        "import lookup_events\n"
+        "lookup_events.importing.set()\n"
+        "lookup_events.lookup_started.wait(5)\n"
+        "time.sleep(0.1)\n"
+        "class SlowType:\n"
+        "    pass\n"
+        "@register_strategy(name='slow_strategy', supported_types=SlowType, auto_generate_reduction_references=False)\n"
+        "class SlowStrategy(BaseStrategy):\n"
+        "    def reduce(self, instance, pickler):\n"
+        "        return {}\n"
+        "    def restore_base(self, reduced_instance, unpickler):\n"
+        "        return SlowType()\n"
+    )
+    output = _run_isolated(
+        f"import sys, threading, types\n"
+        f"sys.path.insert(0, {str(tmp_path)!r})\n"
+        "events = types.ModuleType('lookup_events')\n"
+        "events.importing, events.lookup_started = threading.Event(), threading.Event()\n"
+        "sys.modules['lookup_events'] = events\n"
+        "from kelpickle.strategies.base_strategy import register_lazy_strategy, get_strategy_named\n"
+        "register_lazy_strategy('slow_strategy_module', name='slow_strategy', supported_type_names=())\n"
+        "importer = threading.Thread(target=__import__, args=('slow_strategy_module',), daemon=True)\n"
+        "importer.start()\n"
+        "events.importing.wait(5)\n"
+        "results = []\n"
+        "lookup = threading.Thread(target=lambda: results.append(get_strategy_named('slow_strategy').name),\n"
+        "                          daemon=True)\n"
+        "lookup.start()\n"
+        "events.lookup_started.set()\n"
+        "lookup.join(5)\n"
+        "importer.join(5)\n"
+        "print(results)\n"
+    )
+
+    assert output == "['slow_strategy']"
@@ -0,0 +1,98 @@
+import io
+import time
+
+import pytest
+
+from kelpickle.compression import read_document
+from kelpickle.errors import ResourceLimitExceeded, PicklingError
+from kelpickle.kelpickling import Pickler, Unpickler
+from kelpickle.limits import ResourceLimits
+
+
+def _nested_lists(depth: int) -> list:
+    value: list = []
+    for _ in range(depth):
+        value = [value]
+    return value
+
+
+def test_max_depth():
+    limits = ResourceLimits(max_depth=10)
+    serialized = Pickler().pickle(_nested_lists(20))
+
+    with pytest.raises(ResourceLimitExceeded) as pickling_error:
+        Pickler(limits=limits).pickle(_nested_lists(20))
+    with pytest.raises(ResourceLimitExceeded) as unpickling_error:
+        Unpickler(limits=limits).unpickle(serialized)
+
+    for error in (pickling_error.value, unpickling_error.value):
+        assert error.limit == "max_depth"
+        assert error.path == "->".join(["$ROOT"] + ["0"] * 10)
+
+
+def test_max_nodes():
+    limits = ResourceLimits(max_nodes=100)
+    value = list(range(1000))
+
+    with pytest.raises(ResourceLimitExceeded) as error:
+        Pickler(limits=limits).pickle(value)
+    assert error.value.path == "$ROOT->99"
+
+    with pytest.raises(ResourceLimitExceeded):
+        Unpickler(limits=limits).unpickle(Pickler().pickle(value))
+
+
+def test_max_bytes():
+    limits = ResourceLimits(max_bytes=1000)
+    value = ["a" * 100] * 20
+
+    with pytest.raises(ResourceLimitExceeded) as error:
+        Pickler(limits=limits).pickle(value)
+    assert error.value.limit == "max_bytes"
+
+    with pytest.raises(ResourceLimitExceeded):
+        Pickler(limits=limits).dump(list(range(500)), io.BytesIO())
+
+    with pytest.raises(ResourceLimitExceeded):
+        Unpickler(limits=limits).unpickle(Pickler().pickle(value))
+
+
+@pytest.mark.parametrize('compression', [None, 'zlib', 'lzma', 'bz2'])
+def test_max_bytes_of_compressed_files(compression):
+    fp = io.BytesIO()
+    Pickler().dump("a" * 10_000_000, fp, compression=compression)
+
+    fp.seek(0)
+    with pytest.raises(ResourceLimitExceeded) as error:
+        Unpickler(limits=ResourceLimits(max_bytes=1000)).load(fp)
+    assert error.value.limit == "max_bytes"
+
+    # The document is only decompressed up to the limit
+    fp.seek(0)
+    assert len(read_document(fp, max_size=1000)) == 1001
+
+
+def test_max_seconds():
+    class Slow:
+        def __reduce__(self):
+            time.sleep(0.01)
+            return Slow, ()
+
+    with pytest.raises(ResourceLimitExceeded) as error:
+        Pickler(limits=ResourceLimits(max_seconds=0.05, check_interval=1)).pickle([Slow() for _ in range(20)])
+    assert error.value.limit == "max_seconds"
+
+
+def test_values_within_limits():
+    limits = ResourceLimits(max_depth=5, max_nodes=100, max_bytes=10_000, max_seconds=10)
+    value = {"a": [1, 2, (3, "b")], "c": None}
+    pickler = Pickler(limits=limits)
+    unpickler = Unpickler(limits=limits)
+
+    for _ in range(10):
+        # The budget is reset for every call
+        assert unpickler.unpickle(pickler.pickle(value)) == value
+
+
+def test_pickling_error_message():
+    assert "failed" in str(PicklingError("failed", instance=1))
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections import namedtuple
 from dataclasses import dataclass
 from datetime import tzinfo, timedelta, datetime
-from typing import Any, TypeVar
+from enum import Enum, Flag
+from typing import Any, NamedTuple, TypeVar
 
 from kelpickle.kelpickling import Pickler
 
@@ -120,3 +122,25 @@ class TzInfo(tzinfo):
 
     def __eq__(self, other):
         return type(self) == type(other) and self.offset == other.offset
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = "green"
+
+
+class Permission(Flag):
+    READ = 1
+    WRITE = 2
+
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+class TypedPoint(NamedTuple):
+    x: Any
+    y: Any = 0
+
+
+class NamedTupleWithDict(TypedPoint):
+    pass
@@ -0,0 +1,34 @@
+from datetime import datetime, date, time, timedelta, timezone
+
+import pytest
+
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+def _build_value() -> dict:
+    shared_day = date(2020, 1, 1)
+    return {
+        "days": [shared_day, date(2020, 1, 2), shared_day],
+        "naive": datetime(2020, 1, 1, 10, fold=1),
+        "aware": datetime(2020, 1, 1, 10, tzinfo=timezone.utc),
+        "time": time(10),
+        "duration": timedelta(days=1, seconds=2),
+        "buffer": b"\x00\x01",
+    }
+
+
+@pytest.mark.parametrize("encode", [str, str.encode, lambda text: bytearray(text.encode()),
+                                    lambda text: memoryview(text.encode())])
+def test_bytes_like_inputs_are_accepted(encode):
+    value = _build_value()
+    serialized = Pickler().pickle(value)
+
+    assert Unpickler().unpickle(encode(serialized)) == value
+    assert Unpickler(restore_while_parsing=True).unpickle(encode(serialized)) == value
+
+
+def test_instances_restored_while_parsing_keep_their_references():
+    restored = Unpickler(restore_while_parsing=True).unpickle(Pickler().pickle(_build_value()))
+
+    assert restored["days"][2] is restored["days"][0]
+    assert restored["naive"].fold == 1
@@ -0,0 +1,67 @@
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from kelpickle.errors import RestoreError
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import DataClass
+
+
+def test_indexed_output_is_identical_to_regular_output():
+    value = {"users": [DataClass(1), DataClass("a"), (1, 2.5, None)], "created": datetime(2020, 1, 1)}
+
+    serialized, index = Pickler().pickle_with_index(value)
+
+    assert serialized == Pickler().pickle(value)
+    assert "$ROOT" in index
+
+
+def test_index_is_json_serializable():
+    serialized, index = Pickler().pickle_with_index([[1], [2]])
+    loaded_index = json.loads(json.dumps(index))
+
+    assert Unpickler().unpickle_path(serialized, loaded_index, "$ROOT->1") == [2]
+
+
+@pytest.mark.parametrize("source_type", [str, bytes, io.BytesIO])
+def test_unpickle_path(source_type):
+    value = {"users": [DataClass(1), DataClass(2), DataClass(3)]}
+    serialized, index = Pickler().pickle_with_index(value)
+    source = serialized if source_type is str else source_type(serialized.encode())
+
+    # The dict strategy uses the index of each item as its relative key.
+    restored = Unpickler().unpickle_path(source, index, "$ROOT->0->2")
+
+    assert restored == DataClass(3)
+
+
+def test_unpickle_path_resolves_outer_references_on_demand():
+    shared = DataClass(1)
+    value = [shared, [DataClass(2), shared]]
+    serialized, index = Pickler().pickle_with_index(value)
+
+    restored = Unpickler().unpickle_path(serialized, index, "$ROOT->1")
+
+    assert restored == [DataClass(2), DataClass(1)]
+
+
+def test_unpickle_path_does_not_restore_containing_instance():
+    value = [1]
+    value.append([value])
+    serialized, index = Pickler().pickle_with_index(value)
+
+    with pytest.raises(RestoreError):
+        Unpickler().unpickle_path(serialized, index, "$ROOT->1")
+
+
+def test_unpickle_path_through_references():
+    shared = DataClass([1, DataClass(2)])
+    value = [shared, {"a": shared}]
+    serialized, index = Pickler().pickle_with_index(value)
+    loaded_index = json.loads(json.dumps(index))
+
+    # "$ROOT->1->0" was written as a reference to "$ROOT->0"
+    assert Unpickler().unpickle_path(serialized, loaded_index, "$ROOT->1->0") == shared
+    assert Unpickler().unpickle_path(serialized, loaded_index, "$ROOT->1->0->state->0->1") == DataClass(2)
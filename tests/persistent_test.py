@@ -0,0 +1,50 @@
+import pytest
+
+from kelpickle.errors import UnpicklingError
+from kelpickle.kelpickling import Pickler, Unpickler
+
+
+class Blob(bytes):
+    pass
+
+
+def _blob_key(instance: object) -> str | None:
+    return f"blob:{hash(instance)}" if isinstance(instance, Blob) else None
+
+
+def test_persistent_instances_are_externalized():
+    store = {}
+    blob = Blob(b"x" * 1024)
+    document = {"first": blob, "second": [blob, 1]}
+
+    serialized = Pickler(persistent_id=_blob_key).pickle(document)
+    store[_blob_key(blob)] = blob
+    restored = Unpickler(persistent_load=store.__getitem__).unpickle(serialized)
+
+    assert len(serialized) < 1024
+    assert restored == document
+    assert restored["first"] is blob
+
+
+def test_persistent_keys_are_resolved_in_a_single_batch():
+    blobs = [Blob(bytes([i]) * 100) for i in range(10)]
+    store = {_blob_key(blob): blob for blob in blobs}
+    batches = []
+
+    def load_many(keys):
+        batches.append(keys)
+        return {key: store[key] for key in keys}
+
+    serialized = Pickler(persistent_id=_blob_key).pickle({"blobs": blobs, "again": blobs[0]})
+    restored = Unpickler(persistent_load_many=load_many).unpickle(serialized)
+
+    assert restored == {"blobs": blobs, "again": blobs[0]}
+    assert len(batches) == 1
+    assert sorted(batches[0]) == sorted(store)
+
+
+def test_persistent_load_is_required():
+    serialized = Pickler(persistent_id=_blob_key).pickle(Blob(b"x"))
+
+    with pytest.raises(UnpicklingError):
+        Unpickler().unpickle(serialized)
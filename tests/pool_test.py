@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import kelpickle
+from kelpickle.kelpickling import PicklingPool
+from tests.objects_db import DataClass
+
+
+class PicklesDuringReduce:
+    def __init__(self, x):
+        self.x = x
+
+    def __reduce__(self):
+        return PicklesDuringReduce, (kelpickle.dumps(self.x),)
+
+
+def test_module_level_helpers():
+    value = {"a": [DataClass(1), (2, 3)]}
+
+    assert kelpickle.loads(kelpickle.dumps(value)) == value
+
+
+def test_concurrent_usage():
+    def round_trip(i):
+        value = [DataClass(i), [i] * i, {"shared": DataClass(i)}]
+        value.append(value[0])
+        restored = kelpickle.loads(kelpickle.dumps(value))
+        return restored == value and restored[3] is restored[0]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(round_trip, range(200)))
+
+
+def test_nested_usage_within_the_same_thread():
+    shared = DataClass(1)
+    value = [shared, PicklesDuringReduce([shared, shared]), shared]
+
+    restored = kelpickle.loads(kelpickle.dumps(value))
+
+    assert restored[0] is restored[2]
+    assert kelpickle.loads(restored[1].x) == [DataClass(1), DataClass(1)]
+
+
+def test_pooled_instances_are_reused():
+    pool = PicklingPool()
+
+    with pool.pickler() as first_pickler:
+        pass
+    with pool.pickler() as second_pickler:
+        pass
+
+    assert first_pickler is second_pickler
+
+
+def test_reuse_after_error():
+    pool = PicklingPool()
+    with pytest.raises(KeyError):
+        with pool.unpickler() as unpickler:
+            unpickler.restore([[1], {"kelp/strategy": "unknown strategy"}], relative_key="$ROOT")
+
+    with pytest.raises(TypeError):
+        pool.dumps([[1], (i for i in range(1))])
+
+    assert pool.loads(pool.dumps([[2]])) == [[2]]
+    with pool.unpickler() as unpickler:
+        assert unpickler.restore([[3]], relative_key="$ROOT") == [[3]]
@@ -0,0 +1,116 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from kelpickle.errors import UnpicklingError
+from kelpickle.record_log import RecordLog, compact
+from tests.objects_db import DataClass
+
+
+@pytest.fixture
+def log_path(tmp_path) -> str:
+    return str(tmp_path / "records.kelplog")
+
+
+def test_records_are_restored_by_id(log_path: str):
+    with RecordLog(log_path) as log:
+        record_ids = [log.append(DataClass([i, str(i)])) for i in range(100)]
+
+        assert record_ids == list(range(100))
+        assert log[42] == DataClass([42, "42"])
+        assert log[0] == DataClass([0, "0"])
+        assert log.get(100) is None
+
+    with RecordLog(log_path) as log:
+        assert log[99] == DataClass([99, "99"])
+        assert log.append("next") == 100
+
+
+def test_deleted_records(log_path: str):
+    with RecordLog(log_path) as log:
+        for i in range(5):
+            log.append(i)
+        log.delete(2)
+
+        assert 2 not in log
+        assert list(log) == [0, 1, 3, 4]
+        with pytest.raises(KeyError):
+            log.delete(2)
+
+
+def test_compaction_reclaims_deleted_records(log_path: str):
+    with RecordLog(log_path) as log:
+        for i in range(10):
+            log.append("x" * 1000)
+        for i in range(0, 10, 2):
+            log.delete(i)
+    size_before = os.path.getsize(log_path)
+
+    compact(log_path)
+
+    assert os.path.getsize(log_path) < size_before * 0.6
+    with RecordLog(log_path) as log:
+        assert list(log) == [1, 3, 5, 7, 9]
+        assert log[5] == "x" * 1000
+        assert log.append(1) == 10
+
+
+def test_compaction_rebuilds_the_index(log_path: str):
+    with RecordLog(log_path) as log:
+        log.append([1])
+        log.append([2])
+    os.remove(f"{log_path}.idx")
+
+    compact(log_path)
+
+    with RecordLog(log_path) as log:
+        assert log[1] == [2]
+
+
+def test_missing_index_is_rebuilt(log_path: str):
+    with RecordLog(log_path) as log:
+        log.append([1])
+        log.append([2])
+        log.append([3])
+        log.delete(1)
+    os.remove(f"{log_path}.idx")
+
+    with RecordLog(log_path) as log:
+        assert list(log) == [0, 2]
+        assert log[2] == [3]
+        assert log.append([4]) == 3
+
+
+def test_empty_log_file_is_initialized(log_path: str):
+    open(log_path, "wb").close()
+
+    with RecordLog(log_path) as log:
+        assert log.append([1]) == 0
+
+    with RecordLog(log_path) as log:
+        assert log[0] == [1]
+
+
+def test_invalid_log(log_path: str):
+    with open(log_path, "wb") as fp:
+        fp.write(b"not a log")
+
+    with pytest.raises(UnpicklingError):
+        RecordLog(log_path)
+
+
+def test_concurrent_appends_and_reads(log_path: str):
+    # Switch threads as often as possible, so calls would interleave if they were not guarded.
+    original_switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with RecordLog(log_path) as log, ThreadPoolExecutor(max_workers=8) as executor:
+            values = {i: [DataClass([i, str(j)]) for j in range(50)] for i in range(64)}
+            record_ids = dict(zip(values, executor.map(log.append, values.values())))
+            restored = dict(zip(values, executor.map(log.__getitem__, record_ids.values())))
+    finally:
+        sys.setswitchinterval(original_switch_interval)
+
+    assert restored == values
@@ -0,0 +1,49 @@
+import io
+import json
+
+import kelpickle
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import DataClass
+
+
+def _records():
+    for i in range(5):
+        yield {"index": i, "value": DataClass([i, "line\nbreak"])}
+
+
+def test_records_round_trip():
+    stream = io.BytesIO()
+
+    records_count = Pickler().dump_iter(_records(), stream)
+    lines = stream.getvalue().splitlines()
+
+    assert records_count == len(lines) == 5
+    assert [json.loads(line) for line in lines] == [json.loads(Pickler().pickle(record)) for record in _records()]
+
+    stream.seek(0)
+    assert list(Unpickler().iter_load(stream)) == list(_records())
+
+
+def test_records_are_restored_lazily():
+    stream = io.BytesIO()
+    kelpickle.dump_iter(_records(), stream)
+    stream.seek(0)
+
+    restored_records = kelpickle.iter_load(stream)
+
+    assert next(restored_records) == {"index": 0, "value": DataClass([0, "line\nbreak"])}
+    assert stream.tell() < len(stream.getvalue())
+
+
+def test_shared_references_across_records():
+    shared = DataClass([1, 2, 3])
+    stream = io.BytesIO()
+
+    Pickler().dump_iter([shared, [shared], {"a": shared}], stream, share_references=True)
+    stream.seek(0)
+    first, second, third = Unpickler().iter_load(stream, share_references=True)
+
+    assert first == shared
+    assert second[0] is first
+    assert third["a"] is first
+    assert b"reference" in stream.getvalue().splitlines()[1]
@@ -0,0 +1,89 @@
+import gc
+from datetime import datetime, timezone
+
+from kelpickle.kelpickling import Pickler, Unpickler
+from kelpickle.reduction_cache import ReductionCache
+from tests.objects_db import FrozenDataClass
+
+
+def test_cached_reductions_are_reused_across_calls():
+    cache = ReductionCache()
+    pickler = Pickler(reduction_cache=cache)
+    values = [FrozenDataClass((1, 2)), datetime(2020, 1, 1, tzinfo=timezone.utc), (1, "a")]
+
+    first = pickler.pickle(values)
+    second = pickler.pickle(values)
+    statistics = cache.statistics()
+
+    assert first == second == Pickler().pickle(values)
+    assert Unpickler().unpickle(second) == values
+    assert statistics.hits > 0
+    assert statistics.hit_rate > 0
+
+
+def test_reductions_containing_references_are_not_cached():
+    cache = ReductionCache()
+    shared = (1, 2)
+    values = [shared, (shared, 3)]
+
+    Pickler(reduction_cache=cache).pickle(values)
+    restored = Unpickler().unpickle(Pickler(reduction_cache=cache).pickle(values))
+
+    assert restored == values
+    assert restored[1][0] is restored[0]
+
+
+def test_collected_instances_are_evicted():
+    cache = ReductionCache()
+    value = FrozenDataClass(1)
+
+    Pickler(reduction_cache=cache).pickle(value)
+    assert len(cache) == 1
+
+    del value
+    gc.collect()
+    assert cache.statistics().size == 0
+
+
+def test_least_recently_used_instances_are_evicted():
+    cache = ReductionCache(max_size=2)
+    values = [(i,) for i in range(10)]
+
+    Pickler(reduction_cache=cache).pickle(values)
+    statistics = cache.statistics()
+
+    assert statistics.size == 2
+    assert statistics.evictions == 8
+
+
+class _MutableMember:
+    def __init__(self, value):
+        self.value = value
+
+
+def test_containers_of_mutable_members_are_not_cached():
+    cache = ReductionCache()
+    pickler = Pickler(reduction_cache=cache)
+    member = _MutableMember(1)
+    value = (member,)
+
+    pickler.pickle(value)
+    member.value = 2
+    restored = Unpickler().unpickle(pickler.pickle(value))
+
+    assert restored[0].value == 2
+    assert len(cache) == 0
+
+
+def test_cached_members_are_referenced():
+    cache = ReductionCache()
+    pickler = Pickler(reduction_cache=cache)
+    member = FrozenDataClass((1, 2))
+    container = (member, 3)
+
+    pickler.pickle([container])
+    restored = Unpickler().unpickle(pickler.pickle([container, member]))
+
+    assert cache.statistics().hits > 0
+    assert restored == [container, member]
+    assert restored[1] is restored[0][0]
@@ -0,0 +1,36 @@
+import json
+
+from kelpickle.kelpickling import Pickler, Unpickler, REFERENCED_KEY
+from tests.objects_db import DataClass
+
+
+def test_only_referenced_instances_are_listed():
+    shared = DataClass(1)
+    value = {"first": shared, "second": [shared, DataClass(2)]}
+
+    serialized = Pickler(mark_referenced=True).pickle(value)
+
+    assert json.loads(serialized)[REFERENCED_KEY] == ["$ROOT->0"]
+
+
+def test_marked_documents_are_restored():
+    shared = DataClass([1, 2])
+    value = [shared, {"shared": shared, "other": DataClass(3)}, [shared]]
+    value.append(value)
+
+    restored = Unpickler().unpickle(Pickler(mark_referenced=True).pickle(value))
+
+    assert restored[0] == shared
+    assert restored[1]["shared"] is restored[0]
+    assert restored[2][0] is restored[0]
+    assert restored[3] is restored
+
+
+def test_marked_documents_can_be_deduplicated():
+    message = "Connection to the upstream server was reset by peer, retrying in 5 seconds " * 3
+    value = [message, "".join(list(message))]
+
+    restored = Unpickler().unpickle(Pickler(mark_referenced=True, deduplicate_immutables=True).pickle(value))
+
+    assert restored == value
+    assert restored[0] is restored[1]
@@ -0,0 +1,81 @@
+import pytest
+
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import DataClass, TestParameters, SlottedClass, SlottedClassWithDynamicDict, \
+    CustomStateDataClass
+
+
+def _restore_into(target, value):
+    return Unpickler().restore_into(target, Pickler().pickle(value))
+
+
+def test_graph_is_updated_in_place():
+    settings = {"limits": [1, 2, 3], "nested": DataClass({"a": 1, "b": [4]}), "removed": 1}
+    limits, nested, nested_attributes = settings["limits"], settings["nested"], settings["nested"].x
+    new_settings = {"nested": DataClass({"b": [5, 6], "a": 2}), "limits": [1], "added": {7}}
+
+    restored = _restore_into(settings, new_settings)
+
+    assert restored is settings
+    assert settings == new_settings
+    assert list(settings) == list(new_settings)
+    assert list(settings["nested"].x) == ["b", "a"]
+    assert settings["limits"] is limits
+    assert settings["nested"] is nested
+    assert settings["nested"].x is nested_attributes
+
+
+@pytest.mark.parametrize(['test_value'], [
+    [TestParameters("slotted", (SlottedClass([1]), SlottedClass([2, 3])))],
+    [TestParameters("slotted with dynamic dict",
+                    (SlottedClassWithDynamicDict([1], 2), SlottedClassWithDynamicDict([3], 4)))],
+    [TestParameters("set", ({1, 2}, {2, 3}))],
+    ],
+    ids=lambda x: x.description
+)
+def test_instances_are_updated_in_place(test_value: TestParameters):
+    target, value = test_value.value
+
+    restored = _restore_into(target, value)
+
+    assert restored is target
+    assert restored == value
+
+
+@pytest.mark.parametrize(['test_value'], [
+    [TestParameters("different type", ([1], (1,)))],
+    [TestParameters("custom setstate", (CustomStateDataClass(1), CustomStateDataClass(2)))],
+    [TestParameters("native", (1, 2))],
+    ],
+    ids=lambda x: x.description
+)
+def test_incompatible_instances_are_replaced(test_value: TestParameters):
+    target, value = test_value.value
+
+    restored = _restore_into(target, value)
+
+    assert restored == value
+    assert restored is not target
+
+
+def test_shared_instances_are_reused_once():
+    shared = [1]
+    target = {"a": shared, "b": shared}
+
+    restored = _restore_into(target, {"a": [2], "b": [3]})
+
+    assert restored == {"a": [2], "b": [3]}
+    assert restored["a"] is shared
+
+
+def test_references_within_the_updated_graph():
+    target = [DataClass(1), None]
+    value = [DataClass(2)]
+    value.append(value[0])
+    value.append(value)
+
+    restored = _restore_into(target, value)
+
+    assert restored is target
+    assert restored[1] is restored[0]
+    assert restored[2] is restored
@@ -0,0 +1,84 @@
+import gc
+import weakref
+
+import pytest
+
+from kelpickle.errors import SessionOutOfSync
+from kelpickle.reduction_cache import ReductionCache
+from kelpickle.session import Session, SessionPickler, SessionUnpickler
+from tests.objects_db import DataClass, FrozenDataClass
+
+
+def test_previously_sent_instances_are_sent_as_references():
+    sender, receiver = SessionPickler(), SessionUnpickler()
+    lookup_table = {f"key{i}": DataClass(i) for i in range(100)}
+
+    first = sender.pickle({"table": lookup_table, "value": 1})
+    second = sender.pickle({"table": lookup_table, "value": 2})
+
+    first_restored = receiver.unpickle(first)
+    second_restored = receiver.unpickle(second)
+
+    assert len(second) < len(first) / 10
+    assert second_restored == {"table": lookup_table, "value": 2}
+    assert second_restored["table"] is first_restored["table"]
+
+
+def test_old_messages_are_evicted():
+    sender, receiver = SessionPickler(max_retained_messages=2), SessionUnpickler(max_retained_messages=2)
+    shared = [DataClass(1)]
+
+    messages = [sender.pickle(shared)] + [sender.pickle(i) for i in range(2)] + [sender.pickle(shared)]
+    restored = [receiver.unpickle(message) for message in messages]
+
+    assert restored[-1] == shared
+    assert restored[-1] is not restored[0]
+    assert "reference" not in messages[-1]
+
+
+def test_missing_messages_require_a_resync():
+    session = Session()
+    shared = [1, 2, 3]
+
+    session.receive(session.send(shared))
+    session.send(shared)
+    with pytest.raises(SessionOutOfSync):
+        session.receive(session.send(shared))
+
+    with pytest.raises(SessionOutOfSync):
+        session.receive(session.send(shared))
+
+    session.resync()
+    assert session.receive(session.send(shared)) == shared
+    assert session.receive(session.send(shared)) == shared
+
+
+def test_receiver_rejects_larger_windows():
+    with pytest.raises(SessionOutOfSync):
+        SessionUnpickler(max_retained_messages=1).unpickle(SessionPickler(max_retained_messages=2).pickle(1))
+
+
+def test_reduction_cache_does_not_retain_evicted_instances():
+    cache_size = 4
+    sender = SessionPickler(max_retained_messages=2, reduction_cache=ReductionCache(max_size=cache_size))
+    receiver = SessionUnpickler(max_retained_messages=2)
+    sent_members = []
+    for i in range(1000):
+        member = FrozenDataClass(i)
+        sent_members.append(weakref.ref(member))
+        assert receiver.unpickle(sender.pickle([(member, i)])) == [(member, i)]
+        del member
+
+    gc.collect()
+    assert len(sender._Pickler__recorded_references) == 0  # type: ignore[attr-defined]
+    # Only the members of the retained messages and of the cached tuples are still alive
+    assert sum(member() is not None for member in sent_members) <= 2 + cache_size
+
+
+def test_messages_may_be_given_as_bytes():
+    sender = SessionPickler()
+    receiver = SessionUnpickler()
+
+    message = sender.pickle([1, 2]).encode("utf-8")
+
+    assert receiver.unpickle(memoryview(message)) == [1, 2]
@@ -0,0 +1,68 @@
+import sqlite3
+
+import pytest
+
+from kelpickle.shelf import Shelf
+from tests.objects_db import DataClass
+
+
+@pytest.fixture
+def shelf_path(tmp_path) -> str:
+    return str(tmp_path / "shelf.db")
+
+
+def test_values_are_persisted(shelf_path: str):
+    with Shelf(shelf_path) as shelf:
+        shelf["a"] = DataClass([1, 2])
+        shelf["b"] = {"c": (3, 4)}
+        del shelf["b"]
+
+    with Shelf(shelf_path) as shelf:
+        assert dict(shelf) == {"a": DataClass([1, 2])}
+        assert "b" not in shelf
+        with pytest.raises(KeyError):
+            shelf["b"]
+
+
+def test_writes_are_batched(shelf_path: str):
+    shelf = Shelf(shelf_path, batch_size=10)
+    for i in range(5):
+        shelf[str(i)] = i
+
+    (stored_count,) = sqlite3.connect(shelf_path).execute("SELECT COUNT(*) FROM kelpickle_shelf").fetchone()
+    assert stored_count == 0
+    assert shelf["3"] == 3
+
+    shelf.close()
+    (stored_count,) = sqlite3.connect(shelf_path).execute("SELECT COUNT(*) FROM kelpickle_shelf").fetchone()
+    assert stored_count == 5
+
+
+def test_restored_instances_are_cached(shelf_path: str):
+    with Shelf(shelf_path) as shelf:
+        shelf.set_many({"a": DataClass(1)})
+
+    with Shelf(shelf_path, cache_size=1) as shelf:
+        assert shelf["a"] is shelf["a"]
+
+
+def test_written_instances_are_not_shared(shelf_path: str):
+    with Shelf(shelf_path) as shelf:
+        value = DataClass([1])
+        shelf["a"] = value
+        shelf.set_many({"b": value})
+        value.x.append(2)
+
+        assert shelf["a"] == shelf["b"] == DataClass([1])
+
+
+def test_bulk_operations(shelf_path: str):
+    values = {str(i): DataClass([i]) for i in range(2000)}
+
+    with Shelf(shelf_path, cache_size=10) as shelf:
+        shelf.set_many(values)
+
+    with Shelf(shelf_path, cache_size=10) as shelf:
+        assert len(shelf) == 2000
+        assert shelf.get_many(["5", "missing", "1999"]) == {"5": DataClass([5]), "1999": DataClass([1999])}
+        assert shelf.get_many(values) == values
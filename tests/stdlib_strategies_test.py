@@ -0,0 +1,108 @@
+import json
+from collections import Counter, OrderedDict, defaultdict, deque
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import PurePosixPath, PureWindowsPath, Path
+from uuid import UUID, SafeUUID
+
+import pytest
+
+from kelpickle.common import STRATEGY_KEY
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import TestParameters, Color, Permission, Point, TypedPoint, NamedTupleWithDict, DataClass
+
+STDLIB_VALUES = [
+    [TestParameters("enum", Color.RED)],
+    [TestParameters("enum with string value", Color.GREEN)],
+    [TestParameters("combined flag", Permission.READ | Permission.WRITE)],
+    [TestParameters("deque", deque([1, "a", DataClass(2)]))],
+    [TestParameters("bounded deque", deque([1, 2, 3], maxlen=2))],
+    [TestParameters("ordered dict", OrderedDict([("b", 1), (2, [3]), ((4, 5), None)]))],
+    [TestParameters("defaultdict", defaultdict(list, {"a": [1], 2: []}))],
+    [TestParameters("defaultdict without factory", defaultdict(None, {"a": 1}))],
+    [TestParameters("counter", Counter("abracadabra"))],
+    [TestParameters("frozenset", frozenset({1, "a", (2, 3)}))],
+    [TestParameters("decimal", Decimal("-1.2300E+5"))],
+    [TestParameters("special decimal", Decimal("-0"))],
+    [TestParameters("uuid", UUID("12345678-1234-5678-1234-567812345678"))],
+    [TestParameters("complex", 1.5 - 2j)],
+    [TestParameters("fraction", Fraction(-3, 9))],
+    [TestParameters("path", Path("a/b.txt"))],
+    [TestParameters("pure path", PureWindowsPath("C:\\a\\b"))],
+    [TestParameters("namedtuple", Point(1, [2]))],
+    [TestParameters("typed namedtuple", TypedPoint("a"))],
+]
+
+
+@pytest.mark.parametrize(['test_value'], STDLIB_VALUES, ids=lambda x: x.description)
+def test_dedicated_strategies(test_value: TestParameters):
+    serialized = Pickler().pickle(test_value.value)
+    restored = Unpickler().unpickle(serialized)
+
+    assert restored == test_value.value
+    assert type(restored) is type(test_value.value)
+    # The generic path is not taken
+    assert json.loads(serialized)[STRATEGY_KEY] != "default"
+
+
+@pytest.mark.parametrize(['test_value'], STDLIB_VALUES, ids=lambda x: x.description)
+def test_restore_while_parsing(test_value: TestParameters):
+    restored = Unpickler(restore_while_parsing=True).unpickle(Pickler().pickle([test_value.value] * 5))
+
+    assert restored == [test_value.value] * 5
+
+
+def test_compact_representation():
+    assert json.loads(Pickler().pickle(Decimal("1.5"))) == {"value": "1.5", STRATEGY_KEY: "decimal"}
+    assert json.loads(Pickler().pickle(Fraction(1, 3))) == {"numerator": 1, "denominator": 3, STRATEGY_KEY: "fraction"}
+    assert json.loads(Pickler().pickle(PurePosixPath("/a"))) == {
+        "type": "pathlib/PurePosixPath",
+        "value": "/a",
+        STRATEGY_KEY: "path",
+    }
+
+
+def test_uuid_safety_is_kept():
+    instance = UUID("12345678-1234-5678-1234-567812345678", is_safe=SafeUUID.safe)
+
+    assert Unpickler().unpickle(Pickler().pickle(instance)).is_safe is SafeUUID.safe
+
+
+def test_enum_members_keep_their_identity():
+    restored = Unpickler().unpickle(Pickler().pickle([Color.RED, Permission.READ | Permission.WRITE]))
+
+    assert restored[0] is Color.RED
+    assert restored[1] is Permission.READ | Permission.WRITE
+
+
+def test_references_within_containers():
+    shared = [1]
+    value = deque([shared])
+    value.append(value)
+    mapping = OrderedDict(a=shared)
+    mapping["self"] = mapping
+
+    restored_value, restored_mapping = Unpickler().unpickle(Pickler().pickle([value, mapping]))
+
+    assert restored_value[1] is restored_value
+    assert restored_mapping["self"] is restored_mapping
+    assert restored_mapping["a"] is restored_value[0]
+
+
+def test_namedtuple_subclasses_with_state_use_the_default_strategy():
+    value = NamedTupleWithDict(1, 2)
+    value.extra = 3
+
+    serialized = Pickler().pickle(value)
+    restored = Unpickler().unpickle(serialized)
+
+    assert json.loads(serialized)[STRATEGY_KEY] == "default"
+    assert restored == value
+    assert restored.extra == 3
+
+
+def test_canonical_counter():
+    first = Counter({"a": 1, "b": 2})
+    second = Counter({"b": 2, "a": 1})
+
+    assert Pickler(canonical=True).pickle(first) == Pickler(canonical=True).pickle(second)
@@ -0,0 +1,105 @@
+import pickle
+from array import array
+from collections import Counter, OrderedDict, defaultdict, deque
+from datetime import datetime, date, time, timedelta, timezone
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import PurePosixPath
+from uuid import UUID, SafeUUID
+
+import pytest
+
+from kelpickle.errors import TranscodingError
+from kelpickle.kelpickling import Pickler, Unpickler
+from kelpickle.transcoding import kelpickle_to_pickle, pickle_to_kelpickle
+from tests.objects_db import DataClass, TestParameters, TzInfo, FrozenDataClass, CustomStateDataClass, \
+    CustomReduceClass, SlottedClass, SlottedClassWithDynamicDict, Color, Point
+
+TRANSCODED_VALUES = [
+    [TestParameters("natives", [None, True, False, 0, 300, -5, 2 ** 70, 1.5, "", "a" * 300, "א"])],
+    [TestParameters("bytes", b'\x00\x01\x02')],
+    [TestParameters("nested containers", {"a": [1, (2, 3), {4, 5}], "b": {"c": []}})],
+    [TestParameters("frozenset", frozenset({1, 2}))],
+    [TestParameters("complex", 1 + 2j)],
+    [TestParameters("temporal", [date(2020, 1, 2), time(1, 2, 3, 4), timedelta(days=1, microseconds=5),
+                                 datetime(2020, 1, 1, 1, fold=1)])],
+    [TestParameters("tz aware datetime", datetime(2020, 1, 1, 10, tzinfo=timezone.utc))],
+    [TestParameters("custom tz aware datetime", datetime(2020, 1, 1, 10, tzinfo=TzInfo(timedelta(hours=1))))],
+    [TestParameters("instance", DataClass([1, 2]))],
+    [TestParameters("frozen instance", FrozenDataClass(3))],
+    [TestParameters("instance with get/set state", CustomStateDataClass(3))],
+    [TestParameters("instance with reduce", CustomReduceClass(3))],
+    [TestParameters("instance with slots", SlottedClass(3))],
+    [TestParameters("instance with slots and dynamic dict", SlottedClassWithDynamicDict(3, 4))],
+    [TestParameters("instance with dict items", OrderedDict(a=1, b=[2]))],
+    [TestParameters("type", DataClass)],
+    [TestParameters("stdlib types", [Color.GREEN, Point(1, 2), deque([1], maxlen=3), Decimal("1.5"), Fraction(1, 3),
+                                     UUID(int=5, is_safe=SafeUUID.safe), PurePosixPath("/a")])],
+    [TestParameters("buffers", [bytearray(b'\x00\x01'), array('d', [1.5, 2]), array('u', 'ab'), array('b')])],
+    [TestParameters("stdlib mappings", [Counter("aab"), defaultdict(list, {(1, 2): [3]}), OrderedDict([(1, 2)])])],
+]
+
+
+@pytest.mark.parametrize(['test_value'], TRANSCODED_VALUES, ids=lambda x: x.description)
+def test_kelpickle_to_pickle(test_value: TestParameters):
+    transcoded = kelpickle_to_pickle(Pickler().pickle(test_value.value))
+    restored = pickle.loads(transcoded)
+
+    assert restored == test_value.value
+    assert type(restored) is type(test_value.value)
+
+
+@pytest.mark.parametrize('protocol', [2, 3, 4, 5])
+@pytest.mark.parametrize(['test_value'], TRANSCODED_VALUES, ids=lambda x: x.description)
+def test_pickle_to_kelpickle(test_value: TestParameters, protocol: int):
+    transcoded = pickle_to_kelpickle(pickle.dumps(test_value.value, protocol=protocol))
+    restored = Unpickler().unpickle(transcoded)
+
+    assert restored == test_value.value
+    assert type(restored) is type(test_value.value)
+
+
+def test_packed_lists():
+    value = [list(range(100)), [i / 2 for i in range(100)]]
+
+    assert pickle.loads(kelpickle_to_pickle(Pickler(pack_numeric_lists=True).pickle(value))) == value
+
+
+def test_memoryviews_are_transcoded_as_bytes():
+    value = [memoryview(b"abc"), memoryview(array('i', [1, 2])), memoryview(bytearray(b"\x00")).cast('c')]
+
+    restored = pickle.loads(kelpickle_to_pickle(Pickler().pickle(value)))
+
+    assert restored == [b"abc", array('i', [1, 2]).tobytes(), b"\x00"]
+
+
+def test_references_are_kept():
+    shared = DataClass([1])
+    value = [shared, shared, (shared,)]
+    value.append(value)
+
+    from_kelpickle = pickle.loads(kelpickle_to_pickle(Pickler().pickle(value)))
+    from_pickle = Unpickler().unpickle(pickle_to_kelpickle(pickle.dumps(value, protocol=4)))
+
+    for restored in (from_kelpickle, from_pickle):
+        assert restored[0] == shared
+        assert restored[1] is restored[0]
+        assert restored[2][0] is restored[0]
+        assert restored[3] is restored
+
+
+def test_transcoding_reduces_like_the_pickler():
+    value = {"a": [1, "b", (2, 3)], "c": DataClass({4, 5})}
+
+    assert pickle_to_kelpickle(pickle.dumps(value, protocol=4)) == Pickler().pickle(value)
+
+
+def test_constructors_are_not_run():
+    transcoded = pickle_to_kelpickle(pickle.dumps(CustomReduceClass(3), protocol=4))
+
+    assert "CustomReduceClass" in transcoded
+
+
+def test_unsupported_opcodes():
+    with pytest.raises(TranscodingError):
+        pickle_to_kelpickle(pickle.dumps({1: 2}, protocol=4))
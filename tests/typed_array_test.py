@@ -0,0 +1,107 @@
+import base64
+import json
+from array import array
+
+import pytest
+
+from kelpickle.common import STRATEGY_KEY
+from kelpickle.kelpickling import Pickler, Unpickler
+from tests.objects_db import TestParameters
+
+
+@pytest.mark.parametrize(['test_value'], [
+    [TestParameters("int array", array("i", [1, -2, 3]))],
+    [TestParameters("float array", array("d", [1.5, -2.25]))],
+    [TestParameters("empty array", array("b"))],
+    [TestParameters("bytearray", bytearray(b"\x00\x01\xff"))],
+    ],
+    ids=lambda x: x.description
+)
+def test_buffer_types(test_value: TestParameters):
+    restored = Unpickler().unpickle(Pickler().pickle(test_value.value))
+
+    assert restored == test_value.value
+    assert type(restored) is type(test_value.value)
+
+
+def test_memoryview():
+    view = memoryview(bytearray(array("h", range(12)).tobytes())).cast("h", [3, 4])
+
+    restored = Unpickler().unpickle(Pickler().pickle(view))
+
+    assert restored.tolist() == view.tolist()
+    assert restored.format == "h"
+    assert not restored.readonly
+
+
+def test_shared_bytearrays_are_referenced():
+    buffer = bytearray(b"abc")
+
+    restored = Unpickler().unpickle(Pickler().pickle([buffer, buffer]))
+
+    assert restored[0] is restored[1]
+
+
+@pytest.mark.parametrize(['test_value'], [
+    [TestParameters("ints", list(range(-50, 50)))],
+    [TestParameters("floats", [i / 3 for i in range(100)])],
+    ],
+    ids=lambda x: x.description
+)
+def test_numeric_lists_are_packed(test_value: TestParameters):
+    serialized = Pickler(pack_numeric_lists=True).pickle(test_value.value)
+
+    assert len(json.loads(serialized)) == 3
+    assert Unpickler().unpickle(serialized) == test_value.value
+    assert Unpickler(restore_while_parsing=True).unpickle(serialized) == test_value.value
+
+
+@pytest.mark.parametrize(['test_value'], [
+    [TestParameters("mixed", [1, 1.5] * 20)],
+    [TestParameters("bools", [True] * 20)],
+    [TestParameters("large ints", [2 ** 70] * 20)],
+    [TestParameters("short", [1, 2, 3])],
+    ],
+    ids=lambda x: x.description
+)
+def test_other_lists_are_not_packed(test_value: TestParameters):
+    serialized = Pickler(pack_numeric_lists=True).pickle(test_value.value)
+
+    assert serialized == Pickler().pickle(test_value.value)
+
+
+def test_packed_list_references():
+    shared = [1.0] * 20
+
+    restored = Unpickler().unpickle(Pickler(pack_numeric_lists=True).pickle([shared, shared]))
+
+    assert restored[0] is restored[1]
+    assert restored[0] == shared
+
+
+@pytest.mark.parametrize(['test_value'], [
+    [TestParameters("long array", array("l", [-2 ** 31, 2 ** 31 - 1]))],
+    [TestParameters("unsigned long array", array("L", [0, 2 ** 32 - 1]))],
+    [TestParameters("unicode array", array("u", "kélp\U0001f952"))],
+    ],
+    ids=lambda x: x.description
+)
+def test_platform_width_arrays_are_packed_by_fixed_width(test_value: TestParameters):
+    serialized = Pickler().pickle(test_value.value)
+
+    # Every item takes 4 (unicode) or 8 bytes, regardless of the width of its C type on this platform.
+    item_width = 4 if test_value.value.typecode == "u" else 8
+    assert len(base64.b64decode(json.loads(serialized)["buffer"])) == item_width * len(test_value.value)
+    restored = Unpickler().unpickle(serialized)
+    assert restored == test_value.value
+    assert restored.typecode == test_value.value.typecode
+
+
+def test_packed_lists_are_restored_by_the_list_strategy():
+    value = list(range(20))
+    serialized = Pickler(pack_numeric_lists=True).pickle(value)
+    target = [0, 1]
+
+    assert json.loads(serialized)[STRATEGY_KEY] == "list"
+    assert Unpickler().restore_into(target, serialized) is target
+    assert target == value